@@ -0,0 +1 @@
+"""Shared helpers for the Mobilise Theory of Change dashboard."""
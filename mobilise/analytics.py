@@ -0,0 +1,123 @@
+"""Period-over-period and rolling analytics for every pillar metric.
+
+All series are computed together: the monthly values are pivoted into one
+month x (pillar, metric) matrix on a complete monthly calendar, so the
+shifts, rolling windows and running totals are single vectorised operations.
+"""
+import numpy as np
+import pandas as pd
+
+ROLLING_WINDOWS = (3, 6, 12)
+SERIES_KEYS = ["Pillar", "Agg_Metric"]
+HISTORY_MONTHS = max(12, *ROLLING_WINDOWS)  # Longest look-back: YoY and the widest window
+
+
+def monthly_values(df):
+    """One value per pillar, metric and month (the first row, as the KPI cards use)."""
+    return df.groupby(SERIES_KEYS + ["Month"], observed=True, sort=True)["Agg_Value"].first()
+
+
+def _pct_change(current, previous):
+    change = (current - previous) / previous.abs() * 100
+    return change.replace([np.inf, -np.inf], np.nan)
+
+
+def _rolling_mean(values, window):
+    """Trailing mean over `window` rows of a 2-D array, skipping NaNs (min_periods=1).
+
+    Windowed sums come from one cumulative sum per array, instead of pandas
+    rolling one column at a time.
+    """
+    present = ~np.isnan(values)
+    sums = np.cumsum(np.where(present, values, 0.0), axis=0)
+    counts = np.cumsum(present, axis=0)
+    sums[window:] = sums[window:] - sums[:-window]
+    counts[window:] = counts[window:] - counts[:-window]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def period_over_period(df):
+    """Long frame indexed by (Pillar, Agg_Metric, Month) with change and rolling columns.
+
+    Columns: Agg_Value, MoM, MoM_pct, YoY, YoY_pct, Rolling_3/6/12 and
+    Cumulative. MoM/YoY are NaN when the comparison month has no value.
+    """
+    values = monthly_values(df)
+    columns = ["Agg_Value", "MoM", "MoM_pct", "YoY", "YoY_pct"]
+    columns += [f"Rolling_{w}" for w in ROLLING_WINDOWS] + ["Cumulative"]
+    if values.empty:
+        index = pd.MultiIndex.from_arrays([[], [], pd.DatetimeIndex([])], names=SERIES_KEYS + ["Month"])
+        return pd.DataFrame(columns=columns, index=index, dtype="float64")
+
+    wide = values.unstack(SERIES_KEYS)
+    calendar = pd.date_range(wide.index.min(), wide.index.max(), freq="MS", name="Month")
+    wide = wide.reindex(calendar).astype("float64")
+
+    prev_month, prev_year = wide.shift(1), wide.shift(12)
+    frames = {
+        "Agg_Value": wide,
+        "MoM": wide - prev_month,
+        "MoM_pct": _pct_change(wide, prev_month),
+        "YoY": wide - prev_year,
+        "YoY_pct": _pct_change(wide, prev_year),
+    }
+    for window in ROLLING_WINDOWS:
+        frames[f"Rolling_{window}"] = _rolling_mean(wide.to_numpy(), window)
+    frames["Cumulative"] = wide.cumsum()
+
+    # Back to long form: series-major, month-minor, straight from the arrays
+    n_months, n_series = wide.shape
+    index = pd.MultiIndex.from_arrays(
+        [np.repeat(wide.columns.get_level_values(key), n_months) for key in SERIES_KEYS]
+        + [np.tile(calendar, n_series)],
+        names=SERIES_KEYS + ["Month"],
+    )
+    long = pd.DataFrame({name: np.asarray(frame).T.ravel() for name, frame in frames.items()}, index=index)
+    return long[long["Agg_Value"].notna()].sort_index()[columns]
+
+
+def update_period_over_period(previous, df, changed):
+    """`period_over_period(df)` recomputed only where `changed` rows land.
+
+    `changed` holds the Pillar, Agg_Metric and Month of every row added to,
+    removed from or reordered within the frame `previous` was computed on. Each touched series is
+    recomputed from its earliest changed month, reading `HISTORY_MONTHS` of
+    unchanged history before it; untouched series and earlier months are kept.
+    """
+    if previous is None:
+        return period_over_period(df)
+    if changed.empty:
+        return previous
+    starts = changed.groupby(SERIES_KEYS, observed=True, sort=False)["Month"].min()
+    window_start = starts.min() - pd.DateOffset(months=HISTORY_MONTHS)
+    touched = df.set_index(SERIES_KEYS).index.isin(starts.index)
+    in_window = touched & (df["Month"] >= window_start)
+    if in_window.sum() * 2 > len(df):
+        # Most of the frame is affected (e.g. a month appended to every series)
+        return period_over_period(df)
+    fresh = period_over_period(df[in_window])
+
+    # Running totals restart at the window, so carry over what came before it
+    prev_months = previous.index.get_level_values("Month")
+    prev_series = previous.index.droplevel("Month")
+    before = previous[(prev_months < window_start) & prev_series.isin(starts.index)]
+    carried = before.groupby(level=SERIES_KEYS, sort=False)["Cumulative"].last()
+    fresh_series = fresh.index.droplevel("Month")
+    fresh["Cumulative"] += carried.reindex(fresh_series).fillna(0).to_numpy()
+    fresh = fresh[fresh.index.get_level_values("Month") >= starts.reindex(fresh_series).to_numpy()]
+
+    prev_start = starts.reindex(prev_series).to_numpy()
+    keep = pd.isna(prev_start) | (prev_months < prev_start)
+    return pd.concat([previous[keep], fresh]).sort_index()
+
+
+def change_text(row):
+    """Delta text such as "+4.2% MoM, +10.0% YoY" from a row with MoM/YoY columns, or None."""
+    parts = []
+    for label in ("MoM", "YoY"):
+        if pd.notna(row[f"{label}_pct"]):
+            parts.append(f"{row[f'{label}_pct']:+.1f}% {label}")
+        elif pd.notna(row[label]):
+            parts.append(f"{row[label]:+,.1f} {label}")
+    return ", ".join(parts) or None
@@ -0,0 +1,350 @@
+"""Read-only JSON API over the dashboard's cached dataset.
+
+Other tools read pillar KPIs, metric time series and filtered rows from here
+instead of scraping the sheet, so one ingest serves every consumer. The API
+runs inside the Streamlit app (set ``MOBILISE_API_PORT``), where each script
+run publishes the dataset it loaded, or standalone through the app's own
+loading chain:
+
+    MOBILISE_API_PORT=8600 streamlit run streamlit_app.py
+    python -m mobilise.api --port 8600
+
+Endpoints (dates as YYYY-MM-DD, lists comma-separated; every endpoint takes
+``tenant=<id>`` and otherwise serves the default tenant):
+
+    GET /metrics  (every tenant's runtime metrics in Prometheus text format, see mobilise.metrics)
+    GET /api/tenants
+    GET /api/version
+    GET /api/pillars
+    GET /api/pillars/<n>/kpis?as_of=&categories=
+    GET /api/pillars/<n>/series?metric=&start=&end=
+    GET /api/pillars/<n>/rows?start=&end=&categories=&period=&columns=&offset=&limit=
+
+Responses are keyed on the tenant and its dataset fingerprint: each carries
+an ETag, a matching If-None-Match gets 304, and bodies are gzipped for
+clients that accept it. Encoded bodies are kept per dataset version, so a
+repeated request does no pandas work. /api/tenants reports each tenant's
+load and cache counters and, like /metrics, is never cached.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import streamlit as st
+
+API_HOST = os.environ.get("MOBILISE_API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("MOBILISE_API_PORT", 0))  # 0 leaves the API off inside the app
+RESPONSE_CACHE_ENTRIES = 256  # Encoded bodies kept per server, newest dataset version first
+GZIP_MIN_BYTES = 1024  # Smaller bodies are sent uncompressed
+MAX_ROWS = 10000  # Page size cap for /rows
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _timestamp(value, name):
+    try:
+        timestamp = pd.Timestamp(value)
+    except (ValueError, TypeError):
+        timestamp = pd.NaT
+    # Blank strings and "NaT" parse to NaT rather than raising
+    if pd.isna(timestamp):
+        raise ApiError(400, f"{name} must be a date such as 2024-06-01, got {value!r}")
+    return timestamp
+
+
+def _int(value, name, default):
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ApiError(400, f"{name} must be an integer, got {value!r}")
+
+
+def _list(value):
+    return None if value is None else [item for item in value.split(",") if item]
+
+
+def records(df):
+    """JSON-ready records: dates as YYYY-MM-DD, NaN as null."""
+    df = df.copy()
+    for col in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = df[col].dt.strftime("%Y-%m-%d")
+    return json.loads(df.to_json(orient="records"))
+
+
+# ----------- ENDPOINTS -----------
+def _pillar(data, pillar):
+    pillar = int(pillar)
+    if not (data.df["Pillar"] == pillar).any():
+        raise ApiError(404, f"No data for pillar {pillar}")
+    return pillar
+
+
+def version(data, query):
+    return {
+        "version": data.version,
+        "rows": len(data.df),
+        "first_month": f"{data.df['Month'].min():%Y-%m-%d}",
+        "last_month": f"{data.df['Month'].max():%Y-%m-%d}",
+    }
+
+
+def pillars(data, query):
+    names = data.df.drop_duplicates("Pillar").set_index("Pillar")["Pillar_Name"].sort_index()
+    result = []
+    for pillar, name in names.items():
+        first, last, categories = data.pillar_domain(pillar)
+        result.append({"pillar": int(pillar), "name": name, "first_month": f"{first:%Y-%m-%d}",
+                       "last_month": f"{last:%Y-%m-%d}", "categories": categories})
+    return {"version": data.version, "pillars": result}
+
+
+def kpis(data, query, pillar):
+    pillar = _pillar(data, pillar)
+    _, last, _ = data.pillar_domain(pillar)
+    as_of = _timestamp(query.get("as_of", last), "as_of")
+    table = data.kpis(pillar, [as_of], _list(query.get("categories"))).table
+    metrics = table.reset_index().rename(columns={
+        "Agg_Metric": "metric", "Metric_Kind": "kind", "Agg_Value": "value", "Month": "month", "Delta": "delta"})
+    return {"version": data.version, "pillar": pillar, "as_of": f"{as_of:%Y-%m-%d}",
+            "metrics": records(metrics[["metric", "kind", "value", "month", "delta"]])}
+
+
+def series(data, query, pillar):
+    pillar = _pillar(data, pillar)
+    pop = data.period_over_period(pillar).reset_index()
+    if "metric" in query:
+        pop = pop[pop["Agg_Metric"].isin(_list(query["metric"]))]
+    if "start" in query:
+        pop = pop[pop["Month"] >= _timestamp(query["start"], "start")]
+    if "end" in query:
+        pop = pop[pop["Month"] <= _timestamp(query["end"], "end")]
+    pop = pop.rename(columns={"Agg_Metric": "metric", "Month": "month", "Agg_Value": "value"})
+    return {"version": data.version, "pillar": pillar, "points": records(pop)}
+
+
+def rows(data, query, pillar):
+    pillar = _pillar(data, pillar)
+    first, last, _ = data.pillar_domain(pillar)
+    selected_range = [_timestamp(query.get("start", first), "start"), _timestamp(query.get("end", last), "end")]
+    filtered = data.filter_pillar(pillar, selected_range, _list(query.get("categories")), query.get("period"))
+
+    columns = _list(query.get("columns")) or list(filtered.columns)
+    unknown = [col for col in columns if col not in filtered.columns]
+    if unknown:
+        raise ApiError(400, f"Unknown columns: {', '.join(unknown)}")
+    offset = max(_int(query.get("offset"), "offset", 0), 0)
+    limit = min(max(_int(query.get("limit"), "limit", 1000), 0), MAX_ROWS)
+    page = filtered.iloc[offset:offset + limit][columns]
+    return {"version": data.version, "pillar": pillar, "total": len(filtered), "offset": offset,
+            "limit": limit, "rows": records(page)}
+
+
+ROUTES = [
+    (re.compile(r"^/api/version$"), version),
+    (re.compile(r"^/api/pillars$"), pillars),
+    (re.compile(r"^/api/pillars/(\d+)/kpis$"), kpis),
+    (re.compile(r"^/api/pillars/(\d+)/series$"), series),
+    (re.compile(r"^/api/pillars/(\d+)/rows$"), rows),
+]
+
+
+# ----------- SERVER -----------
+class DatasetHolder:
+    """The dataset the API currently serves for each tenant, swapped in whole by `publish`."""
+
+    def __init__(self):
+        self.datasets = {}  # tenant id -> Dataset
+        self.published_at = {}
+        self.server = None  # Set when the app starts the API alongside it
+        self.error = None  # Why the app's API could not start
+
+    def publish(self, data):
+        current = self.datasets.get(data.tenant.key)
+        if current is None or current.fingerprint != data.fingerprint:
+            self.datasets[data.tenant.key], self.published_at[data.tenant.key] = data, time.time()
+
+    def get(self, tenant_key):
+        return self.datasets.get(tenant_key)
+
+
+class ResponseCache:
+    """LRU of encoded bodies keyed by (tenant, dataset version, request)."""
+
+    def __init__(self, entries=RESPONSE_CACHE_ENTRIES):
+        self.entries = entries
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            if key in self._bodies:
+                self._bodies.move_to_end(key)
+                return self._bodies[key]
+        body = json.dumps(build(), separators=(",", ":")).encode()
+        entry = (body, gzip.compress(body, 6) if len(body) >= GZIP_MIN_BYTES else None)
+        with self._lock:
+            self._bodies[key] = entry
+            while len(self._bodies) > self.entries:
+                self._bodies.popitem(last=False)
+        return entry
+
+
+def make_handler(holder, cache):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body, headers=()):
+            self.send_response(status)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _error(self, status, message):
+            body = json.dumps({"error": message}, separators=(",", ":")).encode()
+            self._send(status, body, [("Content-Type", "application/json")])
+
+        def _json(self, payload):
+            body = json.dumps(payload, separators=(",", ":")).encode()
+            self._send(200, body, [("Content-Type", "application/json"), ("Cache-Control", "no-store")])
+
+        def do_GET(self):
+            from mobilise.data import get_tenants, metrics_text, resolve_tenant, tenant_stats
+
+            url = urllib.parse.urlsplit(self.path)
+            # Blank values are kept, so ``?start=`` is rejected rather than read as no start
+            query = dict(urllib.parse.parse_qsl(url.query, keep_blank_values=True))
+            if url.path == "/metrics":
+                return self._send(200, metrics_text().encode(), [
+                    ("Content-Type", "text/plain; version=0.0.4; charset=utf-8"), ("Cache-Control", "no-store")])
+            if url.path == "/api/tenants":
+                return self._json({"tenants": [{**tenant_stats(tenant), "loaded": tenant.key in holder.datasets}
+                                               for tenant in get_tenants().values()]})
+            tenant = resolve_tenant(query.pop("tenant", None))
+            if tenant is None:
+                return self._error(404, f"Unknown tenant; available: {', '.join(get_tenants())}")
+            for pattern, endpoint in ROUTES:
+                match = pattern.match(url.path)
+                if match:
+                    break
+            else:
+                return self._error(404, f"Unknown endpoint {url.path}")
+            data = holder.get(tenant.key)
+            if data is None:
+                return self._error(503, f"No dataset loaded yet for tenant {tenant.key}")
+
+            request_key = url.path + "?" + urllib.parse.urlencode(sorted(query.items()))
+            etag = hashlib.sha1(f"{tenant.key}|{data.fingerprint}|{request_key}".encode()).hexdigest()[:20]
+            try:
+                body, zipped = cache.get_or_build((tenant.key, data.fingerprint, request_key),
+                                                  lambda: endpoint(data, query, *match.groups()))
+            except ApiError as e:
+                return self._error(e.status, str(e))
+
+            use_gzip = zipped is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+            etag = f'"{etag}-gzip"' if use_gzip else f'"{etag}"'
+            headers = [("ETag", etag), ("Vary", "Accept-Encoding"), ("Cache-Control", "no-cache")]
+            if_none_match = self.headers.get("If-None-Match", "")
+            if etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+                return self._send(304, b"", headers)
+            headers.append(("Content-Type", "application/json"))
+            if use_gzip:
+                headers.append(("Content-Encoding", "gzip"))
+            self._send(200, zipped if use_gzip else body, headers)
+
+    return Handler
+
+
+def serve(holder, host=API_HOST, port=API_PORT):
+    """Start the API in a background thread; returns the server (call `.shutdown()`)."""
+    server = ThreadingHTTPServer((host, port), make_handler(holder, ResponseCache()))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# One API per app process, fed by every script run. A port that can't be bound (e.g. taken by another
+# app process) leaves the holder without a server, cached like a running one so it isn't retried each run.
+@st.cache_resource(show_spinner=False)
+def get_api(host, port):
+    holder = DatasetHolder()
+    try:
+        holder.server = serve(holder, host, port)
+    except OSError as e:
+        holder.error = f"Could not start the API on {host}:{port}: {e}"
+    return holder
+
+
+# ----------- STANDALONE -----------
+def load_dataset(tenant):
+    """The dataset the app would show a tenant: its sheet, the sheet's last good copy, or its local CSV."""
+    from mobilise.data import Dataset, get_csv_url, load_data, load_data_from_sheets, load_last_good
+
+    if tenant.sheets_configured():
+        df, error = load_data_from_sheets(tenant.sheets_url)
+        if error is not None:
+            df, _ = load_last_good(tenant.sheets_url)
+        if df is not None:
+            return Dataset(df, get_csv_url(tenant.sheets_url), tenant)
+    df = load_data(tenant)
+    return None if df is None else Dataset(df, tenant=tenant)
+
+
+def publish_all(holder):
+    """Load every tenant's current dataset into `holder`."""
+    from mobilise.data import get_tenants
+
+    for tenant in get_tenants().values():
+        data = load_dataset(tenant)
+        if data is not None:
+            holder.publish(data)
+
+
+def main():
+    from mobilise.data import REFRESH_CHECK_EVERY, fetch_sheet, get_csv_url, get_tenants, probe_sheet_fingerprint
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT or 8600)
+    parser.add_argument("--refresh", type=float, default=REFRESH_CHECK_EVERY,
+                        help="seconds between checks of the sheet for new data")
+    args = parser.parse_args()
+
+    holder = DatasetHolder()
+    publish_all(holder)
+    server = serve(holder, args.host, args.port)
+    print(f"Serving the dashboard API at http://{args.host}:{server.server_port}/api/version")
+    try:
+        while True:
+            time.sleep(args.refresh)
+            for tenant in get_tenants().values():
+                if not tenant.sheets_configured():
+                    continue
+                latest, current = probe_sheet_fingerprint(tenant.sheets_url), holder.get(tenant.key)
+                if latest is not None and (current is None or latest != current.fingerprint):
+                    fetch_sheet.clear(get_csv_url(tenant.sheets_url))
+            publish_all(holder)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Participant outcomes by intake cohort.
+
+A ``_3mth`` or ``_6mth`` outcome reported in month M describes the
+participants who started the program 3 or 6 months before M. Shifting every
+outcome row back by its period and pivoting once gives a cohort table, one
+row per intake month, from which each cohort's move from 3 to 6 months is a
+column difference.
+"""
+import numpy as np
+import pandas as pd
+
+from mobilise.taxonomy import PERIOD_RE
+
+COHORT_PERIODS = ["3mth", "6mth"]
+
+
+def intake_months(months, periods):
+    """Month each row's cohort started: the report month minus the outcome period (in months)."""
+    ordinals = months.dt.year.to_numpy() * 12 + months.dt.month.to_numpy() - 1 - periods.to_numpy()
+    return pd.to_datetime({"year": ordinals // 12, "month": ordinals % 12 + 1, "day": 1})
+
+
+def cohort_table(df, pillar):
+    """Wide cohort table of a pillar's period outcomes, built in one reshape.
+
+    Returns ``(values, outcomes)``. `values` is indexed by intake month with
+    (Outcome, Period) columns, Period being "3mth", "6mth" or "change" (6 months
+    minus 3 months, for outcomes measured at both). `outcomes` is indexed by
+    Outcome with its display Name, Unit and Display_Format.
+    """
+    rows = df[(df["Pillar"] == pillar) & df["Period"].isin(COHORT_PERIODS)]
+    rows = rows.drop_duplicates(["Agg_Metric", "Month"])
+    if rows.empty:
+        return pd.DataFrame(), pd.DataFrame(columns=["Name", "Unit", "Display_Format"])
+
+    periods = rows["Period"].astype(str)
+    outcome = rows["Agg_Metric"].astype(str).str.replace(PERIOD_RE, "", regex=True)
+    intake = intake_months(rows["Month"].reset_index(drop=True),
+                           periods.str.removesuffix("mth").astype(int).reset_index(drop=True))
+    values = (
+        pd.DataFrame({"Intake": intake.to_numpy(), "Outcome": outcome.to_numpy(), "Period": periods.to_numpy(),
+                      "Agg_Value": rows["Agg_Value"].to_numpy()})
+        .drop_duplicates(["Intake", "Outcome", "Period"])
+        .set_index(["Intake", "Outcome", "Period"])["Agg_Value"]
+        .unstack(["Outcome", "Period"])
+        .sort_index()
+    )
+
+    if set(COHORT_PERIODS) <= set(values.columns.get_level_values("Period")):
+        three, six = values.xs("3mth", axis=1, level="Period"), values.xs("6mth", axis=1, level="Period")
+        both = three.columns.intersection(six.columns)
+        change = six[both] - three[both]
+        change.columns = pd.MultiIndex.from_product([both, ["change"]], names=["Outcome", "Period"])
+        values = pd.concat([values, change], axis=1)
+    values = values.sort_index(axis=1)
+
+    names = rows.assign(Outcome=outcome.to_numpy()).drop_duplicates("Outcome").set_index("Outcome")
+    outcomes = pd.DataFrame({
+        "Name": names["Metric_Name"].astype(str).str.replace(r"\s*\d+Mth$", "", regex=True),
+        "Unit": names["Unit"],
+        "Display_Format": names["Display_Format"],
+    })
+    return values, outcomes.loc[values.columns.get_level_values("Outcome").unique()]
+
+
+def cohort_matrix(values, outcomes, period, start=None, end=None):
+    """One period's (or the change's) cohorts x outcomes matrix, for cohorts that started in [start, end]."""
+    if values.empty or period not in values.columns.get_level_values("Period"):
+        return pd.DataFrame()
+    matrix = values.xs(period, axis=1, level="Period")
+    matrix = matrix[matrix.columns.intersection(outcomes.index, sort=False)]
+    if start is not None:
+        matrix = matrix[matrix.index >= pd.Timestamp(start)]
+    if end is not None:
+        matrix = matrix[matrix.index <= pd.Timestamp(end)]
+    return matrix.dropna(how="all").dropna(axis=1, how="all").astype(np.float64)
@@ -0,0 +1,148 @@
+"""Sections shared by every pillar page."""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from mobilise.forecast import PROJECTION_HORIZON, PROJECTION_METHODS
+
+TREND_OVERLAYS = {
+    "3-month average": "Rolling_3",
+    "6-month average": "Rolling_6",
+    "12-month average": "Rolling_12",
+    "Cumulative total": "Cumulative",
+}
+
+DETAIL_PAGE_SIZES = [25, 50, 100]  # Metric rows per page of the details grid
+DETAIL_MONTHS = 12  # Most recent months shown in the details grid by default
+
+
+# Fragments rerun on their own, so picking a metric only redraws that chart
+@st.fragment
+def time_series_section(df_filtered, trends=None, projections=None):
+    """Metric picker and line chart.
+
+    `trends` is the pillar's period-over-period frame and `projections` its
+    precomputed projections (see Dataset.projections), so switching metric or
+    method only selects rows.
+    """
+    # Time series analysis
+    st.subheader("📈 Metrics Over Time")
+
+    # Select metric for time series
+    available_metrics = df_filtered.drop_duplicates('Agg_Metric')
+    metric_mapping = dict(zip(available_metrics['Metric_Name'], available_metrics['Agg_Metric']))
+    clean_metric_names = list(metric_mapping.keys())
+
+    selected_clean_metric = st.selectbox("Select Metric for Time Series", clean_metric_names)
+    if selected_clean_metric is None:
+        st.info("No data for this metric.")
+        return
+    selected_metric = metric_mapping[selected_clean_metric]
+
+    metric_data = df_filtered[df_filtered['Agg_Metric'] == selected_metric]
+    if not metric_data.empty:
+        fig_ts = px.line(
+            metric_data, x='Date', y='Agg_Value',
+            title=f"{selected_clean_metric} Over Time",
+            markers=True
+        )
+        fig_ts.update_layout(
+            xaxis_title="Date",
+            yaxis_title="Value"
+        )
+        history = None
+        if trends is not None and selected_metric in trends.index.get_level_values("Agg_Metric"):
+            history = trends.loc[selected_metric]
+            history = history[(history.index >= metric_data['Date'].min()) & (history.index <= metric_data['Date'].max())]
+            overlays = st.multiselect("Trend overlays", list(TREND_OVERLAYS), default=["3-month average"])
+            for label in overlays:
+                fig_ts.add_trace(go.Scatter(
+                    x=history.index, y=history[TREND_OVERLAYS[label]],
+                    mode="lines", name=label, line={"dash": "dot"}
+                ))
+        if projections is not None and selected_metric in projections.index.get_level_values("Agg_Metric"):
+            add_projection(fig_ts, projections.loc[selected_metric], metric_data['Date'].max())
+        st.plotly_chart(fig_ts, use_container_width=True)
+
+        # Growth context for the latest month shown
+        if history is not None and not history.empty:
+            latest = history.iloc[-1]
+            changes = [f"{label}: {latest[col]:+.1f}%" for label, col in (("MoM", "MoM_pct"), ("YoY", "YoY_pct"))
+                       if pd.notna(latest[col])]
+            if changes:
+                st.caption(f"Latest month ({history.index[-1]:%b %Y}) — " + ", ".join(changes))
+    else:
+        st.info("No data for this metric.")
+
+def add_projection(fig, projection, shown_until):
+    """Projection toggle and method picker; draws the line and its band onto `fig`."""
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        show = st.toggle("Show projection", value=False)
+    with col2:
+        method = st.radio("Projection method", list(PROJECTION_METHODS), horizontal=True, disabled=not show,
+                          label_visibility="collapsed")
+    if not show:
+        return
+    projection = projection[projection["Method"] == PROJECTION_METHODS[method]].dropna(subset=["Projection"])
+    if projection.empty:
+        st.caption("Not enough history to project this metric.")
+        return
+    if projection.index[0] - pd.DateOffset(months=1) > shown_until:
+        st.caption("Projection starts after the latest month shown; widen the date range to see it.")
+        return
+    band = projection.dropna(subset=["Lower", "Upper"])
+    fig.add_trace(go.Scatter(
+        x=list(band.index) + list(band.index[::-1]), y=list(band["Upper"]) + list(band["Lower"][::-1]),
+        fill="toself", mode="lines", line={"width": 0}, opacity=0.25, hoverinfo="skip", name="Projection band"
+    ))
+    fig.add_trace(go.Scatter(
+        x=projection.index, y=projection["Projection"], mode="lines+markers", line={"dash": "dash"},
+        name=f"Projection ({method.lower()}, {PROJECTION_HORIZON} months)"
+    ))
+
+def detail_window(grid, sort_by, descending, months, page, page_size):
+    """One page of the metric x month grid, sorted over all of its rows first."""
+    if sort_by in grid.columns:
+        order = grid[sort_by].sort_values(ascending=not descending, na_position="last", kind="stable").index
+    else:
+        order = grid.index.sort_values(ascending=not descending)
+    start = (page - 1) * page_size
+    return grid.loc[order[start:start + page_size], months]
+
+@st.fragment
+def metric_details_section(df_filtered):
+    # Detailed metrics table
+    st.subheader("🔍 Detailed Metrics")
+    if df_filtered.empty:
+        st.info("No records for selected filters.")
+        return
+
+    # Metric x month grid; only the page and months picked below are sent to the browser
+    grid = (
+        df_filtered.drop_duplicates(['Agg_Metric', 'Date'])
+        .set_index(['Agg_Metric', 'Date'])['Agg_Value']
+        .unstack()
+    )
+    months = list(grid.columns)
+    labels = {month: f"{month:%b %Y}" for month in months}
+
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        shown = st.multiselect("Months", months, default=months[-DETAIL_MONTHS:], format_func=labels.get)
+    with col2:
+        sort_by = st.selectbox("Sort by", ["Metric"] + months[::-1], format_func=lambda col: labels.get(col, col))
+    with col3:
+        descending = st.toggle("Descending")
+    with col4:
+        page_size = st.selectbox("Rows per page", DETAIL_PAGE_SIZES)
+
+    pages = -(-len(grid) // page_size)
+    page = st.number_input("Page", min_value=1, max_value=pages, value=1) if pages > 1 else 1
+    window = detail_window(grid, sort_by, descending, sorted(shown), page, page_size)
+    window.columns = [labels[month] for month in window.columns]
+
+    st.dataframe(window, use_container_width=True)
+    first = (page - 1) * page_size
+    st.caption(f"Metrics {first + 1}–{first + len(window)} of {len(grid)} · {len(shown)} of {len(months)} months shown")
@@ -0,0 +1,117 @@
+"""Which metrics move together, across every pillar.
+
+All metrics are laid out once as a dense month x metric matrix (months with
+no value are NaN), and the correlation of every pair comes out of the same
+few matrix products: sums over each pair's shared months are masked matrix
+multiplications, so gaps are handled without looping over pairs. Metrics
+are ordered for the heatmap by the spectral (Fiedler vector) ordering of
+their correlation strengths, which puts metrics that move together next to
+each other without needing a hierarchical-clustering library.
+"""
+import numpy as np
+import pandas as pd
+
+MIN_OVERLAP = 6  # Shared months a pair needs before its correlation is shown
+CORRELATION_BASES = {"Monthly values": "values", "Month-over-month change": "changes"}
+
+
+def metric_matrix(df):
+    """Dense month x metric matrix of every pillar's values, and the metrics' labels.
+
+    Columns are (Pillar, Agg_Metric), since metric names repeat across
+    pillars; every calendar month from the first to the last is a row.
+    Returns ``(matrix, labels)``, `labels` being indexed like the columns
+    with Label ("P<pillar> · <name>"), Pillar and Display_Format.
+    """
+    rows = df.drop_duplicates(["Pillar", "Agg_Metric", "Month"])
+    if rows.empty:
+        return pd.DataFrame(), pd.DataFrame(columns=["Label", "Pillar", "Display_Format"])
+    matrix = rows.set_index(["Month", "Pillar", "Agg_Metric"])["Agg_Value"].unstack(["Pillar", "Agg_Metric"])
+    matrix = matrix.reindex(pd.date_range(matrix.index.min(), matrix.index.max(), freq="MS")).sort_index(axis=1)
+
+    names = rows.drop_duplicates(["Pillar", "Agg_Metric"]).set_index(["Pillar", "Agg_Metric"]).loc[matrix.columns]
+    labels = pd.DataFrame({
+        "Label": "P" + names.index.get_level_values("Pillar").astype(str) + " · " + names["Metric_Name"].astype(str),
+        "Pillar": names.index.get_level_values("Pillar"),
+        "Display_Format": names["Display_Format"],
+    }, index=matrix.columns)
+    return matrix, labels
+
+
+def correlation_matrix(values, min_overlap=MIN_OVERLAP):
+    """Pearson correlation of every pair of columns over the rows both have, plus those rows' counts.
+
+    `values` is a rows x columns float array with NaN for missing values.
+    Pairs sharing fewer than `min_overlap` rows, or where either column is
+    constant over them, are NaN.
+    """
+    present = (~np.isnan(values)).astype(float)
+    x = np.nan_to_num(values)
+    overlap = present.T @ present
+    sums = x.T @ present  # [i, j]: sum of column i over the rows shared with j
+    squares = (x ** 2).T @ present
+    with np.errstate(invalid="ignore", divide="ignore"):
+        covariance = x.T @ x - sums * sums.T / overlap
+        spread = squares - sums ** 2 / overlap
+        corr = covariance / np.sqrt(spread * spread.T)
+    corr[(overlap < min_overlap) | ~np.isfinite(corr)] = np.nan
+    np.fill_diagonal(corr, np.where(np.diag(overlap) >= min_overlap, 1.0, np.nan))
+    return np.clip(corr, -1.0, 1.0), overlap.astype(int)
+
+
+def spectral_order(corr):
+    """Column order that keeps strongly correlated metrics together.
+
+    Sorts by the Fiedler vector (second-smallest eigenvector of the graph
+    Laplacian) of the |correlation| affinity; metrics with no usable
+    correlation go last.
+    """
+    affinity = np.abs(np.nan_to_num(corr))
+    np.fill_diagonal(affinity, 0.0)
+    connected = affinity.sum(axis=0) > 0
+    order = np.flatnonzero(connected)
+    if len(order) > 2:
+        sub = affinity[np.ix_(order, order)]
+        laplacian = np.diag(sub.sum(axis=0)) - sub
+        _, vectors = np.linalg.eigh(laplacian)
+        order = order[np.argsort(vectors[:, 1], kind="stable")]
+    return np.concatenate([order, np.flatnonzero(~connected)])
+
+
+def correlations(df, min_overlap=MIN_OVERLAP):
+    """Everything the correlation explorer shows, built once per data version.
+
+    Returns a dict with the month x metric `matrix`, the metrics' `labels`,
+    and for each basis in CORRELATION_BASES its ``(corr, overlap, order)``:
+    correlations of the monthly values or of their month-over-month changes,
+    shared-month counts and the heatmap order.
+    """
+    matrix, labels = metric_matrix(df)
+    result = {"matrix": matrix, "labels": labels}
+    for basis, frame in (("values", matrix), ("changes", matrix.diff())):
+        if frame.empty:
+            result[basis] = (np.empty((0, 0)), np.empty((0, 0), dtype=int), np.empty(0, dtype=int))
+            continue
+        corr, overlap = correlation_matrix(frame.to_numpy(dtype=float), min_overlap)
+        result[basis] = (corr, overlap, spectral_order(corr))
+    return result
+
+
+def strongest_pairs(corr, overlap, labels, columns=None, limit=20):
+    """The `limit` most strongly correlated metric pairs (by |r|), among `columns` if given."""
+    columns = np.arange(len(labels)) if columns is None else np.asarray(columns)
+    sub = corr[np.ix_(columns, columns)]
+    first, second = np.triu_indices(len(columns), k=1)
+    r = sub[first, second]
+    keep = ~np.isnan(r)
+    first, second, r = first[keep], second[keep], r[keep]
+    top = np.argsort(-np.abs(r), kind="stable")[:limit]
+    first, second = columns[first[top]], columns[second[top]]
+    return pd.DataFrame({
+        "Metric A": labels["Label"].to_numpy()[first],
+        "Metric B": labels["Label"].to_numpy()[second],
+        "r": r[top],
+        "Months": overlap[first, second],
+        "A": first,
+        "B": second,
+    })
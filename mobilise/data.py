@@ -0,0 +1,389 @@
+"""Shared data layer: sheet loading, caching and the per-pillar filters.
+
+Pages receive a `Dataset` and filter through it, so they never touch the
+loaders, the optional SQL backend or the cache keys directly.
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import streamlit as st
+
+from mobilise.analytics import period_over_period
+from mobilise.cohorts import cohort_table
+from mobilise.correlations import correlations
+from mobilise.derived import derive_metrics, with_derived
+from mobilise.fetch import EXPORT_BASE, fetch_csv, load_snapshot
+from mobilise.filter_cache import FilterCache, frame_bytes
+from mobilise.forecast import project_metrics
+from mobilise.geo import bin_engagements, read_centroids, read_engagements
+from mobilise.ingest import IncrementalLoader, data_version, dataset_fingerprint, prepare_data
+from mobilise.kpis import KPIs, asof_rows, resolve_as_of
+from mobilise.metrics import Metrics, write_metrics_file
+from mobilise.overview import build_overview
+from mobilise.sql_backend import SQLBackend
+from mobilise.tenants import TENANTS_FILE, TenantCache, pick_tenant, read_tenants
+from mobilise.text_index import TermIndex, read_responses
+
+# Configuration - UPDATE THIS WITH GOOGLE SHEETS URL
+SHEETS_URL = "https://docs.google.com/spreadsheets/d/1nDAi1EsS07YlP8lnLGkbep2Y3xfYDNrMFDpe8vdsqJs/edit?gid=1058530763"
+USE_GOOGLE_SHEETS = True  # Set to False to use local CSV
+LOCAL_CSV = "data/demo_data.csv"
+
+# Default offline tables behind the Page 4 outreach map (see mobilise.geo); each tenant can set its own
+POSTCODE_CENTROIDS_CSV = "data/postcode_centroids.csv"  # Postcode, Latitude, Longitude
+POSTCODE_ENGAGEMENTS_CSV = "data/postcode_engagements.csv"  # Date, Postcode, Engagements
+
+# Default free-text pulse-survey answers behind the Page 6 themes (see mobilise.text_index)
+PULSE_RESPONSES_CSV = "data/pulse_responses.csv"  # Date, Response
+
+# Optional embedded SQL backend for filters and aggregates: None keeps everything in pandas,
+# "duckdb" (falls back to sqlite when duckdb is not installed) or "sqlite"
+SQL_BACKEND = None
+SQL_DB_PATH = ":memory:"  # or a file such as "data/mobilise.db"
+
+# Memory budget for filtered pillar frames shared across reruns and sessions (LRU beyond this)
+FILTER_CACHE_BYTES = int(os.environ.get("MOBILISE_FILTER_CACHE_MB", 64)) * 1024 * 1024
+
+# Memory budget for each tenant's loaded tables and the structures derived from them (LRU beyond this)
+TENANT_CACHE_BYTES = int(os.environ.get("MOBILISE_TENANT_CACHE_MB", 256)) * 1024 * 1024
+
+# Settings of the single tenant used without a tenants file, and the base every configured tenant overrides
+TENANT_DEFAULTS = {
+    "key": "mobilise-au",
+    "name": "Mobilise AU",
+    "sheets_url": SHEETS_URL,
+    "use_google_sheets": USE_GOOGLE_SHEETS,
+    "local_csv": LOCAL_CSV,
+    "postcode_centroids_csv": POSTCODE_CENTROIDS_CSV,
+    "postcode_engagements_csv": POSTCODE_ENGAGEMENTS_CSV,
+    "pulse_responses_csv": PULSE_RESPONSES_CSV,
+    "filter_cache_mb": FILTER_CACHE_BYTES / 2**20,
+    "cache_mb": TENANT_CACHE_BYTES / 2**20,
+}
+
+# Runtime metrics in Prometheus text format (see mobilise.metrics): served on the API's /metrics,
+# and written after every script run to this file when set (e.g. for node_exporter's textfile collector)
+METRICS_FILE = os.environ.get("MOBILISE_METRICS_FILE")
+
+# Manual + change-driven refresh
+REFRESH_CHECK_EVERY = 300  # The header looks for a new version of the sheet this often (seconds)
+
+
+# ----------- LOAD DATA -----------
+def get_csv_url(sheets_url, gid=0):
+    sheet_id = sheets_url.split('/d/')[1].split('/')[0]
+
+    # Auto-extract gid from URL if present
+    if 'gid=' in sheets_url:
+        gid = sheets_url.split('gid=')[1].split('&')[0].split('#')[0]
+
+    return f"{EXPORT_BASE}/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
+
+# Survives cache clears, so a refresh only parses the rows that changed since the last fetch
+@st.cache_resource(show_spinner=False)
+def get_incremental_loader(source):
+    return IncrementalLoader()
+
+# Only successful loads are cached; a failure is retried (or short-circuited) next run.
+# A download is kept until a probe finds a different version of the sheet (see reload_data).
+@st.cache_data(show_spinner=False)
+def fetch_sheet(csv_url):
+    return get_incremental_loader(csv_url).load(fetch_timed(csv_url, "load"))
+
+def fetch_timed(csv_url, kind):
+    """`fetch_csv`, with its latency and outcome recorded in the runtime metrics."""
+    began, outcome = time.perf_counter(), "error"
+    try:
+        raw = fetch_csv(csv_url)
+        outcome = "ok"
+        return raw
+    finally:
+        get_metrics().observe("mobilise_sheet_fetch_seconds", time.perf_counter() - began,
+                              tenant=source_tenant(csv_url), kind=kind, outcome=outcome)
+
+def load_data_from_sheets(sheets_url, sheet_tab=0):
+    try:
+        return fetch_sheet(get_csv_url(sheets_url, sheet_tab)), None
+    except Exception as e:
+        return None, str(e)
+
+# Loads run here so the page shell can be drawn while the sheet downloads
+@st.cache_resource(show_spinner=False)
+def get_load_executor():
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="mobilise-load")
+
+def load_in_background(sheets_url, sheet_tab=0):
+    """Start `load_data_from_sheets` on a worker thread; returns a Future of (df, error)."""
+    return get_load_executor().submit(load_data_from_sheets, sheets_url, sheet_tab)
+
+def load_last_good(sheets_url, sheet_tab=0):
+    """Last successfully fetched sheet data and its fetch time, or (None, None).
+
+    Served straight from memory, or from the on-disk snapshot after a restart.
+    """
+    csv_url = get_csv_url(sheets_url, sheet_tab)
+    loader = get_incremental_loader(csv_url)
+    if loader.df is None:
+        raw, saved_at = load_snapshot(csv_url)
+        if raw is None:
+            return None, None
+        loader.load(raw, fetched_at=saved_at)
+    return loader.df.copy(), loader.fetched_at
+
+def file_version(path):
+    """Cheap version of a local file (modification time and size), for keying caches built from it."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+# Fallback to local CSV, kept in the tenant's own cache; re-read only when the file changes
+def load_data(tenant):
+    if not os.path.exists(tenant.local_csv):
+        return None
+    cache = get_tenant_cache(tenant.key, tenant.cache_bytes)
+    key = (tenant.local_csv, file_version(tenant.local_csv))
+    # Every rerun without a sheet comes through here, so finding the table loaded isn't counted as a hit
+    df = cache.peek(key, "local_csv")
+    if df is None:
+        df = cache.get_or_build(key, "local_csv", lambda: prepare_data(pd.read_csv(tenant.local_csv)))
+    return df
+
+@st.cache_data(ttl=REFRESH_CHECK_EVERY, show_spinner=False)
+def probe_sheet_fingerprint(sheets_url):
+    """Fingerprint of the sheet as it is now; shared by every session between checks.
+
+    The probe feeds the incremental loader, so the reload it triggers has
+    nothing left to parse.
+    """
+    try:
+        csv_url = get_csv_url(sheets_url)
+        loader = get_incremental_loader(csv_url)
+        loader.load(fetch_timed(csv_url, "probe"))
+        return loader.fingerprint
+    except Exception:
+        return None
+
+# ----------- TENANTS -----------
+# Read once per process; edit the tenants file and restart to add or change a tenant
+@st.cache_resource(show_spinner=False)
+def get_tenants():
+    return read_tenants(TENANTS_FILE, TENANT_DEFAULTS)
+
+def resolve_tenant(requested=None):
+    """The tenant for `requested` (e.g. the ``?tenant=`` query parameter), or None if unknown."""
+    return pick_tenant(get_tenants(), requested)
+
+def source_tenant(csv_url):
+    """Id of the tenant whose sheet exports to `csv_url`, or "unknown"."""
+    for tenant in get_tenants().values():
+        if tenant.sheets_configured() and get_csv_url(tenant.sheets_url) == csv_url:
+            return tenant.key
+    return "unknown"
+
+# Each tenant's filter results and derived structures live in its own caches, within its own budget
+@st.cache_resource(show_spinner=False)
+def get_filter_cache(tenant_key, budget_bytes):
+    return FilterCache(budget_bytes)
+
+@st.cache_resource(show_spinner=False)
+def get_tenant_cache(tenant_key, budget_bytes):
+    return TenantCache(budget_bytes)
+
+def tenant_stats(tenant):
+    """Load and cache counters for one tenant, as shown in the sidebar and served by the API."""
+    return {"tenant": tenant.key, "name": tenant.name, **get_tenant_cache(tenant.key, tenant.cache_bytes).stats(),
+            "filter_cache": get_filter_cache(tenant.key, tenant.filter_cache_bytes).stats()}
+
+# ----------- RUNTIME METRICS -----------
+@st.cache_resource(show_spinner=False)
+def get_metrics():
+    return Metrics()
+
+def collect_cache_metrics():
+    """Every tenant's cache counters, read when the metrics are rendered."""
+    stats = [tenant_stats(tenant) for tenant in get_tenants().values()]
+
+    def per_cache(counter):
+        return [({"tenant": usage["tenant"], "cache": cache}, counts[counter])
+                for usage in stats for cache, counts in (("derived", usage), ("filter", usage["filter_cache"]))]
+
+    def per_tenant(read):
+        return [({"tenant": usage["tenant"]}, read(usage)) for usage in stats]
+
+    return [
+        ("mobilise_cache_hits_total", "counter",
+         "Cache lookups answered from the cache, by cache (derived structures or filter results).", per_cache("hits")),
+        ("mobilise_cache_misses_total", "counter", "Cache lookups that had to build their result.",
+         per_cache("misses")),
+        ("mobilise_cache_build_seconds_total", "counter", "Time spent building derived structures.",
+         per_tenant(lambda usage: usage["build_seconds"])),
+        ("mobilise_cache_bytes", "gauge", "Memory held by each cache.", per_cache("bytes")),
+        ("mobilise_cache_evictions_total", "counter", "Entries evicted to keep each cache within its budget.",
+         per_cache("evictions")),
+    ]
+
+def metrics_text():
+    """All runtime metrics in Prometheus text format."""
+    return get_metrics().render(collect_cache_metrics())
+
+def export_metrics():
+    """Write the metrics to METRICS_FILE, when one is configured."""
+    if METRICS_FILE:
+        write_metrics_file(METRICS_FILE, metrics_text())
+
+def build_period_over_period(df, fingerprint, source=None, derived=None):
+    loader = get_incremental_loader(source) if source else None
+    if loader is not None and loader.fingerprint == fingerprint:
+        # Only the series touched by the last fetch are recomputed; derived series are few, so redo them
+        pop = loader.period_over_period()
+        if derived is None or derived.empty:
+            return pop
+        return pd.concat([pop, period_over_period(derived)]).sort_index()
+    return period_over_period(df)
+
+# Kept in the tenant's cache keyed on the files' versions, so the bins are rebuilt only when either table changes
+def load_postcode_bins(tenant):
+    """The tenant's monthly binned postcode engagements and unmatched postcodes, or None without both tables."""
+    paths = [tenant.postcode_engagements_csv, tenant.postcode_centroids_csv]
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    key = tuple((path, file_version(path)) for path in paths)
+    return get_tenant_cache(tenant.key, tenant.cache_bytes).get_or_build(
+        key, "postcode_bins", lambda: bin_engagements(read_engagements(paths[0]), read_centroids(paths[1])))
+
+# One index per tenant, fed only the responses added since its last read
+@st.cache_resource(show_spinner=False)
+def get_term_index(tenant_key, path):
+    return TermIndex()
+
+def load_term_index(tenant):
+    """The tenant's pulse-response term index, brought up to date with the file, or None without it."""
+    path = tenant.pulse_responses_csv
+    if not os.path.exists(path):
+        return None
+    index = get_term_index(tenant.key, path)
+    index.update(lambda: read_responses(path), version=file_version(path))
+    return index
+
+
+# ----------- FILTER HELPERS -----------
+class Dataset:
+    """One tenant's loaded sheet plus the pillar filters every page goes through.
+
+    Structures derived from the data are built once per dataset fingerprint
+    (a content hash, shown as `version`) in the tenant's own cache and shared
+    read-only between its sessions.
+    """
+
+    def __init__(self, df, source=None, tenant=None):
+        self.source = source  # CSV export URL when loaded through the incremental loader
+        self.tenant = tenant or resolve_tenant()
+        self.cache = get_tenant_cache(self.tenant.key, self.tenant.cache_bytes)
+        self.filter_cache = get_filter_cache(self.tenant.key, self.tenant.filter_cache_bytes)
+        self.fingerprint = dataset_fingerprint(df)
+        self.version = data_version(self.fingerprint)
+        # Derived metrics (see mobilise.derived) are rows of the frame like any other metric. Every rerun
+        # builds a Dataset, so finding the store already built isn't counted as a cache hit.
+        store = self.cache.peek(self.fingerprint, "metric_store")
+        if store is None:
+            store = self.cache.get_or_build(self.fingerprint, "metric_store", lambda: self._metric_store(df))
+        self.df, self.derived, self._bytes = store
+        self.backend = None
+        if SQL_BACKEND:
+            self.backend = self.cache.get_or_build(self.fingerprint, f"sql:{SQL_BACKEND}:{SQL_DB_PATH}",
+                                                   lambda: SQLBackend(self.df, SQL_BACKEND, SQL_DB_PATH))
+        self._pop = None
+        self._overview = None
+        self._asof_rows = None
+
+    @staticmethod
+    def _metric_store(df):
+        derived = derive_metrics(df)
+        df = with_derived(df, derived)
+        return df, derived, frame_bytes(df)
+
+    def pillar_domain(self, pillar):
+        """First month, last month and metric categories available for a pillar."""
+        if self.backend is not None:
+            return self.backend.pillar_domain(pillar)
+        df_p = self.df[self.df["Pillar"] == pillar]
+        return df_p["Month"].min(), df_p["Month"].max(), df_p["Metric_Category"].dropna().unique().tolist()
+
+    def filter_pillar(self, pillar, selected_range, selected_categories=None, period=None):
+        """Rows of a pillar inside the sidebar date range, categories and outcome period."""
+        if len(selected_range) == 1:
+            selected_range = [selected_range[0], selected_range[0]]
+        start, end = pd.to_datetime(selected_range[0]), pd.to_datetime(selected_range[1])
+        categories = None if selected_categories is None else frozenset(selected_categories)
+        key = (self.fingerprint, pillar, start, end, categories, period)
+        return self.filter_cache.get_or_compute(
+            key, lambda: self._filter(pillar, start, end, selected_categories, period))
+
+    def _filter(self, pillar, start, end, selected_categories, period):
+        if self.backend is not None:
+            return self.backend.filter_frame(pillar, start, end, selected_categories, period)
+        df_p = self.df[self.df["Pillar"] == pillar]
+        mask = (df_p["Month"] >= start) & (df_p["Month"] <= end)
+        if selected_categories is not None:
+            mask &= df_p["Metric_Category"].isin(selected_categories)
+        if period is not None:
+            mask &= df_p["Period"] == period
+        return df_p[mask]
+
+    def aggregate_metrics(self, df_filtered, pillar, selected_range, selected_categories, how="mean",
+                          metrics=None, metric_category=None):
+        """Per-metric mean/sum of the filtered rows, pushed down to SQL when enabled."""
+        if self.backend is not None:
+            return self.backend.aggregate(pillar, selected_range[0], selected_range[-1], selected_categories,
+                                          how=how, metrics=metrics, metric_category=metric_category)
+        data = df_filtered
+        if metrics is not None:
+            data = data[data["Agg_Metric"].isin(metrics)]
+        if metric_category is not None:
+            data = data[data["Metric_Category"] == metric_category]
+        return data.groupby("Agg_Metric")["Agg_Value"].agg(how).reset_index()
+
+    def period_over_period(self, pillar=None):
+        """MoM/YoY change, rolling averages and running totals (see mobilise.analytics)."""
+        if self._pop is None:
+            self._pop = self.cache.get_or_build(self.fingerprint, "period_over_period", lambda: build_period_over_period(
+                self.df, self.fingerprint, self.source, self.derived))
+        if pillar is None:
+            return self._pop
+        return self._pop[self._pop.index.get_level_values("Pillar") == pillar].droplevel("Pillar")
+
+    def kpis(self, pillar, selected_range, selected_categories=None):
+        """Every metric of a pillar as of the end of the selected range, for the KPI cards."""
+        if self._asof_rows is None:
+            self._asof_rows = self.cache.get_or_build(self.fingerprint, "asof_rows", lambda: asof_rows(self.df))
+        rows = self._asof_rows.get(pillar)
+        if rows is None:
+            return KPIs(pd.DataFrame(columns=["Metric_Kind", "Agg_Value", "Month", "Delta"]))
+        if selected_categories is not None:
+            rows = rows[rows["Metric_Category"].isin(selected_categories)]
+        return KPIs(resolve_as_of(rows, selected_range[-1], self.period_over_period(pillar)))
+
+    def cohorts(self, pillar):
+        """Outcomes by intake cohort for a pillar's 3/6-month metrics (see mobilise.cohorts)."""
+        return self.cache.get_or_build(self.fingerprint, f"cohorts:{pillar}", lambda: cohort_table(self.df, pillar))
+
+    def projections(self, pillar):
+        """Linear and seasonal-naive projections of every metric in a pillar (see mobilise.forecast)."""
+        return self.cache.get_or_build(self.fingerprint, f"projections:{pillar}",
+                                       lambda: project_metrics(self.period_over_period(pillar)))
+
+    def memory_bytes(self):
+        """Deep memory size of the dataset's rows, derived metrics included."""
+        return self._bytes
+
+    def correlations(self):
+        """Correlations between every pair of metrics across pillars (see mobilise.correlations)."""
+        return self.cache.get_or_build(self.fingerprint, "correlations", lambda: correlations(self.df))
+
+    def overview(self):
+        """Per-pillar summary and headline KPIs for the overview page (see mobilise.overview)."""
+        if self._overview is None:
+            pop = self.period_over_period()
+            self._overview = self.cache.get_or_build(self.fingerprint, "overview", lambda: build_overview(self.df, pop))
+        return self._overview
@@ -0,0 +1,100 @@
+"""Derived metrics: ratios and differences of loaded metrics, for every month.
+
+Rates such as volunteer retention or visit-to-sign-up conversion are built
+from metrics already in the sheet. They are evaluated for every pillar and
+month at once from one wide (Pillar, Month) x operand table and appended to
+the dataset as ordinary metric rows, so filters, KPI cards, time series and
+period-over-period analytics treat them like any other metric.
+"""
+import numpy as np
+import pandas as pd
+
+from mobilise.taxonomy import TAXONOMY_COLUMNS, build_taxonomy
+from mobilise.units import display_formats
+
+KIND_PREFIX = "kind:"  # Operand summing every metric of a Metric_Kind, e.g. all platforms' followers
+
+# code: (formula, left operand, right operand, scale, unit)
+# A ratio is left / right * scale, a difference left - right; a pillar gets a
+# derived metric for each month in which it has both operands.
+DERIVED_METRICS = {
+    "%_Volunteer_Retention": ("ratio", "Repeat_Volunteers", "Total_Volunteers", 100, "%"),
+    "Avg_Engagements_per_Volunteer": ("ratio", "Total_Outreach_Engs_Volunteers", "Total_Volunteers", 1, "count"),
+    "Total_One_Time_Volunteers": ("difference", "Total_Volunteers", "Repeat_Volunteers", 1, "count"),
+    "%_Conversion_Visits_to_SignUps": ("ratio", "Total_Actual_SignUps_Organic", "Total_Visits_SignUps_Organic", 100, "%"),
+    "%_Engagement_Rate": ("ratio", "kind:engagements", "kind:followers", 100, "%"),
+    "%_Reach_to_Visit": ("ratio", "Total_Visits_SignUps_Organic", "kind:followers", 100, "%"),
+}
+
+
+def operand_table(df, operands):
+    """Operand values indexed by (Pillar, Month), one column per operand.
+
+    Metric operands take the month's first value, as the KPI cards do; kind
+    operands sum every metric of that kind in the pillar and month.
+    """
+    kinds = [op[len(KIND_PREFIX):] for op in operands if op.startswith(KIND_PREFIX)]
+    codes = [op for op in operands if not op.startswith(KIND_PREFIX)]
+    keys = ["Pillar", "Month"]
+
+    rows = df[df["Agg_Metric"].isin(codes)].drop_duplicates(keys + ["Agg_Metric"])
+    by_code = rows.set_index(keys + ["Agg_Metric"])["Agg_Value"].unstack()
+    by_kind = (
+        df[df["Metric_Kind"].isin(kinds)]
+        .groupby(keys + ["Metric_Kind"], observed=True)["Agg_Value"].sum()
+        .unstack()
+        .rename(columns=lambda kind: KIND_PREFIX + kind)
+    )
+    table = by_code.join(by_kind, how="outer") if len(by_kind.columns) else by_code
+    return table.reindex(columns=operands).astype("float64")
+
+
+def derive_metrics(df, formulas=DERIVED_METRICS):
+    """Rows of every derived metric in every (Pillar, Month) with its operands, shaped like `df`."""
+    operands = list(dict.fromkeys(op for _, left, right, _, _ in formulas.values() for op in (left, right)))
+    table = operand_table(df, operands)
+
+    values = {}
+    for code, (formula, left, right, scale, _) in formulas.items():
+        lhs, rhs = table[left].to_numpy(), table[right].to_numpy()
+        if formula == "ratio":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values[code] = np.where(rhs > 0, lhs / rhs * scale, np.nan)
+        else:
+            values[code] = (lhs - rhs) * scale
+    derived = pd.DataFrame(values, index=table.index).rename_axis(columns="Agg_Metric").stack().rename("Agg_Value")
+    derived = derived.reset_index()
+    if derived.empty:
+        return df.iloc[:0].copy()
+
+    # Each derived metric sits in its left operand's category (for kinds, the first such metric's)
+    left_of = {code: left for code, (_, left, _, _, _) in formulas.items()}
+    source = df.assign(Operand=df["Agg_Metric"].astype(object))
+    kind_rows = source["Metric_Kind"].isin([op[len(KIND_PREFIX):] for op in left_of.values()
+                                            if op.startswith(KIND_PREFIX)])
+    source.loc[kind_rows, "Operand"] = KIND_PREFIX + source.loc[kind_rows, "Metric_Kind"].astype(str)
+    category = source.drop_duplicates(["Pillar", "Operand"]).set_index(["Pillar", "Operand"])["Metric_Category"]
+    lookup = pd.MultiIndex.from_arrays([derived["Pillar"], derived["Agg_Metric"].map(left_of)])
+    derived["Metric_Category"] = category.reindex(lookup).to_numpy()
+
+    derived["Pillar_Name"] = derived["Pillar"].map(df.drop_duplicates("Pillar").set_index("Pillar")["Pillar_Name"])
+    derived["Date"] = derived["Month"]
+    derived["Unit"] = derived["Agg_Metric"].map({code: spec[4] for code, spec in formulas.items()})
+    taxonomy = build_taxonomy(formulas)
+    for col in TAXONOMY_COLUMNS:
+        derived[col] = derived["Agg_Metric"].map(taxonomy[col])
+    derived["Display_Format"] = display_formats(derived["Unit"], derived["Metric_Kind"])
+    return derived.reindex(columns=df.columns).astype({col: df[col].dtype for col in df.columns
+                                                      if col not in TAXONOMY_COLUMNS})
+
+
+def with_derived(df, derived):
+    """`df` with the derived rows appended, keeping the taxonomy columns categorical."""
+    if derived.empty:
+        return df
+    combined = pd.concat([df, derived], ignore_index=True)
+    for col in TAXONOMY_COLUMNS:
+        if col in df:
+            categories = df[col].cat.categories.union(pd.Index(derived[col].dropna().unique()), sort=False)
+            combined[col] = combined[col].astype(pd.CategoricalDtype(categories))
+    return combined
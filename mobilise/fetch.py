@@ -0,0 +1,175 @@
+"""Bounded fetching of the sheet export, with a circuit breaker and snapshots.
+
+Every fetch has an overall deadline, retries included, and is retried with
+exponential backoff. After repeated failures a host's circuit opens and
+fetches fail immediately until a cooldown passes, so a broken export does not
+stall every rerun. Each successful download is written to disk as the
+last-known-good snapshot that the app serves while the sheet is unavailable.
+
+Settings are read from the environment so a local stub (tools/sheets_stub.py)
+can stand in for Google.
+"""
+import hashlib
+import http.client
+import io
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pandas as pd
+
+EXPORT_BASE = os.environ.get("MOBILISE_EXPORT_BASE", "https://docs.google.com").rstrip("/")
+FETCH_TIMEOUT = float(os.environ.get("MOBILISE_FETCH_TIMEOUT", 10))  # Seconds for a fetch, retries included
+FETCH_RETRIES = int(os.environ.get("MOBILISE_FETCH_RETRIES", 2))  # Extra attempts after the first
+FETCH_BACKOFF = 0.5  # First retry waits this long, doubling after each attempt
+BREAKER_THRESHOLD = 3  # Consecutive failed attempts before the circuit opens
+BREAKER_COOLDOWN = 60  # Seconds an open circuit waits before letting one fetch through
+SNAPSHOT_DIR = os.environ.get("MOBILISE_SNAPSHOT_DIR", os.path.join(".cache", "snapshots"))
+
+
+class FetchError(Exception):
+    """The export could not be downloaded."""
+
+
+class CircuitOpenError(FetchError):
+    """Raised without a network call while a host's circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker: closed, open for `cooldown`, then one trial call."""
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.cooldown else "open"
+
+    def allow(self):
+        """Whether a call may go out now; only one trial call passes when half-open."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures, self.opened_at, self._trial = 0, None, False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            self._trial = False
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(url):
+    """The shared breaker for a URL's host."""
+    host = urllib.parse.urlsplit(url).netloc
+    with _breakers_lock:
+        return _breakers.setdefault(host, CircuitBreaker())
+
+
+def _download(url, deadline):
+    """Read the whole response, giving up once `deadline` (monotonic) has passed."""
+    chunks = []
+    remaining = deadline - time.monotonic()
+    with urllib.request.urlopen(url, timeout=max(remaining, 0.1)) as response:
+        while True:
+            if time.monotonic() > deadline:
+                raise TimeoutError("export download exceeded its deadline")
+            chunk = response.read1(64 * 1024)  # Whatever has arrived, so the deadline is checked often
+            if not chunk:
+                body = b"".join(chunks)
+                if response.length:  # The connection closed before the promised Content-Length
+                    raise http.client.IncompleteRead(body, response.length)
+                return body
+            chunks.append(chunk)
+
+
+def fetch_bytes(url, timeout=FETCH_TIMEOUT, retries=FETCH_RETRIES, backoff=FETCH_BACKOFF):
+    """Download `url` within `timeout` seconds overall, retrying with exponential backoff.
+
+    Every failed attempt counts towards the host's breaker, so one stalled
+    fetch is enough to stop the sessions behind it from waiting too.
+    """
+    breaker = breaker_for(url)
+    if not breaker.allow():
+        raise CircuitOpenError(f"{urllib.parse.urlsplit(url).netloc} is failing; retrying after cooldown")
+    deadline = time.monotonic() + timeout
+    error = None
+    for attempt in range(retries + 1):
+        try:
+            body = _download(url, deadline)
+            breaker.record_success()
+            return body
+        except urllib.error.HTTPError as e:
+            error = e
+            breaker.record_failure()
+            if e.code < 500 and e.code != 429:
+                break  # Retrying will not fix a bad URL or a private sheet
+        # Timeouts, resets, truncated bodies and anything else: every failure must reach the
+        # breaker, or a failed half-open trial would keep the circuit shut for good
+        except Exception as e:
+            error = e
+            breaker.record_failure()
+        wait = backoff * 2 ** attempt
+        if attempt == retries or time.monotonic() + wait >= deadline or not breaker.allow():
+            break
+        time.sleep(wait)
+    raise FetchError(f"could not fetch export: {getattr(error, 'reason', error)}") from error
+
+
+# ----------- LAST-KNOWN-GOOD SNAPSHOTS -----------
+def snapshot_path(url):
+    name = hashlib.sha1(url.encode()).hexdigest()[:16]
+    return os.path.join(SNAPSHOT_DIR, f"{name}.csv")
+
+
+def save_snapshot(url, body):
+    """Write the raw export atomically, so readers never see half a file."""
+    path = snapshot_path(url)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, path)
+
+
+def load_snapshot(url):
+    """(raw frame, saved-at timestamp) of the last good download, or (None, None)."""
+    path = snapshot_path(url)
+    try:
+        return pd.read_csv(path), os.path.getmtime(path)
+    except (OSError, ValueError):
+        return None, None
+
+
+def fetch_csv(url):
+    """Raw export as a frame; a successful download also refreshes the snapshot."""
+    body = fetch_bytes(url)
+    raw = pd.read_csv(io.BytesIO(body))
+    try:
+        save_snapshot(url, body)
+    except OSError:
+        pass  # A read-only disk only costs the fallback
+    return raw
@@ -0,0 +1,97 @@
+"""Size-bounded LRU cache for filtered pillar frames.
+
+Every combination of date range, categories and period in the sidebar is a
+distinct filter result. Results are kept by key in least-recently-used order
+and charged their deep memory size; once the total passes the byte budget the
+oldest entries are evicted. Hit, miss and eviction counters show whether the
+budget suits how the dashboard is used.
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def frame_bytes(df):
+    """Deep memory footprint of a frame, index and string contents included."""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+def object_bytes(value):
+    """Approximate deep size of a cached value: frames, series and arrays, and containers of them."""
+    if isinstance(value, pd.DataFrame):
+        return frame_bytes(value)
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(object_bytes(item) for item in value.values())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(object_bytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class FilterCache:
+    """Thread-safe LRU mapping of filter keys to frames, bounded by `budget_bytes`.
+
+    Cached frames are shared between reruns and sessions, so callers must
+    treat them as read-only.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # key -> (frame, bytes)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.oversize = 0  # Results larger than the whole budget, returned but not kept
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Filter outside the lock; two sessions racing on one key just both compute it
+        frame = compute()
+        size = frame_bytes(frame)
+        with self._lock:
+            if size > self.budget_bytes:
+                self.oversize += 1
+                return frame
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (frame, size)
+            self.bytes += size
+            while self.bytes > self.budget_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+        return frame
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "oversize": self.oversize,
+                "hit_rate": self.hits / lookups if lookups else None,
+            }
@@ -0,0 +1,107 @@
+"""Short-horizon projections for every metric of a pillar at once.
+
+Each series' trailing window is gathered into one window x metric matrix,
+aligned on the series' own last month, and every fit runs as array
+operations over that matrix: a least-squares line (closed-form weighted
+normal equations, with missing months weighted zero) and a seasonal-naive
+repeat of the same months a year earlier. Both come with a prediction band
+from the fit's residuals.
+"""
+import numpy as np
+import pandas as pd
+
+PROJECTION_WINDOW = 12  # Trailing months each fit uses
+PROJECTION_HORIZON = 6  # Months projected past each series' last month
+SEASON = 12  # Seasonal-naive lag in months
+BAND_Z = 1.96  # Band half-width in residual standard errors (~95%)
+PROJECTION_METHODS = {"Linear trend": "linear", "Seasonal naive": "seasonal"}
+PROJECTION_COLUMNS = ["Method", "Projection", "Lower", "Upper"]
+
+
+def trailing_windows(values, length):
+    """The last `length` rows up to each column's last non-NaN value, and those last rows' positions."""
+    present = ~np.isnan(values)
+    last = np.where(present.any(axis=0), values.shape[0] - 1 - np.argmax(present[::-1], axis=0), -1)
+    rows = last[None, :] - (length - 1) + np.arange(length)[:, None]
+    windows = np.where(rows >= 0, values[np.clip(rows, 0, None), np.arange(values.shape[1])[None, :]], np.nan)
+    return windows, last
+
+
+def linear_fit(windows, horizon):
+    """Least-squares line through each column, extended `horizon` steps; returns (projection, half-band)."""
+    length = windows.shape[0]
+    x = np.arange(length, dtype=float)[:, None]
+    w = (~np.isnan(windows)).astype(float)
+    y = np.nan_to_num(windows)
+    n = w.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = (w * x).sum(axis=0) / n
+        y_mean = (w * y).sum(axis=0) / n
+        sxx = (w * (x - x_mean) ** 2).sum(axis=0)
+        slope = np.where(sxx > 0, (w * (x - x_mean) * (y - y_mean)).sum(axis=0) / sxx, 0.0)
+        intercept = y_mean - slope * x_mean
+        residuals = w * (y - (intercept + slope * x)) ** 2
+        sigma = np.sqrt(residuals.sum(axis=0) / (n - 2))
+
+        future = np.arange(length, length + horizon, dtype=float)[:, None]
+        projection = intercept + slope * future
+        half_band = BAND_Z * sigma * np.sqrt(1 + 1 / n + (future - x_mean) ** 2 / sxx)
+    unfit = n < 3  # Too few points for a line and a residual spread
+    projection[:, unfit] = np.nan
+    half_band[:, unfit] = np.nan
+    return projection, half_band
+
+
+def seasonal_fit(history, horizon, season=SEASON):
+    """Seasonal-naive projection: each future month repeats the value `season` months earlier.
+
+    `history` holds the last 2 x `season` months of each column. The band
+    comes from the spread of year-on-year differences and widens with every
+    season projected ahead.
+    """
+    recent, previous = history[season:], history[:season]
+    steps = np.arange(horizon)
+    projection = recent[steps % season]
+    differences = recent - previous
+    present = ~np.isnan(differences)
+    counts = present.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(present, differences, 0.0).sum(axis=0) / counts
+        spread = np.where(present, (differences - mean) ** 2, 0.0).sum(axis=0)
+        sigma = np.where(counts >= 2, np.sqrt(spread / (counts - 1)), np.nan)
+    half_band = BAND_Z * sigma[None, :] * np.sqrt(steps // season + 1)[:, None]
+    return projection, half_band
+
+
+def project_metrics(pop, window=PROJECTION_WINDOW, horizon=PROJECTION_HORIZON):
+    """Projections of every metric in one pillar's period-over-period frame.
+
+    Returns a frame indexed by (Agg_Metric, Month) with Method ("linear" or
+    "seasonal"), Projection and the band's Lower and Upper bounds, covering
+    the `horizon` months after each metric's last month.
+    """
+    if pop.empty:
+        return pd.DataFrame(columns=PROJECTION_COLUMNS, index=pd.MultiIndex.from_tuples([], names=["Agg_Metric", "Month"]))
+    matrix = pop["Agg_Value"].unstack("Agg_Metric")
+    calendar = pd.date_range(matrix.index.min(), matrix.index.max(), freq="MS")
+    matrix = matrix.reindex(calendar)
+    values = matrix.to_numpy(dtype=float)
+
+    windows, last = trailing_windows(values, window)
+    history, _ = trailing_windows(values, 2 * SEASON)
+    fits = {"linear": linear_fit(windows, horizon), "seasonal": seasonal_fit(history, horizon)}
+
+    # Future months per metric, starting the month after its own last value
+    months = np.array(calendar.append(pd.date_range(calendar[-1], periods=horizon + 1, freq="MS")[1:]))
+    future = (last[None, :] + 1 + np.arange(horizon)[:, None]).clip(0, len(months) - 1)
+    frames = []
+    for method, (projection, half_band) in fits.items():
+        frames.append(pd.DataFrame({
+            "Agg_Metric": np.tile(matrix.columns.to_numpy(), horizon),
+            "Month": months[future].ravel(),
+            "Method": method,
+            "Projection": projection.ravel(),
+            "Lower": (projection - half_band).ravel(),
+            "Upper": (projection + half_band).ravel(),
+        })[np.repeat(last[None, :] >= 0, horizon, axis=0).ravel()])
+    return pd.concat(frames).set_index(["Agg_Metric", "Month"]).sort_index()[PROJECTION_COLUMNS]
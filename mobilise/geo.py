@@ -0,0 +1,86 @@
+"""Postcode outreach engagements binned onto a map grid, per month.
+
+Engagements are reported per postcode and placed at the postcode's centroid
+from an offline lookup table, so no geocoding service is called. Every
+postcode is snapped to a square grid at each map detail level and summed per
+month once per data version; the page then only sums the small binned frame
+over the selected months, however the map is panned, zoomed or filtered.
+"""
+import numpy as np
+import pandas as pd
+
+# Map detail: grid cell size in degrees, None keeps each postcode at its own centroid
+MAP_LEVELS = {
+    "Postcode": None,
+    "Local area (~10 km)": 0.1,
+    "Region (~50 km)": 0.5,
+    "State (~200 km)": 2.0,
+}
+BIN_COLUMNS = ["Level", "Month", "Latitude", "Longitude", "Engagements", "Postcodes"]
+
+
+def normalize_postcodes(values):
+    """Postcodes as 4-digit strings (Australian postcodes lose their leading 0 in spreadsheets)."""
+    codes = pd.Series(values, dtype=object).astype(str).str.strip().str.replace(r"\.0$", "", regex=True)
+    return codes.where(codes.str.fullmatch(r"\d{3,4}"), None).str.zfill(4)
+
+
+def read_centroids(path):
+    """Postcode centroid table (Postcode, Latitude, Longitude), one row per postcode."""
+    centroids = pd.read_csv(path, dtype={"Postcode": str})
+    centroids["Postcode"] = normalize_postcodes(centroids["Postcode"]).to_numpy()
+    centroids = centroids.dropna(subset=["Postcode", "Latitude", "Longitude"])
+    return centroids.drop_duplicates("Postcode").set_index("Postcode")[["Latitude", "Longitude"]]
+
+
+def read_engagements(path):
+    """Per-postcode engagements (Date, Postcode, Engagements) with a month-start `Month` column."""
+    df = pd.read_csv(path, dtype={"Postcode": str})
+    df["Postcode"] = normalize_postcodes(df["Postcode"]).to_numpy()
+    df["Month"] = pd.to_datetime(df["Date"], dayfirst=True, errors="coerce").dt.to_period("M").dt.to_timestamp()
+    df["Engagements"] = pd.to_numeric(df["Engagements"], errors="coerce")
+    return df.dropna(subset=["Postcode", "Month", "Engagements"])[["Month", "Postcode", "Engagements"]]
+
+
+def bin_engagements(engagements, centroids, levels=MAP_LEVELS):
+    """Monthly engagement totals per grid cell at every detail level.
+
+    Returns the binned frame (columns `BIN_COLUMNS`, cells at their centre
+    point) and the postcodes that have no centroid and so are left off the map.
+    """
+    located = engagements.join(centroids, on="Postcode")
+    unmatched = sorted(located.loc[located["Latitude"].isna(), "Postcode"].unique())
+    located = located.dropna(subset=["Latitude"])
+
+    frames = []
+    for level, size in levels.items():
+        cells = located
+        if size is not None:
+            cells = located.assign(
+                Latitude=(np.floor(located["Latitude"] / size) + 0.5) * size,
+                Longitude=(np.floor(located["Longitude"] / size) + 0.5) * size,
+            )
+        binned = (
+            cells.groupby(["Month", "Latitude", "Longitude"])
+            .agg(Engagements=("Engagements", "sum"), Postcodes=("Postcode", "nunique"))
+            .reset_index()
+        )
+        frames.append(binned.assign(Level=level))
+    if not frames:
+        return pd.DataFrame(columns=BIN_COLUMNS), unmatched
+    bins = pd.concat(frames, ignore_index=True)[BIN_COLUMNS]
+    bins["Level"] = bins["Level"].astype(pd.CategoricalDtype(list(levels)))
+    return bins.sort_values(["Level", "Month"], kind="stable").reset_index(drop=True), unmatched
+
+
+def map_points(bins, level, start, end):
+    """One level's cells summed over the months from `start` to `end`.
+
+    `Postcodes` is the most postcodes a cell reached in any one of those months.
+    """
+    rows = bins[(bins["Level"] == level) & (bins["Month"] >= start) & (bins["Month"] <= end)]
+    return (
+        rows.groupby(["Latitude", "Longitude"])
+        .agg(Engagements=("Engagements", "sum"), Postcodes=("Postcodes", "max"))
+        .reset_index()
+    )
@@ -0,0 +1,175 @@
+"""Append-aware ingestion of the sheet export.
+
+The sheet grows by appending a month of rows at a time, so every fetch is
+diffed against the previous one by hashing raw rows. Only rows that are new
+or changed get their dates parsed and their metric codes tagged; the rest are
+carried over from the previous load. Period-over-period analytics are then
+recomputed only for the series and months those rows touch.
+"""
+import hashlib
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from mobilise.analytics import SERIES_KEYS, update_period_over_period
+from mobilise.taxonomy import apply_taxonomy, build_taxonomy
+from mobilise.units import normalize_units
+
+
+def parse_dates(df):
+    """Parse `Date`, drop invalid rows and add the month-start `Month` column."""
+    # Parse dates more robustly
+    df['Date'] = pd.to_datetime(df['Date'], dayfirst=True, errors='coerce')
+
+    # Remove rows with invalid dates
+    df = df.dropna(subset=['Date'])
+
+    # Create month column for aggregation
+    df['Month'] = df['Date'].dt.to_period('M').dt.to_timestamp()
+
+    # # Sum values for the same metric in the same month
+    # df = df.groupby(['Month', 'Pillar', 'Pillar_Name', 'Metric_Category', 'Agg_Metric', 'Unit']).agg({
+    #     'Agg_Value': 'sum'  # Sum all values for the same metric in the same month
+    # }).reset_index()
+
+    # Add back the Date column (using the month start date)
+    df['Date'] = df['Month']
+    return df
+
+
+# Loaders call this once per fetched dataset (or `IncrementalLoader` for the changed rows)
+def prepare_data(df):
+    df = parse_dates(df)
+
+    # Normalise metric codes and tag kind/platform/period/display name once per load
+    df = apply_taxonomy(df)
+
+    # Numeric values on one percentage scale, with each metric's display format (see mobilise.units)
+    df = normalize_units(df)
+
+    return df
+
+
+def dataset_fingerprint(df):
+    """Content hash of the dataset (columns, row order and values), keying everything built from it.
+
+    Identical data always gets the same fingerprint, however and whenever it
+    was loaded, so reloading unchanged data recomputes nothing.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update("\x1f".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return int.from_bytes(digest.digest(), "big")
+
+
+def data_version(fingerprint):
+    """Short hex form of a dataset fingerprint, as shown in the header and served by the API."""
+    return f"{fingerprint:016x}"[:12]
+
+
+def row_keys(raw):
+    """One key per raw row: its content hash plus which repeat of that content it is."""
+    hashes = pd.util.hash_pandas_object(raw, index=False).to_numpy()
+    repeat = pd.Series(hashes).groupby(hashes, sort=False).cumcount().to_numpy(dtype="uint64")
+    return pd.Index(hashes ^ (repeat * np.uint64(0x9E3779B97F4A7C15)))
+
+
+class IncrementalLoader:
+    """Prepared frame and analytics of the last fetch of one source, updated in place.
+
+    `load` returns exactly what `prepare_data` would for the same raw frame,
+    but only parses the rows that differ from the previous call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.df = None
+        self.fingerprint = None
+        self.fetched_at = None
+        self.last_update = {}
+        self._raw_columns = None
+        self._raw_keys = None  # Keys of every raw row seen last time, valid date or not
+        self._keys = None  # Keys of the prepared rows, aligned with `df`
+        self._codes = None  # Raw metric codes of the prepared rows, before normalising
+        self._taxonomy = None
+        self._pop = None
+        self._changed = []  # (Pillar, Agg_Metric, Month) rows touched since `_pop` was built
+
+    def load(self, raw, fetched_at=None):
+        """Merge a freshly fetched raw frame and return the prepared dataset."""
+        raw = raw.reset_index(drop=True)
+        with self._lock:
+            started = time.perf_counter()
+            self.fetched_at = fetched_at or time.time()
+            keys = row_keys(raw)
+            if self.df is None or list(raw.columns) != self._raw_columns:
+                self._rebuild(raw, keys)
+                self.fingerprint = dataset_fingerprint(self.df)
+            elif keys.equals(self._raw_keys):
+                # Nothing changed since the last fetch
+                self.last_update = {"full": False, "rows_added": 0, "rows_removed": 0, "months": []}
+            else:
+                self._merge(raw, keys)
+                self.fingerprint = dataset_fingerprint(self.df)
+            self._raw_columns, self._raw_keys = list(raw.columns), keys
+            self.last_update["seconds"] = time.perf_counter() - started
+            return self.df
+
+    def _rebuild(self, raw, keys):
+        codes = raw["Agg_Metric"]
+        self._taxonomy = build_taxonomy(codes)
+        self.df = normalize_units(apply_taxonomy(parse_dates(raw.copy()), self._taxonomy))
+        self._keys, self._codes = keys[self.df.index], codes[self.df.index]
+        self._pop, self._changed = None, []
+        self.last_update = {"full": True, "rows_added": len(self.df), "rows_removed": 0, "months": []}
+
+    def _merge(self, raw, keys):
+        is_new = ~keys.isin(self._raw_keys)
+        is_kept = self._keys.isin(keys)
+        added = parse_dates(raw[is_new].copy())
+        removed = self.df[~is_kept]
+
+        # Carried-over rows move to where they now sit in the raw frame
+        kept = self.df[is_kept].copy()
+        kept.index = pd.Series(np.arange(len(raw)), index=keys).reindex(self._keys[is_kept]).to_numpy()
+        codes = pd.concat([self._codes[is_kept].set_axis(kept.index), added["Agg_Metric"]])
+
+        unseen = pd.Index(added["Agg_Metric"].dropna().unique()).difference(self._taxonomy.index)
+        gone = pd.Index(self._codes[~is_kept].dropna().unique()).difference(codes.dropna().unique())
+        if len(unseen) or len(gone):
+            # The set of codes changed, which can change how existing codes normalise
+            taxonomy = build_taxonomy(codes.sort_index())
+            if not taxonomy.reindex(self._taxonomy.index).equals(self._taxonomy):
+                # Existing codes now normalise differently, which can change their unit scaling too
+                return self._rebuild(raw, keys)
+            self._taxonomy = taxonomy
+            kept["Agg_Metric"] = codes[kept.index]
+            kept = apply_taxonomy(kept, taxonomy)
+        added = normalize_units(apply_taxonomy(added, self._taxonomy))
+
+        self.df = pd.concat([kept, added]).sort_index()
+        self._keys, self._codes = keys[self.df.index], codes[self.df.index]
+
+        # Rows carried over in a new relative order: the first row of a month is the one analytics keep
+        order = kept.index.to_numpy()
+        moved = kept[np.argsort(np.argsort(order, kind="stable")) != np.arange(len(order))]
+
+        changed = pd.concat([removed, added, moved])[SERIES_KEYS + ["Month"]]
+        if not changed.empty:
+            self._changed.append(changed.astype({"Agg_Metric": object}))
+        self.last_update = {
+            "full": False,
+            "rows_added": len(added),
+            "rows_removed": len(removed),
+            "months": sorted(changed["Month"].unique()),
+        }
+
+    def period_over_period(self):
+        """Period-over-period frame for `df`, refreshed only for series touched since last time."""
+        with self._lock:
+            changed = pd.concat(self._changed) if self._changed else self.df.iloc[:0][SERIES_KEYS + ["Month"]]
+            self._pop = update_period_over_period(self._pop, self.df, changed)
+            self._changed = []
+            return self._pop
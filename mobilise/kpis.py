@@ -0,0 +1,86 @@
+"""As-of KPI resolution for the pillar pages' cards.
+
+A card shows a metric's most recent value at or before the end of the
+selected date range, rather than whatever happens to sit in the latest month
+of a frame. All of a page's metrics are resolved together by one
+``merge_asof`` over month-sorted rows, and the MoM/YoY deltas for the
+resolved months are joined in the same pass.
+"""
+import numpy as np
+import pandas as pd
+
+from mobilise.analytics import change_text
+
+MISSING = "—"  # Shown on a card whose metric has no value by the range end
+ASOF_COLUMNS = ["Pillar", "Agg_Metric", "Metric_Category", "Metric_Kind", "Display_Format", "Month", "Agg_Value"]
+
+
+def asof_rows(df):
+    """Rows sorted by month with one value per pillar, metric, category and month.
+
+    The first row of each month wins, as the cards always took ``.iloc[0]``.
+    """
+    rows = df[ASOF_COLUMNS].drop_duplicates(["Pillar", "Agg_Metric", "Metric_Category", "Month"])
+    rows = rows.sort_values("Month", kind="stable")
+    return {pillar: group.drop(columns="Pillar") for pillar, group in rows.groupby("Pillar", sort=False)}
+
+
+def resolve_as_of(rows, as_of, pop=None):
+    """Each metric's latest value at or before `as_of`, in one merge_asof.
+
+    `rows` are one pillar's month-sorted rows (see `asof_rows`). Returns a
+    frame indexed by Agg_Metric with Metric_Kind, Display_Format, Month (of
+    the value found) and Agg_Value, plus Delta text from `pop` (that pillar's
+    period-over-period frame) when given. Metrics with nothing by `as_of`
+    are kept with NaN/NaT.
+    """
+    rows = rows.drop_duplicates(["Agg_Metric", "Month"])
+    metrics = rows.drop_duplicates("Agg_Metric")[["Agg_Metric", "Metric_Kind", "Display_Format"]]
+    wanted = metrics.assign(Month=pd.Timestamp(as_of)).astype({"Month": rows["Month"].dtype})
+    found = pd.merge_asof(
+        wanted,
+        rows[["Agg_Metric", "Month", "Agg_Value"]].assign(Value_Month=rows["Month"]),
+        on="Month", by="Agg_Metric", direction="backward",
+    )
+    found = found.drop(columns="Month").rename(columns={"Value_Month": "Month"}).set_index("Agg_Metric")
+    if pop is not None:
+        changes = pop.reindex(pd.MultiIndex.from_arrays([found.index, found["Month"]]))
+        found["Delta"] = [change_text(row) if pd.notna(month) else None
+                          for (_, row), month in zip(changes.iterrows(), found["Month"])]
+    return found
+
+
+class KPIs:
+    """One page's card values, each metric as of the end of the selected range."""
+
+    def __init__(self, table):
+        self.table = table
+
+    def value(self, metric, default=np.nan):
+        """The metric's value, or `default` when it has none by the range end."""
+        if metric not in self.table.index or pd.isna(self.table.at[metric, "Agg_Value"]):
+            return default
+        return self.table.at[metric, "Agg_Value"]
+
+    def text(self, metric, fmt=None):
+        """Card text for the metric: `fmt` (by default its unit's format) applied to its value, or an em dash."""
+        value = self.value(metric)
+        if pd.isna(value):
+            return MISSING
+        return (fmt or self.table.at[metric, "Display_Format"]).format(value)
+
+    def delta(self, metric):
+        if metric not in self.table.index or "Delta" not in self.table:
+            return None
+        return self.table.at[metric, "Delta"]
+
+    def note(self, metric):
+        """Help text naming the month the card's value comes from."""
+        if metric not in self.table.index or pd.isna(self.table.at[metric, "Month"]):
+            return "No value up to the end of the selected range"
+        return f"As of {self.table.at[metric, 'Month']:%b %Y}"
+
+    def total(self, kind):
+        """Sum of the metrics of one kind (e.g. all platforms' followers); NaN if none have values."""
+        values = self.table.loc[self.table["Metric_Kind"] == kind, "Agg_Value"]
+        return values.sum(min_count=1)
@@ -0,0 +1,113 @@
+"""Runtime metrics in the Prometheus text exposition format.
+
+Events are recorded as they happen (sheet fetches, loads and fallbacks,
+page reruns) into counters, gauges and histograms held in memory. Cache
+counters the app already keeps are read when the metrics are rendered, so
+they are never recorded twice. The text is served on the API's ``/metrics``
+and can be written to a file for node_exporter's textfile collector.
+"""
+import os
+import threading
+
+FETCH_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30)  # Seconds per sheet download
+RERUN_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)  # Seconds per script run
+
+# Metrics recorded as events happen: name -> (type, help, histogram buckets)
+METRIC_FAMILIES = {
+    "mobilise_sheet_fetch_seconds": ("histogram", "Google Sheets CSV download time, by kind (load or probe) "
+                                                  "and outcome (ok or error).", FETCH_BUCKETS),
+    "mobilise_data_loads_total": ("counter", "Script runs by where their data came from "
+                                             "(sheet, snapshot or local csv).", None),
+    "mobilise_sheet_fallbacks_total": ("counter", "Script runs whose sheet fetch failed, by the source "
+                                                  "shown instead.", None),
+    "mobilise_rerun_seconds": ("histogram", "Script run time from start to page drawn, by page.", RERUN_BUCKETS),
+    "mobilise_dataset_rows": ("gauge", "Rows in the tenant's current dataset.", None),
+    "mobilise_dataset_bytes": ("gauge", "Deep memory size of the tenant's current dataset.", None),
+    "mobilise_warmup_seconds": ("gauge", "Duration of the tenant's last warm-up.", None),
+}
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _number(value):
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value == int(value) else repr(float(value))
+
+
+def render_family(name, kind, help, samples):
+    """Exposition lines of one counter or gauge family; `samples` holds (labels dict, value) pairs."""
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+    lines += [f"{name}{_labels(sorted(labels.items()))} {_number(value)}" for labels, value in samples]
+    return lines
+
+
+class Metrics:
+    """Counters, gauges and histograms of METRIC_FAMILIES, one series per label set; thread-safe."""
+
+    def __init__(self, families=METRIC_FAMILIES):
+        self.families = families
+        self._series = {name: {} for name in families}  # name -> {labels: value or [bucket counts, sum, count]}
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._series[name][key] = self._series[name].get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self._series[name][tuple(sorted(labels.items()))] = value
+
+    def observe(self, name, value, **labels):
+        buckets = self.families[name][2]
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series[name].setdefault(key, [[0] * len(buckets), 0.0, 0])
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self, collected=()):
+        """The exposition text of every family, followed by `collected` ones.
+
+        `collected` holds (name, type, help, samples) families read at render
+        time, as `render_family` takes them.
+        """
+        lines = []
+        with self._lock:
+            for name, (kind, help, buckets) in self.families.items():
+                lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+                for key, value in self._series[name].items():
+                    if kind != "histogram":
+                        lines.append(f"{name}{_labels(key)} {_number(value)}")
+                        continue
+                    counts, total, count = value
+                    for bound, bucket_count in zip(buckets + (float("inf"),), counts + [count]):
+                        lines.append(f"{name}_bucket{_labels(key + (('le', _number(bound)),))} {bucket_count}")
+                    lines.append(f"{name}_sum{_labels(key)} {_number(total)}")
+                    lines.append(f"{name}_count{_labels(key)} {count}")
+        for name, kind, help, samples in collected:
+            lines += render_family(name, kind, help, samples)
+        return "\n".join(lines) + "\n"
+
+
+def write_metrics_file(path, text):
+    """Replace `path` with `text` in one step, so a scraper never reads a half-written file."""
+    # One temporary file per thread, as concurrent reruns in one process export at the same time
+    partial = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(partial, "w") as f:
+        f.write(text)
+    os.replace(partial, path)
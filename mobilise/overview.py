@@ -0,0 +1,77 @@
+"""All-pillar overview built in one grouped pass over the analytics frame.
+
+The headline metrics of every pillar are picked out of the period-over-period
+frame together, so the overview page never runs the pillar pages' own code
+or rescans the raw rows once per pillar.
+"""
+import numpy as np
+import pandas as pd
+
+from mobilise.analytics import SERIES_KEYS
+
+TREND_MONTHS = 12  # Length of the sparkline under each KPI
+
+# Headline metrics per pillar (code, card label), matching each page's top cards
+KEY_METRICS = {
+    1: [("Total_Volunteers", "Total Volunteers"),
+        ("Total_Actual_SignUps_Organic", "Organic Sign-ups"),
+        ("Total_Mentions_Earned", "Earned Media Mentions")],
+    2: [("%_Still_In_Same_Property_6mth", "Housing Retention (6m)"),
+        ("%_In_Share_House_or_Own_Home_6mth", "Stable Housing (6m)"),
+        ("%_Can_Pay_Rent_Unaided_6mth", "Financial Independence")],
+    3: [("Total_Volunteers", "Total Volunteers"),
+        ("Repeat_Volunteers", "Repeat Volunteers"),
+        ("Total_Participant_led_Engs", "Participant-Led Initiatives")],
+    4: [("Total_outreach_Engs", "Outreach Sessions"),
+        ("Total_outreach_individuals_unique", "Unique Individuals Engaged"),
+        ("Avg_eng_impact_score", "Avg Impact Score")],
+    5: [("Total_unique_participants_received_funds", "Participants Funded"),
+        ("Total_bill_amount_unique_participants", "Total Bill Amount (A$)"),
+        ("Avg_satisfaction_score_unique_participants", "Satisfaction Score")],
+    6: [("Total_event_attendee", "Event Attendees"),
+        ("Total_unique_donors", "Unique Donors"),
+        ("Total_pulse_responses", "Pulse Survey Responses")],
+}
+
+
+def key_metric_index(key_metrics=KEY_METRICS):
+    """(Pillar, Agg_Metric) index of every headline metric, in card order."""
+    pairs = [(pillar, code) for pillar, metrics in key_metrics.items() for code, _ in metrics]
+    return pd.MultiIndex.from_tuples(pairs, names=SERIES_KEYS)
+
+
+def build_overview(df, pop, key_metrics=KEY_METRICS):
+    """Per-pillar summary and the latest value, change and trend of each headline metric.
+
+    Returns ``(pillars, kpis)``. `pillars` is indexed by Pillar with
+    Pillar_Name, Latest_Month, Metrics and Rows. `kpis` has one row per
+    headline metric that has data: Pillar, Agg_Metric, Label, Month,
+    Agg_Value, Display_Format, MoM, MoM_pct, YoY, YoY_pct and Trend (up to
+    `TREND_MONTHS` recent values).
+    """
+    pillars = df.groupby("Pillar").agg(
+        Pillar_Name=("Pillar_Name", "first"),
+        Latest_Month=("Month", "max"),
+        Metrics=("Agg_Metric", "nunique"),
+        Rows=("Agg_Value", "size"),
+    )
+
+    wanted = key_metric_index(key_metrics)
+    rows = pop[pop.index.droplevel("Month").isin(wanted)]
+    grouped = rows.groupby(level=SERIES_KEYS, sort=False)
+    latest = grouped.tail(1).reset_index("Month")
+
+    # Sparklines: each series' recent months are contiguous in the sorted frame, so split one array
+    recent = grouped.tail(TREND_MONTHS)["Agg_Value"]
+    sizes = recent.groupby(level=SERIES_KEYS, sort=False).size().to_numpy()
+    latest["Trend"] = pd.Series(np.split(recent.to_numpy(), np.cumsum(sizes)[:-1]) if len(sizes) else [],
+                                index=latest.index, dtype=object)
+
+    labels = {(pillar, code): label for pillar, metrics in key_metrics.items() for code, label in metrics}
+    kpis = latest.reindex(wanted).dropna(subset=["Agg_Value"])
+    kpis.insert(0, "Label", [labels[key] for key in kpis.index])
+    formats = df.drop_duplicates(SERIES_KEYS).set_index(SERIES_KEYS)["Display_Format"]
+    kpis["Display_Format"] = formats.reindex(kpis.index).to_numpy()
+    columns = SERIES_KEYS + ["Label", "Month", "Agg_Value", "Display_Format", "MoM", "MoM_pct", "YoY", "YoY_pct",
+                             "Trend"]
+    return pillars, kpis.reset_index()[columns]
@@ -0,0 +1,81 @@
+"""One module per pillar page, imported only when that page is selected.
+
+Each module exposes ``render(data)`` taking a `mobilise.data.Dataset`, and
+may expose ``warm(data)`` building what the page shows with its default
+filters, so the warm-up (see mobilise.warmup) can fill the caches first.
+Pillars without a page yet map to ``None``. The overview and cross-pillar
+correlation pages come first.
+"""
+import importlib
+import time
+
+import pandas as pd
+
+import streamlit as st
+
+from mobilise.overview import KEY_METRICS
+
+PAGES = {
+    "Overview": "mobilise.pillars.overview",
+    "Correlations": "mobilise.pillars.correlations",
+    "1. Ignite a Movement": "mobilise.pillars.pillar1",
+    "2. Empower those experiencing homelessness": "mobilise.pillars.pillar2",
+    "3. Promote direct participation in the solution": "mobilise.pillars.pillar3",
+    "4. Expanded outreach opportunities": "mobilise.pillars.pillar4",
+    "5. Distribution of funds": "mobilise.pillars.pillar5",
+    "6. Engagement of the wider community": "mobilise.pillars.pillar6",
+    "7. A cultural shift in society": None,
+    "8. People progressing post-homelessness": None,
+    "9. Homelessness humanised through storytelling": None,
+    "10. New & innovative responses": None,
+}
+
+
+def render_page(page, data):
+    """Import the selected page's module on demand and draw it."""
+    module_name = PAGES.get(page)
+    if module_name is None:
+        return
+    importlib.import_module(module_name).render(data)
+
+
+def warm_pages(data):
+    """Run every page's ``warm(data)``; returns seconds spent per page."""
+    seconds = {}
+    for page, module_name in PAGES.items():
+        if module_name is None:
+            continue
+        began = time.perf_counter()
+        warm = getattr(importlib.import_module(module_name), "warm", None)
+        if warm is not None:
+            warm(data)
+        seconds[page] = time.perf_counter() - began
+    return seconds
+
+
+def warm_filters(data, pillar, categories=True):
+    """Filter a pillar over its whole date range, as its page does before the sidebar is touched.
+
+    With `categories` the page's category picker starts with every category
+    selected; pages without the picker pass False.
+    """
+    min_date, max_date, all_categories = data.pillar_domain(pillar)
+    if pd.isna(min_date):
+        return
+    selected_range = [min_date, max_date]
+    selected_categories = all_categories if categories else None
+    data.filter_pillar(pillar, selected_range, selected_categories)
+    data.kpis(pillar, selected_range, selected_categories)
+    data.projections(pillar)
+
+
+def render_skeleton(page):
+    """Outline of the selected page's headline cards, drawn while its data loads."""
+    pillar = int(page.split(".")[0]) if page[0].isdigit() else None
+    labels = [label for _, label in KEY_METRICS.get(pillar, [])]
+    if not labels:
+        st.caption("Loading data…")
+        return
+    for col, label in zip(st.columns(len(labels)), labels):
+        with col:
+            st.metric(label, "…")
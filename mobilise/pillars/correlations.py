@@ -0,0 +1,125 @@
+"""Correlations: which metrics move together, across every pillar."""
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from mobilise.correlations import CORRELATION_BASES, MIN_OVERLAP, strongest_pairs
+
+PAIR_LIST = 20  # Strongest pairs listed under the heatmap
+LABELLED_CELLS = 900  # Cell values are printed on the heatmap up to this many cells
+
+
+# Picking a pair only reruns the drill-down
+@st.fragment
+def pair_section(explorer, basis, columns):
+    st.subheader("🔍 Metric Pairs")
+    corr, overlap, _ = explorer[CORRELATION_BASES[basis]]
+    labels = explorer["labels"]
+    pairs = strongest_pairs(corr, overlap, labels, columns, limit=PAIR_LIST)
+    if pairs.empty:
+        st.info(f"No pair of these metrics shares {MIN_OVERLAP} or more months of data.")
+        return
+    st.dataframe(
+        pairs[["Metric A", "Metric B", "r", "Months"]],
+        column_config={"r": st.column_config.ProgressColumn("Correlation (r)", format="%.2f",
+                                                            min_value=-1, max_value=1)},
+        hide_index=True, use_container_width=True
+    )
+
+    # Any two metrics can be compared; the strongest pair is picked to start with
+    names = labels["Label"].to_numpy()
+    col1, col2 = st.columns(2)
+    with col1:
+        first = st.selectbox("Metric A", columns, index=int(np.flatnonzero(columns == pairs["A"].iloc[0])[0]),
+                             format_func=lambda i: names[i], key="corr_pair_a")
+    with col2:
+        second = st.selectbox("Metric B", columns, index=int(np.flatnonzero(columns == pairs["B"].iloc[0])[0]),
+                              format_func=lambda i: names[i], key="corr_pair_b")
+
+    series = explorer["matrix"].iloc[:, [first, second]]
+    if CORRELATION_BASES[basis] == "changes":
+        series = series.diff()
+    shared = series.dropna()
+    r = corr[first, second]
+    st.caption(f"r = {r:+.2f} over {overlap[first, second]} shared months" if not np.isnan(r)
+               else f"Fewer than {MIN_OVERLAP} shared months, or one metric doesn't vary over them.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_series = go.Figure([
+            go.Scatter(x=series.index, y=series.iloc[:, 0], mode="lines+markers", name=names[first]),
+            go.Scatter(x=series.index, y=series.iloc[:, 1], mode="lines+markers", name=names[second], yaxis="y2"),
+        ])
+        fig_series.update_layout(
+            title=f"{basis} over time",
+            yaxis=dict(title=names[first]),
+            yaxis2=dict(title=names[second], overlaying="y", side="right", showgrid=False),
+            legend=dict(orientation="h", y=-0.2),
+        )
+        st.plotly_chart(fig_series, use_container_width=True)
+    with col2:
+        fig_scatter = go.Figure(go.Scatter(
+            x=shared.iloc[:, 0], y=shared.iloc[:, 1], mode="markers", text=shared.index.strftime("%b %Y"),
+            hovertemplate="%{text}<br>%{x:,.2f}, %{y:,.2f}<extra></extra>", name="Months",
+        ))
+        if len(shared) >= 2 and shared.iloc[:, 0].nunique() > 1:
+            slope, intercept = np.polyfit(shared.iloc[:, 0], shared.iloc[:, 1], 1)
+            ends = np.array([shared.iloc[:, 0].min(), shared.iloc[:, 0].max()])
+            fig_scatter.add_trace(go.Scatter(x=ends, y=intercept + slope * ends, mode="lines",
+                                             line={"dash": "dash"}, name="Least-squares line"))
+        fig_scatter.update_layout(title="One point per shared month", xaxis_title=names[first],
+                                  yaxis_title=names[second], showlegend=False)
+        st.plotly_chart(fig_scatter, use_container_width=True)
+
+
+def warm(data):
+    data.correlations()
+
+
+def render(data):
+    st.header("🔗 Correlations")
+    st.caption("How closely each pair of metrics moves together month to month, across every pillar. "
+               "Metrics that move together are placed next to each other. Correlation is not causation: "
+               "two metrics that both grow over time correlate strongly, so compare month-over-month "
+               "changes to see whether they also rise and fall together.")
+
+    explorer = data.correlations()
+    labels = explorer["labels"]
+    if labels.empty:
+        st.warning("No data available yet.")
+        return
+
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        basis = st.radio("Correlate", list(CORRELATION_BASES), key="corr_basis")
+    with col2:
+        available = sorted(labels["Pillar"].unique())
+        pillars = st.multiselect("Pillars", available, default=available, format_func=lambda p: f"Pillar {p}",
+                                 key="corr_pillars")
+
+    corr, overlap, order = explorer[CORRELATION_BASES[basis]]
+    columns = order[np.isin(labels["Pillar"].to_numpy()[order], pillars)]
+    if len(columns) < 2:
+        st.info("Pick pillars with at least two metrics between them.")
+        return
+
+    names = labels["Label"].to_numpy()[columns]
+    fig_corr = go.Figure(go.Heatmap(
+        z=corr[np.ix_(columns, columns)],
+        x=names, y=names,
+        customdata=overlap[np.ix_(columns, columns)],
+        colorscale="RdBu", zmin=-1, zmax=1, zmid=0,
+        texttemplate="%{z:.2f}" if len(columns) ** 2 <= LABELLED_CELLS else None,
+        hovertemplate="%{y}<br>%{x}<br>r = %{z:.2f} over %{customdata} months<extra></extra>",
+        colorbar=dict(title="r"),
+    ))
+    fig_corr.update_layout(
+        height=max(500, 14 * len(columns) + 200),
+        yaxis=dict(autorange="reversed", showticklabels=len(columns) <= 60),
+        xaxis=dict(showticklabels=len(columns) <= 60, tickangle=-45),
+        title=f"{basis}: {len(columns)} metrics",
+    )
+    st.plotly_chart(fig_corr, use_container_width=True)
+    st.caption(f"Blank cells share fewer than {MIN_OVERLAP} months of data, or one of the metrics doesn't vary.")
+
+    pair_section(explorer, basis, columns)
@@ -0,0 +1,44 @@
+"""Overview: every pillar's headline KPIs, latest month and trend on one page."""
+import streamlit as st
+
+from mobilise.analytics import change_text
+from mobilise.pillars import PAGES
+from mobilise.units import format_value
+
+
+def warm(data):
+    data.overview()
+
+
+def render(data):
+    st.header("🧭 Overview")
+    st.caption("Latest value, change and 12-month trend of each pillar's headline metrics. "
+               "Open a pillar page from the sidebar for the full breakdown.")
+
+    pillars, kpis = data.overview()
+    for title in PAGES:
+        if not title[0].isdigit():
+            continue
+        pillar = int(title.split(".")[0])
+        st.subheader(title)
+        if pillar not in pillars.index:
+            st.caption("No data yet.")
+            continue
+
+        summary = pillars.loc[pillar]
+        st.caption(f"Latest month: {summary['Latest_Month']:%b %Y} · {summary['Metrics']} metrics")
+        cards = kpis[kpis["Pillar"] == pillar]
+        if cards.empty:
+            st.caption("None of this pillar's headline metrics have data.")
+            continue
+        for col, (_, card) in zip(st.columns(len(cards)), cards.iterrows()):
+            with col:
+                st.metric(
+                    card["Label"],
+                    format_value(card["Agg_Value"], card["Display_Format"]),
+                    delta=change_text(card),
+                    chart_data=card["Trend"],
+                    chart_type="line",
+                    border=True,
+                    help=f"{card['Month']:%b %Y}",
+                )
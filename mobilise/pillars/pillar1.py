@@ -0,0 +1,249 @@
+"""Pillar 1: Ignite a Movement."""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from mobilise.components import metric_details_section, time_series_section
+from mobilise.derived import DERIVED_METRICS
+from mobilise.kpis import MISSING
+from mobilise.pillars import warm_filters
+
+
+def warm(data):
+    warm_filters(data, 1)
+
+
+def render(data):
+    st.header("Ignite a Movement")
+
+    # Filters
+    st.sidebar.subheader("Filters (Page 1)")
+    min_date, max_date, categories = data.pillar_domain(1)
+    selected_range = st.sidebar.date_input("Date Range", [min_date, max_date])
+    
+    # Ensure we have a range
+    if len(selected_range) == 1:
+        selected_range = [selected_range[0], selected_range[0]]
+    
+    selected_categories = st.sidebar.multiselect("📂 Metric Category", categories, default=categories)
+
+    # Apply filters
+    df_p1_filtered = data.filter_pillar(1, selected_range, selected_categories)
+
+    # Each card shows its metric's latest value up to the end of the selected range
+    kpis = data.kpis(1, selected_range, selected_categories)
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Total Volunteers", kpis.text("Total_Volunteers"), delta=kpis.delta("Total_Volunteers"),
+                  help=kpis.note("Total_Volunteers"))
+
+    with col2:
+        st.metric("Organic Sign-ups", kpis.text("Total_Actual_SignUps_Organic"),
+                  delta=kpis.delta("Total_Actual_SignUps_Organic"), help=kpis.note("Total_Actual_SignUps_Organic"))
+
+    with col3:
+        total_followers = kpis.total("followers")
+        st.metric("Total Social Media Followers", MISSING if pd.isna(total_followers) else f"{total_followers:,.0f}")
+
+    with col4:
+        total_engagements = kpis.total("engagements")
+        st.metric("Total Engagements", MISSING if pd.isna(total_engagements) else f"{total_engagements:,.0f}")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Earned Media Mentions", kpis.text("Total_Mentions_Earned"), delta=kpis.delta("Total_Mentions_Earned"),
+                  help=kpis.note("Total_Mentions_Earned"))
+
+    with col2:
+        st.metric("Positive Sentiment Score", kpis.text("Total_Positive_Mentions_Earned", "{:,.0f}%"),
+                  delta=kpis.delta("Total_Positive_Mentions_Earned"), help=kpis.note("Total_Positive_Mentions_Earned"))
+
+    # Main visualizations
+    st.header("📈 Detailed Analytics")
+
+    # Create tabs for different views
+    tab1, tab2, tab3 = st.tabs(["📊 Category Overview", "📈 Time Series", "🔍 Metric Details"])
+
+    with tab1:
+        # ========== ROW 1: VOLUNTEER METRICS ==========
+        st.header("👥 Volunteer Metrics")
+        
+        # Volunteers metrics with retention analysis
+        volunteers_data = df_p1_filtered[df_p1_filtered['Metric_Category'] == 'Volunteers']
+        if not volunteers_data.empty:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Create volunteer metrics chart
+                # Sheet counts only; the derived rates and ratios have their own cards below
+                volunteer_counts = [code for code in volunteers_data['Agg_Metric'].unique() if code not in DERIVED_METRICS]
+                fig_volunteers = px.bar(
+                    data.aggregate_metrics(volunteers_data, 1, selected_range, selected_categories,
+                                           metrics=volunteer_counts, metric_category='Volunteers'),
+                    x='Agg_Metric', y='Agg_Value',
+                    title="👥 Volunteer Metrics Overview",
+                    color='Agg_Metric'
+                )
+                fig_volunteers.update_layout(showlegend=False)
+                st.plotly_chart(fig_volunteers, use_container_width=True)
+            
+            with col2:
+                # Create engagement distribution chart
+                total_vols = kpis.value('Total_Volunteers', 0)
+                repeat_vols = kpis.value('Repeat_Volunteers', 0)
+                active_volunteers = max(kpis.value('Total_One_Time_Volunteers', 0), 0)
+                
+                engagement_dist = pd.DataFrame({
+                    'Engagement Level': ['One-time Volunteers', 'Repeat Volunteers'],
+                    'Count': [active_volunteers, repeat_vols],
+                    'Percentage': [((active_volunteers/total_vols)*100) if total_vols > 0 else 0, 
+                                ((repeat_vols/total_vols)*100) if total_vols > 0 else 0]
+                })
+                
+                fig_retention = px.pie(
+                    engagement_dist, 
+                    values='Count', 
+                    names='Engagement Level',
+                    title="🎯 Volunteer Engagement Distribution",
+                    color_discrete_map={'One-time Volunteers': '#ff7f7f', 'Repeat Volunteers': '#7fbf7f'}
+                )
+                st.plotly_chart(fig_retention, use_container_width=True)
+            
+            # Volunteer retention metrics below charts
+            st.subheader("🔄 Volunteer Retention & Engagement")
+            
+            col_a, col_b, col_c = st.columns(3)
+            
+            with col_a:
+                st.metric("Retention Rate", kpis.text("%_Volunteer_Retention"),
+                          delta=kpis.delta("%_Volunteer_Retention"), help="Percentage of volunteers with ≥2 engagements")
+            
+            with col_b:
+                st.metric("Avg Engagements per Volunteer", kpis.text("Avg_Engagements_per_Volunteer"),
+                          delta=kpis.delta("Avg_Engagements_per_Volunteer"), help="Average outreach engagements per volunteer")
+            
+            with col_c:
+                st.metric("One-time Volunteers", kpis.text("Total_One_Time_Volunteers"),
+                          delta=kpis.delta("Total_One_Time_Volunteers"), help="Volunteers with only 1 engagement")
+        
+        # ========== ROW 2: AWARENESS METRICS ==========
+        st.header("📱 Awareness Metrics")
+        
+        # Social media followers
+        social_followers = df_p1_filtered[df_p1_filtered['Metric_Kind'] == 'followers']
+        if not social_followers.empty:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                fig_social = px.pie(
+                    social_followers.groupby('Platform', observed=True)['Agg_Value'].mean().reset_index(),
+                    values='Agg_Value', names='Platform',
+                    title="📱 Social Media Followers Distribution"
+                )
+                st.plotly_chart(fig_social, use_container_width=True)
+            
+            with col2:
+                # Social media followers bar chart for better comparison
+                fig_social_bar = px.bar(
+                    social_followers.groupby('Platform', observed=True)['Agg_Value'].mean().reset_index(),
+                    x='Platform', y='Agg_Value',
+                    title="📊 Followers by Platform",
+                    color='Platform'
+                )
+                fig_social_bar.update_layout(showlegend=False)
+                st.plotly_chart(fig_social_bar, use_container_width=True)
+            
+            # Awareness metrics summary
+            st.subheader("📈 Awareness Summary")
+            
+            col_a, col_b, col_c, col_d = st.columns(4)
+            
+            with col_a:
+                total_followers = social_followers['Agg_Value'].sum()
+                st.metric("Total Social Followers", f"{total_followers:,.0f}")
+            
+            with col_b:
+                visits = kpis.value('Total_Visits_SignUps_Organic', 0)
+
+                st.metric("Website Visits", f"{visits:,.0f}", help="Visits to sign-up page (awareness driving action)")
+
+            
+
+            with col_c:
+                platform_count = len(social_followers['Platform'].unique())
+                st.metric("Active Platforms", platform_count)
+            
+            with col_d:
+                st.metric("Reach-to-Visit Rate", kpis.text("%_Reach_to_Visit"),
+                          delta=kpis.delta("%_Reach_to_Visit"), help="Website visits per social follower")
+        
+        # ========== ROW 3: ENGAGEMENT METRICS ==========
+        st.header("🎯 Engagement Analysis")
+
+        engagement_data = df_p1_filtered[df_p1_filtered['Metric_Category'] == 'Engagement']
+        if not engagement_data.empty:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Engagement by platform
+                engagement_platform = engagement_data[engagement_data['Metric_Kind'] == 'engagements']
+                if not engagement_platform.empty:
+                    fig_eng = px.bar(
+                        engagement_platform.groupby('Platform', observed=True)['Agg_Value'].mean().reset_index(),
+                        x='Platform', y='Agg_Value',
+                        title="📊 Engagement by Platform",
+                        color='Platform'
+                    )
+                    st.plotly_chart(fig_eng, use_container_width=True)
+            
+            with col2:
+                # Conversion funnel (visits to sign-ups)
+                visits = kpis.value('Total_Visits_SignUps_Organic', 0)
+                signups = kpis.value('Total_Actual_SignUps_Organic', 0)
+                
+                if visits > 0:
+                    # Simple funnel visualization
+                    fig_funnel = go.Figure(go.Funnel(
+                        y=["Website Visits", "Sign-ups"],
+                        x=[visits, signups],
+                        textinfo="value+percent initial"
+                    ))
+                    fig_funnel.update_layout(title="🔄 Conversion Funnel")
+                    st.plotly_chart(fig_funnel, use_container_width=True)
+            
+            # Engagement metrics summary
+            st.subheader("📊 Engagement Summary")
+            
+            col_a, col_b, col_c = st.columns(3)
+            
+            with col_a:
+                st.metric("Conversion Rate (Visits → Sign-ups)", kpis.text("%_Conversion_Visits_to_SignUps"),
+                          delta=kpis.delta("%_Conversion_Visits_to_SignUps"))
+            
+            with col_b:
+                total_engagements = engagement_platform['Agg_Value'].sum() if not engagement_platform.empty else 0
+                st.metric("Total Platform Engagements", f"{total_engagements:,.0f}")
+            
+            with col_c:
+                st.metric("Overall Engagement Rate", kpis.text("%_Engagement_Rate"),
+                          delta=kpis.delta("%_Engagement_Rate"), help="Total engagements / Total followers")
+
+            # Derived rates are monthly metrics, so they chart like any other series
+            rate_codes = ["%_Conversion_Visits_to_SignUps", "%_Engagement_Rate", "%_Reach_to_Visit"]
+            rates = df_p1_filtered[df_p1_filtered['Agg_Metric'].isin(rate_codes)]
+            if not rates.empty:
+                fig_rates = px.line(
+                    rates, x='Date', y='Agg_Value', color='Metric_Name', markers=True,
+                    title="📈 Conversion & Engagement Rates Over Time",
+                    labels={'Agg_Value': 'Rate (%)', 'Metric_Name': 'Rate'}
+                )
+                st.plotly_chart(fig_rates, use_container_width=True)
+
+    with tab2:
+        time_series_section(df_p1_filtered, data.period_over_period(1), data.projections(1))
+
+    with tab3:
+        metric_details_section(df_p1_filtered)
@@ -0,0 +1,557 @@
+"""Pillar 2: Empower those experiencing homelessness."""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from mobilise.cohorts import cohort_matrix
+from mobilise.components import metric_details_section, time_series_section
+from mobilise.kpis import MISSING
+from mobilise.pillars import warm_filters
+
+COHORT_VIEWS = {"Change from 3 to 6 months": "change", "At 3 months": "3mth", "At 6 months": "6mth"}
+COHORT_UNITS = {"%": "Percentages", "score": "Scores"}
+COHORT_LABELLED_CELLS = 600  # Cell values are printed on the heatmap up to this many cells
+
+
+# Switching the view only reruns this section
+@st.fragment
+def cohort_section(data, selected_range):
+    st.subheader("👥 Outcomes by Intake Cohort")
+    st.caption("Each row is the group of participants who started in that month: their 3-month outcomes are "
+               "reported 3 months later and their 6-month outcomes 6 months later.")
+    values, outcomes = data.cohorts(2)
+    if values.empty:
+        st.info("No 3- or 6-month outcome metrics to build cohorts from.")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        view = st.radio("Show", list(COHORT_VIEWS), horizontal=True, key="p2_cohort_view")
+    with col2:
+        units = [unit for unit in COHORT_UNITS if (outcomes["Unit"] == unit).any()]
+        unit = st.radio("Outcomes", units, format_func=COHORT_UNITS.get, horizontal=True, key="p2_cohort_unit")
+
+    # Cohorts whose 3- or 6-month outcomes fall in the selected date range
+    start = pd.to_datetime(selected_range[0]) - pd.DateOffset(months=6)
+    end = pd.to_datetime(selected_range[-1]) - pd.DateOffset(months=3)
+    matrix = cohort_matrix(values, outcomes[outcomes["Unit"] == unit], COHORT_VIEWS[view], start, end)
+    if matrix.empty:
+        st.info("No cohorts with these outcomes in the selected date range.")
+        return
+
+    change = COHORT_VIEWS[view] == "change"
+    suffix = "pp" if unit == "%" and change else "%" if unit == "%" else ""
+    labelled = matrix.size <= COHORT_LABELLED_CELLS
+    fig_cohorts = go.Figure(go.Heatmap(
+        z=matrix.to_numpy(),
+        x=outcomes.loc[matrix.columns, "Name"].to_numpy(),
+        y=matrix.index.strftime("%b %Y"),
+        colorscale="RdYlGn" if change else "Blues",
+        zmid=0 if change else None,
+        texttemplate=f"%{{z:{'+' if change else ''}.1f}}{suffix}" if labelled else None,
+        hovertemplate=f"Intake %{{y}}<br>%{{x}}: %{{z:.1f}}{suffix}<extra></extra>",
+        colorbar=dict(title=suffix or None),
+    ))
+    fig_cohorts.update_layout(
+        height=max(400, 22 * len(matrix) + 160),
+        yaxis=dict(autorange="reversed", title="Intake month"),
+        xaxis=dict(tickangle=-30),
+        title=f"{COHORT_UNITS[unit]}: {view.lower()}, {len(matrix)} cohorts",
+    )
+    st.plotly_chart(fig_cohorts, use_container_width=True, key="cohort_heatmap_page2")
+
+
+def warm(data):
+    # No category picker on this page
+    warm_filters(data, 2, categories=False)
+    data.cohorts(2)
+
+
+def render(data):
+    st.header("🏠 Empower those experiencing homelessness")
+    # st.markdown("### Tracking progress toward housing stability, financial independence, and wellbeing")
+    
+    min_date, max_date, _ = data.pillar_domain(2)
+
+    if pd.isna(min_date):
+        st.warning("No data available for this pillar yet.")
+        st.stop()
+
+    # Filters - Page 2 specific
+    st.sidebar.subheader("Filters (Page 2)")
+    selected_range = st.sidebar.date_input("Date Range", [min_date, max_date], key="p2_date")
+    
+    # Ensure we have a range
+    if len(selected_range) == 1:
+        selected_range = [selected_range[0], selected_range[0]]
+    
+    # Time Period Filter (3-month vs 6-month outcomes)
+    time_period = st.sidebar.selectbox(
+        "📅 Outcome Time Period",
+        ["3-month", "6-month", "Both"],
+        index=2
+    )
+    
+    # Demographic Filters (for future use when disaggregated data is available)
+    st.sidebar.subheader("🎯 Focus Areas")
+    
+    # Housing Type Focus
+    st.sidebar.multiselect(
+        "🏠 Housing Types",
+        ["Share House/Own Home", "Family/Friends", "Social Housing", "Crisis/Emergency", "Without Housing"],
+        default=["Share House/Own Home", "Family/Friends", "Social Housing", "Crisis/Emergency", "Without Housing"]
+    )
+    
+    # Outcome Categories
+    st.sidebar.multiselect(
+        "📊 Outcome Categories",
+        ["Housing Stability", "Financial Independence", "Safety & Wellbeing", "Housing Retention"],
+        default=["Housing Stability", "Financial Independence", "Safety & Wellbeing", "Housing Retention"]
+    )
+
+    # Apply filters (date range and 3-month vs 6-month outcomes)
+    period_codes = {"3-month": "3mth", "6-month": "6mth"}
+    df_p2_filtered = data.filter_pillar(2, selected_range, period=period_codes.get(time_period))
+
+    # Cards and charts show each metric's latest value up to the end of the selected range,
+    # for both outcome periods so the 6m cards can compare against 3m
+    kpis = data.kpis(2, selected_range)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        # Housing Stability - Same Property 6 months
+        same_property_6m = kpis.value('%_Still_In_Same_Property_6mth')
+        same_property_3m = kpis.value('%_Still_In_Same_Property_3mth')
+        delta_same_property = same_property_6m - same_property_3m
+        st.metric(
+            "Housing Retention (6m)", 
+            kpis.text('%_Still_In_Same_Property_6mth', "{:.0f}%"),
+            delta=f"{delta_same_property:+.0f}pp from 3m" if pd.notna(delta_same_property) and delta_same_property != 0 else None,
+            help="Percentage still in same property after 6 months"
+        )
+
+    with col2:
+        # Stable Housing (Share House + Own Home)
+        stable_6m = kpis.value('%_In_Share_House_or_Own_Home_6mth')
+        stable_3m = kpis.value('%_In_Share_House_or_Own_Home_3mth')
+        delta_stable = stable_6m - stable_3m
+        st.metric(
+            "Stable Housing (6m)", 
+            kpis.text('%_In_Share_House_or_Own_Home_6mth', "{:.0f}%"),
+            delta=f"{delta_stable:+.0f}pp from 3m" if pd.notna(delta_stable) and delta_stable != 0 else None,
+            help="Percentage in share house or own home"
+        )
+
+    with col3:
+        # Financial Independence (Can pay rent unaided)
+        fin_indep_6m = kpis.value('%_Can_Pay_Rent_Unaided_6mth')
+        fin_indep_3m = kpis.value('%_Can_Pay_Rent_Unaided_3mth')
+        delta_fin_indep = fin_indep_6m - fin_indep_3m
+        st.metric(
+            "Financial Independence", 
+            kpis.text('%_Can_Pay_Rent_Unaided_6mth', "{:.0f}%"),
+            delta=f"{delta_fin_indep:+.0f}pp from 3m" if pd.notna(delta_fin_indep) and delta_fin_indep != 0 else None,
+            help="Can pay rent without assistance"
+        )
+
+    with col4:
+        # Crisis Support Reduction (inverse of running out of rent money)
+        crisis_reduced_6m = 100 - kpis.value('%_ran_out_of_rent_money_6mth')
+        crisis_reduced_3m = 100 - kpis.value('%_ran_out_of_rent_money_3mth')
+        delta_crisis = crisis_reduced_6m - crisis_reduced_3m
+        st.metric(
+            "Financial Stability", 
+            MISSING if pd.isna(crisis_reduced_6m) else f"{crisis_reduced_6m:.0f}%",
+            delta=f"{delta_crisis:+.0f}pp improvement" if pd.notna(delta_crisis) and delta_crisis != 0 else None,
+            help="Percentage NOT running out of rent money"
+        )
+
+    # ========== MAIN ANALYSIS TABS ==========
+    st.header("📈 Detailed Impact Analysis")
+    
+    tab1, tab2, tab3, tab4 = st.tabs([
+       "📊 Category Overview",
+       "📈 Time Series",
+       "🔍 Metric Details",
+       "👥 Cohorts"
+    ])
+    
+    with tab1:
+        # ========== ROW 1: HOUSING STABILITY ==========
+        st.subheader("🏠 Housing Stability & Progress")
+        
+        # Housing outcomes comparison (3m vs 6m)
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Housing distribution at 6 months
+            housing_metrics_6m = [
+                ('%_In_Share_House_or_Own_Home_6mth', 'Share House/Own Home'),
+                ('%_Living_With_Family_or_Friends_6mth', 'Family/Friends'),
+                ('%_in_social_housing_6mth', 'Social Housing'),
+                ('%_in_crisis_or_emergency_accomm_6mth', 'Crisis/Emergency'),
+                ('%_without_housing_6mth', 'Without Housing')
+            ]
+            
+            housing_data_6m = []
+            for metric, label in housing_metrics_6m:
+                value = kpis.value(metric, 0)
+                housing_data_6m.append({'Housing Type': label, 'Percentage': value})
+            
+            housing_df_6m = pd.DataFrame(housing_data_6m)
+            
+            fig_housing_pie = px.pie(
+                housing_df_6m, 
+                values='Percentage', 
+                names='Housing Type',
+                title="🏠 Housing Distribution (6 months)",
+                color_discrete_map={
+                    'Share House/Own Home': '#2E8B57',  # Forest green
+                    'Family/Friends': '#90EE90',        # Light green
+                    'Social Housing': '#FFA500',        # Orange
+                    'Crisis/Emergency': '#FF6347',      # Tomato
+                    'Without Housing': '#DC143C'        # Crimson
+                }
+            )
+            st.plotly_chart(fig_housing_pie, use_container_width=True)
+        
+        with col2:
+            # Housing progression (3m to 6m comparison)
+            housing_metrics_comparison = [
+                ('Share House/Own Home', '%_In_Share_House_or_Own_Home_3mth', '%_In_Share_House_or_Own_Home_6mth'),
+                ('Family/Friends', '%_Living_With_Family_or_Friends_3mth', '%_Living_With_Family_or_Friends_6mth'),
+                ('Social Housing', '%_in_social_housing_3mth', '%_in_social_housing_6mth'),
+                ('Crisis/Emergency', '%_in_crisis_or_emergency_accomm_3mth', '%_in_crisis_or_emergency_accomm_6mth'),
+                ('Without Housing', '%_without_housing_3mth', '%_without_housing_6mth')
+            ]
+            
+            comparison_data = []
+            for housing_type, metric_3m, metric_6m in housing_metrics_comparison:
+                val_3m = kpis.value(metric_3m, 0)
+                val_6m = kpis.value(metric_6m, 0)
+                comparison_data.append({'Housing Type': housing_type, 'Period': '3 months', 'Percentage': val_3m})
+                comparison_data.append({'Housing Type': housing_type, 'Period': '6 months', 'Percentage': val_6m})
+            
+            comparison_df = pd.DataFrame(comparison_data)
+            
+            fig_housing_comparison = px.bar(
+                comparison_df,
+                x='Housing Type',
+                y='Percentage',
+                color='Period',
+                barmode='group',
+                title="📈 Housing Progress: 3m vs 6m Outcomes",
+                color_discrete_map={'3 months': '#87CEEB', '6 months': '#4682B4'}
+            )
+            fig_housing_comparison.update_layout(xaxis_tickangle=-45)
+            st.plotly_chart(fig_housing_comparison, use_container_width=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            home_safety_6m = kpis.value('Avg_Home_Safety_Score_6mth')
+            home_safety_3m = kpis.value('Avg_Home_Safety_Score_3mth')
+            st.metric(
+                "Home Safety Score", 
+                kpis.text('Avg_Home_Safety_Score_6mth', "{:.1f}/5"),
+                delta=f"{home_safety_6m - home_safety_3m:+.1f} from 3m" if pd.notna(home_safety_6m - home_safety_3m) and home_safety_3m != 0 else None
+            )
+        
+        with col2:
+            area_safety_6m = kpis.value('Avg_Area_Safety_Score_6mth')
+            area_safety_3m = kpis.value('Avg_Area_Safety_Score_3mth')
+            st.metric(
+                "Area Safety Score", 
+                kpis.text('Avg_Area_Safety_Score_6mth', "{:.1f}/5"),
+                delta=f"{area_safety_6m - area_safety_3m:+.1f} from 3m" if pd.notna(area_safety_6m - area_safety_3m) and area_safety_3m != 0 else None
+            )
+        
+        with col3:
+            st.metric(
+                "Housing Independence", 
+                kpis.text('Avg_housing_independence_score_6mth', "{:.1f}/5"),
+                help="Self-reported housing independence score"
+            )
+
+        # ========== ROW 2: FINANCIAL STABILITY ==========
+        st.subheader("💰 Financial Stability & Independence")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Financial challenges - what people struggle to pay for
+            financial_challenges = [
+                ('%_unable_pay_utility_expenses_6mth', 'Utilities'),
+                ('%_unable_pay_car_expenses_6mth', 'Car Expenses'),
+                ('%_unable_pay_food_expenses_6mth', 'Food'),
+                ('%_unable_pay_debts_6mth', 'Debts'),
+                ('%_ran_out_of_rent_money_6mth', 'Rent')
+            ]
+            
+            challenges_data = []
+            for metric, expense_type in financial_challenges:
+                value = kpis.value(metric, 0)
+                challenges_data.append({'Expense Type': expense_type, 'Unable to Pay (%)': value})
+            
+            challenges_df = pd.DataFrame(challenges_data)
+            
+            fig_challenges = px.bar(
+                challenges_df,
+                x='Unable to Pay (%)',
+                y='Expense Type',
+                orientation='h',
+                title="💸 Financial Challenges (6 months)",
+                color='Unable to Pay (%)',
+                color_continuous_scale='Reds'
+            )
+            st.plotly_chart(fig_challenges, use_container_width=True)
+        
+        with col2:
+            # Financial stability improvement - Crisis support usage
+            crisis_support_data = []
+            
+            # Current crisis support usage
+            crisis_6m = kpis.value('%_ran_out_of_rent_money_6mth', 0)
+            
+            # Create pie chart for crisis support reliance
+            crisis_support_data = [
+                {'Category': 'Crisis Support Used', 'Percentage': crisis_6m},
+                {'Category': 'Self-Sufficient', 'Percentage': 100 - crisis_6m}
+            ]
+            
+            crisis_df = pd.DataFrame(crisis_support_data)
+            
+            fig_crisis_pie = px.pie(
+                crisis_df,
+                values='Percentage',
+                names='Category',
+                title="🆘 Crisis Support Reliance (6 months)",
+                color_discrete_map={
+                    'Crisis Support Used': '#FF6B6B',
+                    'Self-Sufficient': '#4ECDC4'
+                }
+            )
+            st.plotly_chart(fig_crisis_pie, use_container_width=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Rent payment capacity progression
+            rent_payment_data = []
+            rent_metrics = [
+                ('%_paid_1_3_weeks_rent_3mth', '%_paid_1_3_weeks_rent_6mth', '1-3 weeks'),
+                ('%_paid_1_month_rent_3mth', '%_paid_1_month_rent_6mth', '1 month'),
+                ('%_paid_most_2_month_rent_3mth', '%_paid_most_2_month_rent_6mth', '1-2 months')
+            ]
+            
+            for metric_3m, metric_6m, period in rent_metrics:
+                val_3m = kpis.value(metric_3m, 0)
+                val_6m = kpis.value(metric_6m, 0)
+                rent_payment_data.append({'Rent Period': period, 'Timeline': '3 months', 'Percentage': val_3m})
+                rent_payment_data.append({'Rent Period': period, 'Timeline': '6 months', 'Percentage': val_6m})
+            
+            rent_df = pd.DataFrame(rent_payment_data)
+            
+            fig_rent = px.bar(
+                rent_df,
+                x='Rent Period',
+                y='Percentage',
+                color='Timeline',
+                barmode='group',
+                title="🏠 Rent Payment Capacity Progress",
+                color_discrete_map={'3 months': '#FFB6C1', '6 months': '#FF69B4'}
+            )
+            st.plotly_chart(fig_rent, use_container_width=True)
+        
+        with col2:
+            # Spending priorities - Long-term vs Crisis needs
+            spending_data = []
+            
+            # Long-term needs (can pay rent in advance)
+            long_term_rent = kpis.value('%_paid_most_2_month_rent_6mth', 0)
+            
+            # Crisis needs (running out of rent money)
+            crisis_needs = kpis.value('%_ran_out_of_rent_money_6mth', 0)
+            
+            # Medium-term stability (can pay current month)
+            medium_term = 100 - long_term_rent - crisis_needs
+            
+            spending_data = [
+                {'Category': 'Long-term Security (1-2 months rent)', 'Percentage': long_term_rent},
+                {'Category': 'Medium-term Stability', 'Percentage': medium_term},
+                {'Category': 'Crisis Mode (Running out)', 'Percentage': crisis_needs}
+            ]
+            
+            spending_df = pd.DataFrame(spending_data)
+            
+            fig_spending = px.pie(
+                spending_df,
+                values='Percentage',
+                names='Category',
+                title="💰 Financial Capacity Categories (6 months)",
+                color_discrete_map={
+                    'Long-term Security (1-2 months rent)': '#2E8B57',
+                    'Medium-term Stability': '#FFA500',
+                    'Crisis Mode (Running out)': '#DC143C'
+                }
+            )
+            st.plotly_chart(fig_spending, use_container_width=True)
+        
+        # ========== ROW 3: SAFETY & WELLBEING ==========
+        st.subheader("🛡️ Safety, Wellbeing & Confidence")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Safety scores radar chart
+            safety_data = []
+            safety_metrics = [
+                ('Home Safety', 'Avg_Home_Safety_Score_6mth', 'Avg_Home_Safety_Score_3mth'),
+                ('Area Safety', 'Avg_Area_Safety_Score_6mth', 'Avg_Area_Safety_Score_3mth'),
+                ('Home Care', 'Avg_home_care_score_6mth', 'Avg_home_care_score_3mth'),
+                ('Financial Sufficiency', 'Avg_fin_suff_score_6mth', 'Avg_fin_suff_score_3mth'),
+                ('Housing Independence', 'Avg_housing_independence_score_6mth', None)
+            ]
+            
+            for dimension, metric_6m, metric_3m in safety_metrics:
+                val_6m = kpis.value(metric_6m, 0)
+                val_3m = kpis.value(metric_3m, 0)
+                
+                if val_6m > 0:
+                    safety_data.append({'Dimension': dimension, 'Period': '6 months', 'Score': val_6m})
+                if val_3m > 0:
+                    safety_data.append({'Dimension': dimension, 'Period': '3 months', 'Score': val_3m})
+            
+            safety_df = pd.DataFrame(safety_data)
+            
+            if not safety_df.empty:
+                fig_radar = px.line_polar(
+                    safety_df,
+                    r='Score',
+                    theta='Dimension',
+                    color='Period',
+                    line_close=True,
+                    title="🛡️ Wellbeing Dimensions (Score out of 5)",
+                    range_r=[0, 5]
+                )
+                st.plotly_chart(fig_radar, use_container_width=True)
+        
+        with col2:
+            # Confidence and self-esteem changes
+            st.markdown("#### 📈 Self-Reported Confidence & Control")
+            
+            # Create confidence score changes bar chart
+            confidence_metrics = [
+                ('Home Safety', 'Avg_Home_Safety_Score_6mth', 'Avg_Home_Safety_Score_3mth'),
+                ('Area Safety', 'Avg_Area_Safety_Score_6mth', 'Avg_Area_Safety_Score_3mth'),
+                ('Financial Sufficiency', 'Avg_fin_suff_score_6mth', 'Avg_fin_suff_score_3mth'),
+                ('Housing Independence', 'Avg_housing_independence_score_6mth', None)
+            ]
+            
+            confidence_data = []
+            for dimension, metric_6m, metric_3m in confidence_metrics:
+                val_6m = kpis.value(metric_6m, 0)
+                val_3m = kpis.value(metric_3m, 0)
+                change = val_6m - val_3m if val_3m > 0 else 0
+                
+                confidence_data.append({
+                    'Dimension': dimension,
+                    'Score Change': change,
+                    'Direction': 'Improved' if change > 0 else 'Declined' if change < 0 else 'Stable'
+                })
+            
+            confidence_df = pd.DataFrame(confidence_data)
+            
+            if not confidence_df.empty:
+                fig_confidence = px.bar(
+                    confidence_df,
+                    x='Score Change',
+                    y='Dimension',
+                    orientation='h',
+                    color='Direction',
+                    title="🎯 Confidence Score Changes (6m vs 3m)",
+                    color_discrete_map={
+                        'Improved': '#4ECDC4',
+                        'Declined': '#FF6B6B',
+                        'Stable': '#95A5A6'
+                    }
+                )
+                st.plotly_chart(fig_confidence, use_container_width=True)
+
+    # ========== ROW 4: GOALS & MILESTONES ==========
+        st.subheader("🎯 Goals & Milestones Achievement")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Milestones funnel - Housing progression
+            st.markdown("#### 🏠 Housing Milestone Progression")
+            # Create funnel data for housing milestones
+            housing_milestones = [
+                ('Initial Support', 100),
+                ('Stable Housing (3m)', kpis.value('%_In_Share_House_or_Own_Home_3mth', 0)),
+                ('Stable Housing (6m)', kpis.value('%_In_Share_House_or_Own_Home_6mth', 0)),
+                ('Housing Retention', kpis.value('%_Still_In_Same_Property_6mth', 0))
+            ]
+            funnel_df = pd.DataFrame(housing_milestones, columns=['Stage', 'Percentage'])
+            fig_funnel = go.Figure(go.Funnel(
+                y=funnel_df['Stage'],
+                x=funnel_df['Percentage'],
+                textinfo='value+percent initial',
+                marker={"color": ['#2E8B57', '#87CEEB', '#4682B4', '#FF6347']}
+            ))
+            fig_funnel.update_layout(title_text="🎯 Housing Milestones Funnel")
+            st.plotly_chart(fig_funnel, use_container_width=True)
+        
+        with col2:
+            # Bar chart by demographic group (e.g., Gender)
+            st.markdown("#### Progress by Demographic: Gender")
+            gender_metrics = [
+                ('%_Stable_Housing_Female_6mth', 'Female'),
+                ('%_Stable_Housing_Male_6mth', 'Male'),
+                ('%_Stable_Housing_Other_6mth', 'Other')
+            ]
+            demographic_data = []
+            for metric, group in gender_metrics:
+                val = kpis.value(metric, 0)
+                demographic_data.append({'Gender': group, 'Stable Housing %': val})
+            demographic_df = pd.DataFrame(demographic_data)
+            fig_gender_bar = px.bar(
+                demographic_df,
+                x='Gender',
+                y='Stable Housing %',
+                color='Gender',
+                title='🏳️‍🌈 Stable Housing by Gender (6 months)',
+                color_discrete_map={'Female': '#FF69B4', 'Male': '#4682B4', 'Other': '#9B59B6'}
+            )
+            st.plotly_chart(fig_gender_bar, use_container_width=True)
+        
+        # # Scatter plot by goal type
+        # st.markdown("#### 🎯 Goals Completion by Type")
+        # goal_type_data = []
+        # goal_types = ['Housing', 'Employment', 'ID', 'Health']
+        # for goal in goal_types:
+        #     val = kpis.value(f'%_Goals_Completed_{goal}_6mth', 0)
+        #     goal_type_data.append({'Goal Type': goal, 'Completion %': val})
+        # goal_df = pd.DataFrame(goal_type_data)
+        # fig_goal_scatter = px.scatter(
+        #     goal_df,
+        #     x='Goal Type',
+        #     y='Completion %',
+        #     size='Completion %',
+        #     color='Goal Type',
+        #     title='🎯 Goals Completion by Type',
+        #     size_max=60
+        # )
+        # st.plotly_chart(fig_goal_scatter, use_container_width=True)
+    
+    with tab2:
+        time_series_section(df_p2_filtered, data.period_over_period(2), data.projections(2))
+
+    with tab3:
+        metric_details_section(df_p2_filtered)
+
+    with tab4:
+        cohort_section(data, selected_range)
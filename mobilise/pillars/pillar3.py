@@ -0,0 +1,123 @@
+"""Pillar 3: Promote direct participation in the solution."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from mobilise.components import metric_details_section, time_series_section
+from mobilise.pillars import warm_filters
+
+
+def warm(data):
+    warm_filters(data, 3)
+
+
+def render(data):
+    st.header("🤝 Promote Direct Participation in the Solution")
+
+    # ==== FILTERS ====
+    st.sidebar.subheader("Filters (Page 3)")
+    min_date, max_date, categories = data.pillar_domain(3)
+    selected_range = st.sidebar.date_input("Date Range", [min_date, max_date], key="p3_date")
+    if len(selected_range) == 1:
+        selected_range = [selected_range[0], selected_range[0]]
+
+    selected_categories = st.sidebar.multiselect(
+        "📂 Metric Category",
+        categories,
+        default=categories
+    )
+
+    # Apply filters
+    df_p3_filtered = data.filter_pillar(3, selected_range, selected_categories)
+
+    # ==== KPI CARDS ====
+    # Each card shows its metric's latest value up to the end of the selected range
+    kpis = data.kpis(3, selected_range, selected_categories)
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Total Volunteers", kpis.text("Total_Volunteers"), delta=kpis.delta("Total_Volunteers"),
+                  help=kpis.note("Total_Volunteers"))
+
+    with col2:
+        st.metric("Repeat Volunteers", kpis.text("Repeat_Volunteers"), delta=kpis.delta("Repeat_Volunteers"),
+                  help=kpis.note("Repeat_Volunteers"))
+
+    with col3:
+        st.metric("Outreach Engagements", kpis.text("Total_Outreach_Engs_Volunteers"), delta=kpis.delta("Total_Outreach_Engs_Volunteers"),
+                  help=kpis.note("Total_Outreach_Engs_Volunteers"))
+
+    with col4:
+        st.metric("Participant-Led Initiatives", kpis.text("Total_Participant_led_Engs"), delta=kpis.delta("Total_Participant_led_Engs"),
+                  help=kpis.note("Total_Participant_led_Engs"))
+
+    col5, col6, col7, col8 = st.columns(4)
+
+    with col5:
+        st.metric("Partner Collaborations", kpis.text("Total_partner_events_collabs"), delta=kpis.delta("Total_partner_events_collabs"),
+                  help=kpis.note("Total_partner_events_collabs"))
+
+    with col6:
+        st.metric("SLT mtgs w/ lived exp.", kpis.text("Total_SLT_meetings_participants"), delta=kpis.delta("Total_SLT_meetings_participants"),
+                  help=kpis.note("Total_SLT_meetings_participants"))
+
+    with col7:
+        st.metric("Participants Internal Roles", kpis.text("Total_participants_int_roles"), delta=kpis.delta("Total_participants_int_roles"),
+                  help=kpis.note("Total_participants_int_roles"))
+
+    # ---- Tabs ----
+    tab1, tab2, tab3 = st.tabs(["📂 Category Overview", "📈 Time Series", "📋 Metric Details"])
+
+    with tab1:
+        st.subheader("📂 Participation & Collaboration Overview")
+        # Volunteer Engagement bar chart
+        volunteer_metrics = ["Total_Volunteers", "Repeat_Volunteers", "Total_Outreach_Engs_Volunteers"]
+        overview_data = df_p3_filtered[df_p3_filtered["Agg_Metric"].isin(volunteer_metrics)]
+
+        if not overview_data.empty:
+            # Calculate period-specific metrics by taking the sum for the filtered period
+            period_metrics = data.aggregate_metrics(overview_data, 3, selected_range, selected_categories,
+                                                    how="sum", metrics=volunteer_metrics)
+
+            fig = px.bar(
+                period_metrics, 
+                x='Agg_Metric', 
+                y='Agg_Value',
+                text='Agg_Value',
+                title="Volunteer Engagement Metrics"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No volunteer engagement data available for selected period.")
+
+        # Participant-Led Initiatives
+        pli_data = df_p3_filtered[df_p3_filtered["Agg_Metric"] == "Total_Participant_led_Engs"]
+        if not pli_data.empty:
+            fig = px.bar(pli_data, x="Date", y="Agg_Value",
+                         title="Participant-Led Initiatives")
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Partner Collaborations
+        collab_data = df_p3_filtered[df_p3_filtered["Agg_Metric"] == "Total_partner_events_collabs"]
+        if not collab_data.empty:
+            fig = px.bar(collab_data, x="Date", y="Agg_Value",
+                         title="Partner Collaborations")
+            st.plotly_chart(fig, use_container_width=True)
+
+        # Pie Chart: SLT Meetings with/without lived experience
+        slt_meetings_part = df_p3_filtered[df_p3_filtered["Agg_Metric"] == "Total_SLT_meetings_participants"]["Agg_Value"].sum()
+        if slt_meetings_part>0:
+            pie_data = pd.DataFrame({
+                "Category": ["With lived experience"],
+                "Count": [slt_meetings_part]
+            })
+            fig = px.pie(pie_data, names="Category", values="Count", title="SLT Meetings with Lived Experience Present")
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No SLT meeting data for lived experience inclusion.")
+        
+    with tab2:
+        time_series_section(df_p3_filtered, data.period_over_period(3), data.projections(3))
+
+    with tab3:
+        metric_details_section(df_p3_filtered)
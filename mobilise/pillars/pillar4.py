@@ -0,0 +1,205 @@
+"""Pillar 4: Expanded outreach opportunities."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from mobilise.components import metric_details_section, time_series_section
+from mobilise.data import load_postcode_bins
+from mobilise.geo import MAP_LEVELS, map_points
+from mobilise.pillars import warm_filters
+
+
+def warm(data):
+    warm_filters(data, 4)
+    load_postcode_bins(data.tenant)
+
+
+def render(data):
+    st.header("🌐 Expanded Outreach Opportunities")
+
+    # ==== SIDEBAR FILTERS ====
+    st.sidebar.subheader("Filters (Page 4)")
+    min_date, max_date, categories = data.pillar_domain(4)
+    selected_range = st.sidebar.date_input("Date Range", [min_date, max_date], key="p4_date")
+    if len(selected_range) == 1:
+        selected_range = [selected_range[0], selected_range[0]]
+
+    selected_categories = st.sidebar.multiselect(
+        "📂 Metric Category",
+        categories,
+        default=categories
+    )
+
+    # Apply filters
+    df_p4_filtered = data.filter_pillar(4, selected_range, selected_categories)
+
+    # ==== KPI CARDS ====
+    st.subheader("📊 Key Metrics")
+    # Each card shows its metric's latest value up to the end of the selected range
+    kpis = data.kpis(4, selected_range, selected_categories)
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Outreach Sessions", kpis.text("Total_outreach_Engs"), delta=kpis.delta("Total_outreach_Engs"),
+                  help=kpis.note("Total_outreach_Engs"))
+
+    with col2:
+        st.metric("Unique Individuals Engaged", kpis.text("Total_outreach_individuals_unique"), delta=kpis.delta("Total_outreach_individuals_unique"),
+                  help=kpis.note("Total_outreach_individuals_unique"))
+
+    with col3:
+        st.metric("Distinct Outreach Locations", kpis.text("Total_engs_postcode"), delta=kpis.delta("Total_engs_postcode"),
+                  help=kpis.note("Total_engs_postcode"))
+
+    with col4:
+        st.metric("Avg Impact Score", kpis.text("Avg_eng_impact_score", "{:.2f}"), delta=kpis.delta("Avg_eng_impact_score"),
+                  help=kpis.note("Avg_eng_impact_score"))
+
+    # ==== TABS ====
+    tab1, tab2, tab3 = st.tabs(["📊 Category Overview", "📈 Time Series", "🔍 Metric Details"])
+
+    # === OVERVIEW TAB ===
+    with tab1:
+        st.header("📊 Category Overview")
+
+        # 1. Outreach Metrics (bar chart for latest period)
+        bar_metrics = [
+            ("Total_outreach_Engs", "Outreach Sessions"),
+            ("Total_outreach_individuals_unique", "Unique Individuals"),
+            ("Total_engs_postcode", "Distinct Locations")
+        ]
+        vals = []
+        for code, label in bar_metrics:
+            v = kpis.value(code, 0)
+            vals.append({'Metric': label, 'Count': v})
+
+        df_bar = pd.DataFrame(vals)
+        fig_bar = px.bar(
+            df_bar.sort_values("Count"),
+            x="Count", y="Metric",
+            orientation="h",
+            text="Count",
+            color="Metric",
+            color_discrete_sequence=px.colors.qualitative.Set2,
+            title="Outreach Scale at a Glance"
+        )
+        fig_bar.update_traces(textposition="outside")
+        fig_bar.update_layout(showlegend=False, xaxis_title=None, yaxis_title=None)
+        st.plotly_chart(fig_bar, use_container_width=True)
+
+        # 2. Radar chart for quality/consistency
+        radar_metrics = [
+            ("Avg_eng_impact_score", "Avg Impact", "score"),
+            ("%_eng_follow_up_req", "Follow-up Required (%)", "percentage"),
+            ("%_eng_referral_sugg", "Referral Suggested (%)", "percentage"),
+            ("%_eng_imm_supp_prov", "Immediate Support (%)", "percentage"),
+            ("%_eng_na", "No Further Action (%)", "percentage"),
+            ("%_eng_declined_withdrawn", "Declined/Withdrawn (%)", "percentage")
+        ]
+
+        radar_vals = []
+        for code, label, metric_type in radar_metrics:
+            raw_value = kpis.value(code, 0)
+            
+            # Normalize based on metric type
+            if metric_type == "score":
+                # Assuming impact score is 0-5, normalize to 0-100
+                max_impact_score = 5  # Adjust this based on your actual scale
+                normalized_value = (raw_value / max_impact_score) * 100
+                display_label = f"{label} ({raw_value:.1f}/5)"
+            else:  # percentage
+                normalized_value = raw_value
+                display_label = f"{label} ({raw_value:.1f}%)"
+            
+            radar_vals.append({
+                'Dimension': display_label, 
+                'Score': normalized_value,
+                'Raw_Value': raw_value
+            })
+
+        df_radar = pd.DataFrame(radar_vals)
+
+        # Create radar chart with fixed 0-100 scale
+        fig_radar_page4 = px.line_polar(
+            df_radar, 
+            r="Score", 
+            theta="Dimension", 
+            line_close=True,
+            title="Quality & Consistency of Outreach (Normalized 0-100 Scale)",
+            range_r=[0, 100]  # Fix scale to 0-100
+        )
+
+        fig_radar_page4.update_traces(fill='toself', fillcolor='rgba(135, 206, 235, 0.3)')
+
+        # Improve readability
+        fig_radar_page4.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 100],
+                    tickvals=[0, 25, 50, 75, 100],
+                    ticktext=['0', '25', '50', '75', '100'],
+                    gridcolor='lightgray'
+                ),
+                angularaxis=dict(
+                    tickfont=dict(size=10)
+                )
+            ),
+            font=dict(size=12),
+            height=500
+        )
+
+        st.plotly_chart(fig_radar_page4, use_container_width=True, key="radar_page4_normalized")
+
+        # 3. Positive feedback bar chart
+        positive_keywords = ["Avg Impact", "Immediate Support", "Referral Suggested"]
+        pos_feedback = df_radar[df_radar["Dimension"].str.contains('|'.join(positive_keywords), case=False, na=False)]
+
+        fig_pos = px.bar(
+            pos_feedback,
+            x="Dimension", y="Score", color="Dimension",
+            title="Positive Feedback Metrics",
+            text="Score"
+        )
+        fig_pos.update_traces(textposition="outside")
+        fig_pos.update_layout(showlegend=False)
+        st.plotly_chart(fig_pos, use_container_width=True)
+
+        # 4. Outreach map: postcode engagements pre-binned per month and detail level
+        st.subheader("🗺️ Where Outreach Happened")
+        postcode_bins = load_postcode_bins(data.tenant)
+        if postcode_bins is None:
+            st.info(f"Add {data.tenant.postcode_engagements_csv} and {data.tenant.postcode_centroids_csv} "
+                    "to map engagements by postcode.")
+        else:
+            bins, unmatched = postcode_bins
+            level = st.select_slider("Map detail", options=list(MAP_LEVELS), value="Local area (~10 km)", key="p4_map_level")
+            start, end = pd.to_datetime(selected_range[0]), pd.to_datetime(selected_range[-1])
+            points = map_points(bins, level, start, end)
+            if points.empty:
+                st.info("No postcode engagements in the selected date range.")
+            else:
+                fig_map = px.scatter_map(
+                    points,
+                    lat="Latitude", lon="Longitude",
+                    size="Engagements", color="Engagements",
+                    hover_data={"Engagements": ":,.0f", "Postcodes": True, "Latitude": False, "Longitude": False},
+                    color_continuous_scale="Viridis",
+                    size_max=30,
+                    zoom=3,
+                    map_style="carto-positron",
+                    title=f"Engagements by {level.split(' (')[0].lower()}, {start:%b %Y} to {end:%b %Y}"
+                )
+                fig_map.update_layout(height=550, margin=dict(l=0, r=0, t=40, b=0))
+                st.plotly_chart(fig_map, use_container_width=True, key="map_page4")
+            if unmatched:
+                st.caption(f"{len(unmatched)} postcode(s) have no centroid and are not shown: {', '.join(unmatched[:10])}"
+                           + (" …" if len(unmatched) > 10 else ""))
+
+    # === TIME SERIES TAB ===
+    with tab2:
+        time_series_section(df_p4_filtered, data.period_over_period(4), data.projections(4))
+
+    # === DETAIL TAB ===
+    with tab3:
+        metric_details_section(df_p4_filtered)
@@ -0,0 +1,192 @@
+"""Pillar 5: Distribution of funds."""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from mobilise.components import metric_details_section, time_series_section
+from mobilise.pillars import warm_filters
+
+
+def warm(data):
+    warm_filters(data, 5)
+
+
+def render(data):
+    st.header("💸 Distribution of Funds")
+
+    # ==== Filters ====
+    st.sidebar.subheader("Filters (Page 5)")
+    min_date, max_date, categories = data.pillar_domain(5)
+    selected_range = st.sidebar.date_input("Date Range", [min_date, max_date], key="p5_date")
+    if len(selected_range) == 1:
+        selected_range = [selected_range[0], selected_range[0]]
+
+    selected_categories = st.sidebar.multiselect(
+        "📂 Metric Category",
+        categories,
+        default=categories
+    )
+
+    # Apply filters
+    df_p5_filtered = data.filter_pillar(5, selected_range, selected_categories)
+
+    # ==== KPI CARDS ====
+    st.subheader("📊 Key Metrics")
+    # Each card shows its metric's latest value up to the end of the selected range
+    kpis = data.kpis(5, selected_range, selected_categories)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Participants Funded", kpis.text("Total_unique_participants_received_funds"), delta=kpis.delta("Total_unique_participants_received_funds"),
+                  help=kpis.note("Total_unique_participants_received_funds"))
+    with col2:
+        st.metric("% of Participants Funded", kpis.text("%_unique_participants_received_funds"), delta=kpis.delta("%_unique_participants_received_funds"),
+                  help=kpis.note("%_unique_participants_received_funds"))
+    with col3:
+        st.metric("Total Bill Amount (A$)", kpis.text("Total_bill_amount_unique_participants"), delta=kpis.delta("Total_bill_amount_unique_participants"),
+                  help=kpis.note("Total_bill_amount_unique_participants"))
+    with col4:
+        st.metric("Avg Time to Funds (hrs)", kpis.text("Avg_time_to_received_funds_hours"), delta=kpis.delta("Avg_time_to_received_funds_hours"),
+                  help=kpis.note("Avg_time_to_received_funds_hours"))
+
+    col5, col6, col7, col8 = st.columns(4)
+    with col5:
+        st.metric("Avg Rent/Income Ratio", kpis.text("Avg_rent_income_ratio", "{:.1f}%"), delta=kpis.delta("Avg_rent_income_ratio"),
+                  help=kpis.note("Avg_rent_income_ratio"))
+    with col6:
+        st.metric("Avg Intake Needs Score", kpis.text("Avg_intake_needs_score"), delta=kpis.delta("Avg_intake_needs_score"),
+                  help=kpis.note("Avg_intake_needs_score"))
+    with col7:
+        st.metric("Satisfaction Score", kpis.text("Avg_satisfaction_score_unique_participants", "{:.1f}/5"), delta=kpis.delta("Avg_satisfaction_score_unique_participants"),
+                  help=kpis.note("Avg_satisfaction_score_unique_participants"))
+    with col8:
+        st.metric("Emergency Callouts", kpis.text("Avg_emergency_callout_unique_participants"), delta=kpis.delta("Avg_emergency_callout_unique_participants"),
+                  help=kpis.note("Avg_emergency_callout_unique_participants"))
+
+    # ==== TABS ====
+    tab1, tab2, tab3 = st.tabs(["📊 Category Overview", "📈 Time Series", "🔍 Metric Details"])
+
+    # ========== TAB 1: CATEGORY OVERVIEW ==========
+    with tab1:
+        st.header("📊 Overview: Funds Distribution & Equity")
+
+        # --- 1. Recipients over time (Line Chart) ---
+        metric_over_time = df_p5_filtered[df_p5_filtered['Agg_Metric'] == 'Total_unique_participants_received_funds']
+        if not metric_over_time.empty:
+            fig_line = px.line(
+                metric_over_time,
+                x="Date",
+                y="Agg_Value",
+                markers=True,
+                title="Number of Funded Participants Over Time"
+            )
+            st.plotly_chart(fig_line, use_container_width=True)
+        else:
+            st.info("No data for funded participants over time.")
+
+        # --- 2. Pie chart for spending categories (latest period) ---
+        spending_codes = [
+            ('%_use_of_funds_rent', 'Rent'),
+            ('%_use_of_funds_food', 'Food'),
+            ('%_use_of_funds_transport', 'Transport'),
+            ('%_use_of_funds_utilities', 'Utilities'),
+            ('%_use_of_funds_other', 'Other')
+        ]
+        spend_vals = []
+        for code, label in spending_codes:
+            val = kpis.value(code, 0)
+            spend_vals.append({'Category': label, 'Percent': val})
+        df_spend = pd.DataFrame([row for row in spend_vals if row['Percent'] > 0])
+        if not df_spend.empty:
+            fig_pie = px.pie(
+                df_spend,
+                values="Percent",
+                names="Category",
+                title="Use of Funds – Spending Categories",
+                color_discrete_sequence=px.colors.sequential.PuBu
+            )
+            st.plotly_chart(fig_pie, use_container_width=True)
+        else:
+            st.info("No spending breakdown available for this period.")
+
+        # --- 3. Equity bar chart (filter by group, for example Gender) ---
+        st.subheader("Equity Bar Chart (demo: if group columns exist)")
+        equity_group = ["Male", "Female", "CALD", "Non-CALD"]  # Example
+        equity_bars = []
+        for group in equity_group:
+            code = f"Total_unique_participants_received_funds_{group}"
+            val = kpis.value(code, 0)
+            if val > 0:
+                equity_bars.append({"Group": group, "Count": val})
+        df_equity = pd.DataFrame(equity_bars)
+        if not df_equity.empty:
+            fig_equity = px.bar(
+                df_equity,
+                x="Group",
+                y="Count",
+                text="Count",
+                title="Participants Receiving Funds by Equity Group"
+            )
+            fig_equity.update_traces(textposition='outside')
+            fig_equity.update_layout(showlegend=False)
+            st.plotly_chart(fig_equity, use_container_width=True)
+        else:
+            st.info("Demographic breakdown not available for this period.")
+        
+        # Empowerment Impact   
+        st.subheader("Empowerment & Crisis Impact")
+        trend_codes = [
+            ("Financial Sufficiency (3mth)", "Avg_fin_suff_score_3mth"),
+            ("Financial Sufficiency (6mth)", "Avg_fin_suff_score_6mth"),
+            ("Satisfaction Score", "Avg_satisfaction_score_unique_participants"),
+            ("Crisis Dependency", "Avg_emergency_callout_unique_participants")
+        ]
+
+        trend_data = []
+        for label, code in trend_codes:
+            ts = df_p5_filtered[df_p5_filtered["Agg_Metric"] == code]
+            for _, row in ts.iterrows():
+                trend_data.append({
+                    "Metric": label,
+                    "Date": row["Date"],
+                    "Value": row["Agg_Value"]
+                })
+        df_trend = pd.DataFrame(trend_data)
+
+        if not df_trend.empty:
+            fig_trend = px.line(
+                df_trend, x="Date", y="Value",
+                color="Metric",
+                markers=True,
+                title="Empowerment & Crisis Trend Over Time"
+            )
+            st.plotly_chart(fig_trend, use_container_width=True)
+        else:
+            st.info("No empowerment/crisis trend data available for selected period.")
+            
+        # Use latest available period for 'before' and 'after'
+        score_3mth = kpis.value("Avg_fin_suff_score_3mth", None)
+        score_6mth = kpis.value("Avg_fin_suff_score_6mth", None)
+
+        if score_3mth is not None and score_6mth is not None:
+            fig_before_after = go.Figure(go.Bar(
+                x=["3 Months", "6 Months"],
+                y=[score_3mth, score_6mth],
+                marker_color=["#90caf9", "#1976d2"]
+            ))
+            fig_before_after.update_layout(
+                title="Financial Sufficiency: Before vs. After",
+                xaxis_title="Timepoint",
+                yaxis_title="Average Score"
+            )
+            st.plotly_chart(fig_before_after, use_container_width=True)
+        else:
+            st.info("No before/after data found for financial sufficiency.")
+
+
+    with tab2:
+        time_series_section(df_p5_filtered, data.period_over_period(5), data.projections(5))
+
+    # ========== TAB 3: METRIC DETAILS ==========
+    with tab3:
+        metric_details_section(df_p5_filtered)
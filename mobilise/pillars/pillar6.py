@@ -0,0 +1,244 @@
+"""Pillar 6: Engagement of the wider community."""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from mobilise.components import metric_details_section, time_series_section
+from mobilise.data import load_term_index
+from mobilise.kpis import MISSING
+from mobilise.pillars import warm_filters
+
+WORD_CLOUD_TERMS = 60
+THEME_LIST_TERMS = 15
+
+
+def word_cloud_sizes(top):
+    return 14 + 42 * np.sqrt(top["Count"] / top["Count"].max())
+
+
+# The spiral search is pure Python, so a layout is kept per tenant, index version, date range and term count
+@st.cache_data(show_spinner=False, max_entries=32)
+def word_cloud_layout(tenant_key, version, start, end, limit, _top):
+    """Spiral positions of `_top`'s terms without overlaps; `_top` is left out of the cache key."""
+    placed, xs, ys = [], [], []
+    for term, size in zip(_top["Term"], word_cloud_sizes(_top)):
+        width, height = 0.6 * size * len(term), size
+        for step in range(5000):
+            angle = 0.35 * step
+            x, y = 2.5 * angle * np.cos(angle), 1.5 * angle * np.sin(angle)
+            box = (x - width / 2, y - height / 2, x + width / 2, y + height / 2)
+            if not any(box[0] < b[2] and b[0] < box[2] and box[1] < b[3] and b[1] < box[3] for b in placed):
+                break
+        placed.append(box)
+        xs.append(x)
+        ys.append(y)
+    return xs, ys
+
+
+def word_cloud(top, layout):
+    """Plotly text scatter of the terms at their `layout` positions, sized by count."""
+    xs, ys = layout
+    sizes = word_cloud_sizes(top)
+    fig = go.Figure(go.Scatter(
+        x=xs, y=ys, mode="text", text=top["Term"],
+        textfont=dict(size=sizes, color=px.colors.qualitative.Bold * (len(top) // 10 + 1)),
+        customdata=top[["Count", "Responses"]], hovertemplate="%{text}: %{customdata[0]} mentions in %{customdata[1]} responses<extra></extra>",
+    ))
+    fig.update_xaxes(visible=False)
+    fig.update_yaxes(visible=False, scaleanchor="x")
+    fig.update_layout(height=450, margin=dict(l=0, r=0, t=40, b=0), title="What the Community Is Saying")
+    return fig
+
+
+def warm(data):
+    warm_filters(data, 6)
+    load_term_index(data.tenant)
+
+
+def render(data):
+    st.header("🌍 Engagement of the Wider Community")
+
+    # ==== SIDEBAR FILTERS ====
+    st.sidebar.subheader("Filters (Page 6)")
+    min_date, max_date, categories = data.pillar_domain(6)
+    selected_range = st.sidebar.date_input("Date Range", [min_date, max_date], key="p6_date")
+    if len(selected_range) == 1:
+        selected_range = [selected_range[0], selected_range[0]]
+
+    selected_categories = st.sidebar.multiselect(
+        "📂 Metric Category",
+        categories,
+        default=categories
+    )
+
+    # Apply filters
+    df_p6_filtered = data.filter_pillar(6, selected_range, selected_categories)
+
+    # ==== KPI CARDS ====
+    st.subheader("📊 Key Metrics")
+    # Each card shows its metric's latest value up to the end of the selected range
+    kpis = data.kpis(6, selected_range, selected_categories)
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        total_followers = kpis.total("followers")
+        st.metric("Total Social Media Followers", MISSING if pd.isna(total_followers) else f"{total_followers:,.0f}")
+
+    with col2:
+        st.metric("Event Attendees", kpis.text("Total_event_attendee"), delta=kpis.delta("Total_event_attendee"),
+                  help=kpis.note("Total_event_attendee"))
+
+    with col3:
+        st.metric("Volunteers Recruited", kpis.text("Total_Volunteers"), delta=kpis.delta("Total_Volunteers"),
+                  help=kpis.note("Total_Volunteers"))
+
+    with col4:
+        st.metric("Unique Donors", kpis.text("Total_unique_donors"), delta=kpis.delta("Total_unique_donors"),
+                  help=kpis.note("Total_unique_donors"))
+
+    col5, col6, col7, col8 = st.columns(4)
+
+    with col5:
+        st.metric("Grant Funders", kpis.text("Total_unique_grant_providers"), delta=kpis.delta("Total_unique_grant_providers"),
+                  help=kpis.note("Total_unique_grant_providers"))
+    with col6:
+        st.metric("EDM Open Rate (%)", kpis.text("Avg_edm_open_rate"), delta=kpis.delta("Avg_edm_open_rate"),
+                  help=kpis.note("Avg_edm_open_rate"))
+    with col7:
+        st.metric("Pulse Survey Responses", kpis.text("Total_pulse_responses"), delta=kpis.delta("Total_pulse_responses"),
+                  help=kpis.note("Total_pulse_responses"))
+    with col8:
+        st.metric("Mentions in Public Discourse", kpis.text("Total_Mentions_Earned_Topic"), delta=kpis.delta("Total_Mentions_Earned_Topic"),
+                  help=kpis.note("Total_Mentions_Earned_Topic"))
+
+    # ==== TABS ====
+    tab1, tab2, tab3 = st.tabs([
+        "📊 Category Overview", 
+        "📈 Time Series", 
+        "🔍 Metric Details"
+    ])
+
+    # === TAB 1: CATEGORY OVERVIEW ===
+    with tab1:
+        st.header("📊 Category Overview")
+
+        # 1. Line chart: Social reach growth (sum followers)
+        follower_codes = [
+            'Total_LinkedIn_Followers', 'Total_Instagram_Followers', 
+            'Total_Facebook_Followers', 'Total_TikTok_Followers'
+        ]
+        df_social = df_p6_filtered[df_p6_filtered['Agg_Metric'].isin(follower_codes)]
+        if not df_social.empty:
+            fig_reach = px.line(
+                df_social,
+                x="Date", y="Agg_Value", color="Platform",
+                title="Social Media Reach Growth", markers=True
+            )
+            st.plotly_chart(fig_reach, use_container_width=True)
+
+        # 2. Bar chart: Community event attendees
+        attendee_data = df_p6_filtered[df_p6_filtered['Agg_Metric'] == 'Total_event_attendee']
+        if not attendee_data.empty:
+            fig_attendees = px.bar(
+                attendee_data, x="Date", y="Agg_Value",
+                title="Community Event Attendees", text="Agg_Value"
+            )
+            st.plotly_chart(fig_attendees, use_container_width=True)
+
+        # 3. Email open rate graph
+        edm_data = df_p6_filtered[df_p6_filtered['Agg_Metric'] == 'Avg_edm_open_rate']
+        if not edm_data.empty:
+            fig_edm = px.line(
+                edm_data, x="Date", y="Agg_Value",
+                markers=True, title="Email Open Rate Over Time"
+            )
+            st.plotly_chart(fig_edm, use_container_width=True)
+
+        # 4. New contributors (volunteers, donors, funders)
+        contrib_codes = [
+            ('Total_Volunteers', 'New Volunteers'),
+            ('Total_unique_donors', 'New Donors'),
+            ('Total_unique_grant_providers', 'New Funders')
+        ]
+        contrib_df = []
+        for code, label in contrib_codes:
+            rows = df_p6_filtered[df_p6_filtered["Agg_Metric"] == code]
+            for _, row in rows.iterrows():
+                contrib_df.append({"Contributor Type": label, "Date": row["Date"], "Count": row["Agg_Value"]})
+        df_contrib = pd.DataFrame(contrib_df)
+        if not df_contrib.empty:
+            fig_contrib = px.line(
+                df_contrib, x="Date", y="Count", color="Contributor Type",
+                markers=True, title="New Contributors Over Time"
+            )
+            st.plotly_chart(fig_contrib, use_container_width=True)
+
+        # 5. Pie chart: Volunteer referral source (if more types available)
+        referral_data = df_p6_filtered[df_p6_filtered["Agg_Metric"] == "Total_volunteer_referrals"]
+        if not referral_data.empty and referral_data["Agg_Value"].sum() > 0:
+            referral_breakdown = [
+                {"Source": "Friend/Family Referral", "Count": int(referral_data["Agg_Value"].sum())},
+                # Add other sources as you get data
+            ]
+            df_referral = pd.DataFrame(referral_breakdown)
+            fig_referral = px.pie(
+                df_referral, values="Count", names="Source",
+                title="Volunteer Referral Sources"
+            )
+            st.plotly_chart(fig_referral, use_container_width=True)
+
+        # 6. Sentiment/Empathy/Understanding bar chart
+        pulse_codes = [
+            ('Avg_issue_understanding_pulse', 'Issue Understanding (avg 1–5)'),
+            ('Complexity_ack_rate_pulse', 'Acknowledgement of Complexity (%)'),
+            ('Empathy_act_index_pulse', 'High Empathy Index (%)'),
+            ('Structural_cause_rate_pulse', 'Structural Cause Attribution (%)'),
+            ('Personal_cause_rate_pulse', 'Personal Cause Attribution (%)')
+        ]
+        pulse_vals = []
+        for code, label in pulse_codes:
+            v = kpis.value(code, 0)
+            pulse_vals.append({'Theme': label, 'Score': v})
+        df_pulse = pd.DataFrame([row for row in pulse_vals if row['Score'] > 0])
+        if not df_pulse.empty:
+            fig_sentiment = px.bar(
+                df_pulse, x='Theme', y='Score', color='Theme', text='Score',
+                title='Community Pulse: Empathy & Understanding'
+            )
+            fig_sentiment.update_traces(textposition="outside")
+            fig_sentiment.update_layout(showlegend=False)
+            st.plotly_chart(fig_sentiment, use_container_width=True)
+
+        # 7. Qualitative: word cloud & themes, merged from per-month term counts of the pulse responses
+        term_index = load_term_index(data.tenant)
+        if term_index is None:
+            st.info(f"Add free-text pulse-survey responses to {data.tenant.pulse_responses_csv} (Date, Response) "
+                    "to see a word cloud and themes list here.")
+        else:
+            top = term_index.top_terms(selected_range[0], selected_range[-1], WORD_CLOUD_TERMS)
+            if top.empty:
+                st.info("No pulse-survey responses in the selected date range.")
+            else:
+                col_cloud, col_themes = st.columns([2, 1])
+                with col_cloud:
+                    layout = word_cloud_layout(data.tenant.key, term_index.version, selected_range[0],
+                                               selected_range[-1], WORD_CLOUD_TERMS, top)
+                    st.plotly_chart(word_cloud(top, layout), use_container_width=True, key="word_cloud_page6")
+                with col_themes:
+                    st.markdown("**Top Themes**")
+                    st.dataframe(
+                        top.head(THEME_LIST_TERMS)[["Term", "Responses", "Share"]],
+                        column_config={"Share": st.column_config.ProgressColumn(
+                            "Share of Responses", format="percent", min_value=0, max_value=1)},
+                        hide_index=True, use_container_width=True
+                    )
+
+    # === TAB 2: TIME SERIES ===
+    with tab2:
+        time_series_section(df_p6_filtered, data.period_over_period(6), data.projections(6))
+
+    # === TAB 3: METRIC DETAILS ===
+    with tab3:
+        metric_details_section(df_p6_filtered)
@@ -0,0 +1,168 @@
+"""Optional embedded SQL backend for pillar filters and aggregates.
+
+The loaded sheet is copied once into an in-process columnar engine (DuckDB
+when it is installed, otherwise the standard library's sqlite3), either in
+memory or in a file on disk. Date-range, category and outcome-period filters and
+the overview aggregations then run as queries and only the small result sets come
+back to pandas. Results are returned with the same index, column order and
+dtypes as the equivalent pandas expressions.
+"""
+import importlib.util
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+TABLE = "metrics"
+ROW_ID = "_row"
+
+
+def available_engines():
+    """Engines that can be used on this machine, preferred first."""
+    engines = ["duckdb"] if importlib.util.find_spec("duckdb") else []
+    engines.append("sqlite")
+    return engines
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class SQLBackend:
+    """A pillar dataset loaded into DuckDB or SQLite."""
+
+    def __init__(self, df, engine="duckdb", path=":memory:"):
+        if engine not in ("duckdb", "sqlite"):
+            raise ValueError(f"Unknown SQL backend: {engine}")
+        if engine == "duckdb" and "duckdb" not in available_engines():
+            engine = "sqlite"
+        self.engine = engine
+        self.path = path
+        self._lock = threading.Lock()
+        self._columns = list(df.columns)
+        self._dtypes = df.dtypes.to_dict()
+        self._index_name = df.index.name
+        self._datetime_cols = [c for c in df.columns if pd.api.types.is_datetime64_any_dtype(df[c])]
+
+        frame = df.reset_index(drop=True)
+        frame.insert(0, ROW_ID, np.arange(len(frame)))
+        self._index = df.index
+
+        if engine == "duckdb":
+            import duckdb
+            self._con = duckdb.connect(path)
+            self._con.register("src_frame", frame)
+            self._con.execute(f"CREATE OR REPLACE TABLE {TABLE} AS SELECT * FROM src_frame")
+            self._con.unregister("src_frame")
+        else:
+            for col in frame.columns:
+                if col in self._datetime_cols:
+                    frame[col] = frame[col].dt.strftime("%Y-%m-%d %H:%M:%S")
+                elif isinstance(frame[col].dtype, pd.CategoricalDtype):
+                    frame[col] = frame[col].astype(object)
+            self._con = sqlite3.connect(path, check_same_thread=False)
+            frame.to_sql(TABLE, self._con, if_exists="replace", index=False)
+        self._con.execute(f'CREATE INDEX IF NOT EXISTS idx_pillar_month ON {TABLE} ("Pillar", "Month")')
+
+    # ----------- QUERY HELPERS -----------
+    def _param(self, value):
+        if isinstance(value, (pd.Timestamp, np.datetime64)):
+            value = pd.Timestamp(value)
+            return value.strftime("%Y-%m-%d %H:%M:%S") if self.engine == "sqlite" else value.to_pydatetime()
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def _query(self, sql, params=()):
+        params = [self._param(p) for p in params]
+        with self._lock:
+            if self.engine == "duckdb":
+                return self._con.execute(sql, params).df()
+            return pd.read_sql_query(sql, self._con, params=params)
+
+    def _where(self, pillar, start=None, end=None, categories=None, metrics=None,
+               metric_category=None, period=None, date_col="Month"):
+        clauses, params = [f'{_quote("Pillar")} = ?'], [pillar]
+        for bound, op in ((start, ">="), (end, "<=")):
+            if bound is None:
+                continue
+            if pd.isna(bound):
+                # NaT never compares true in pandas either
+                clauses.append("1 = 0")
+                continue
+            clauses.append(f"{_quote(date_col)} {op} ?")
+            params.append(pd.to_datetime(bound))
+        for col, values in (("Metric_Category", categories), ("Agg_Metric", metrics)):
+            if values is None:
+                continue
+            values = list(values)
+            if not values:
+                clauses.append("1 = 0")
+                continue
+            clauses.append(f"{_quote(col)} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        if metric_category is not None:
+            clauses.append(f'{_quote("Metric_Category")} = ?')
+            params.append(metric_category)
+        if period is not None:
+            clauses.append(f'{_quote("Period")} = ?')
+            params.append(period)
+        return " AND ".join(clauses), params
+
+    def _restore(self, result):
+        """Give a query result the index and dtypes of the source frame."""
+        positions = result.pop(ROW_ID).to_numpy(dtype=np.int64)
+        result.index = self._index[positions]
+        result.index.name = self._index_name
+        for col in result.columns:
+            dtype = self._dtypes[col]
+            if col in self._datetime_cols:
+                result[col] = pd.to_datetime(result[col]).astype(dtype)
+            elif isinstance(dtype, pd.CategoricalDtype) or dtype != result[col].dtype:
+                result[col] = result[col].where(result[col].notna(), np.nan).astype(dtype)
+        return result[self._columns]
+
+    # ----------- PUBLIC API -----------
+    def pillar_domain(self, pillar):
+        """(first month, last month, categories in first-seen order) of a pillar."""
+        bounds = self._query(
+            f'SELECT MIN("Month") AS lo, MAX("Month") AS hi FROM {TABLE} WHERE "Pillar" = ?', [pillar]
+        )
+        cats = self._query(
+            f'SELECT "Metric_Category" FROM {TABLE} WHERE "Pillar" = ? AND "Metric_Category" IS NOT NULL '
+            f'GROUP BY "Metric_Category" ORDER BY MIN({ROW_ID})', [pillar]
+        )
+        lo, hi = pd.to_datetime(bounds["lo"].iloc[0]), pd.to_datetime(bounds["hi"].iloc[0])
+        return lo, hi, cats["Metric_Category"].tolist()
+
+    def filter_frame(self, pillar, start=None, end=None, categories=None, period=None,
+                     date_col="Month"):
+        """Rows of one pillar inside the date range, categories and outcome period."""
+        where, params = self._where(pillar, start, end, categories, period=period, date_col=date_col)
+        result = self._query(f"SELECT * FROM {TABLE} WHERE {where} ORDER BY {ROW_ID}", params)
+        return self._restore(result)
+
+    def aggregate(self, pillar, start=None, end=None, categories=None, by="Agg_Metric", how="mean",
+                  metrics=None, metric_category=None, date_col="Month"):
+        """`groupby(by)['Agg_Value'].<how>()` over the filtered rows, as a frame."""
+        if how not in ("mean", "sum"):
+            raise ValueError(f"Unsupported aggregate: {how}")
+        where, params = self._where(pillar, start, end, categories, metrics=metrics,
+                                    metric_category=metric_category, date_col=date_col)
+        func = "AVG" if how == "mean" else "SUM"
+        result = self._query(
+            f'SELECT {_quote(by)}, {func}("Agg_Value") AS "Agg_Value" FROM {TABLE} '
+            f"WHERE {where} AND {_quote(by)} IS NOT NULL GROUP BY {_quote(by)} ORDER BY {_quote(by)}",
+            params,
+        )
+        if how == "sum":
+            result["Agg_Value"] = result["Agg_Value"].fillna(0).astype(self._dtypes["Agg_Value"])
+        else:
+            result["Agg_Value"] = result["Agg_Value"].astype("float64")
+        result[by] = result[by].astype(self._dtypes[by])
+        return result
+
+    def close(self):
+        with self._lock:
+            self._con.close()
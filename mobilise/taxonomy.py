@@ -0,0 +1,110 @@
+"""Metric taxonomy built once per loaded dataset.
+
+Every unique ``Agg_Metric`` code is normalised and tagged with its kind,
+social platform, outcome period and display name. The tags are attached to
+the frame as categorical columns so pages filter with equality lookups
+instead of scanning metric codes with string matching on every rerun.
+"""
+import re
+
+import pandas as pd
+
+# Known inconsistent spellings in the source sheet
+CODE_ALIASES = {
+    "Total_Participant_led_ Engs": "Total_Participant_led_Engs",
+    "Avg_fin_suff_Score_6mth": "Avg_fin_suff_score_6mth",
+}
+
+METRIC_KINDS = ["followers", "engagements", "percentage", "average", "total", "other"]
+PERIOD_RE = re.compile(r"_(\d+)mth$", re.IGNORECASE)
+
+TAXONOMY_COLUMNS = ["Metric_Kind", "Platform", "Period", "Metric_Name"]
+
+
+def clean_metric_name(metric_name):
+    """Convert underscores to spaces and title-case for display."""
+    return metric_name.replace('_', ' ').title()
+
+
+def normalize_code(code):
+    """Trim a metric code and turn stray whitespace into single underscores."""
+    code = CODE_ALIASES.get(code, code)
+    code = re.sub(r"\s*_\s*|\s+", "_", str(code).strip())
+    return re.sub(r"_+", "_", code)
+
+
+def _align_period_siblings(codes):
+    """Give `X_3mth`/`X_6mth` codes whose stems differ only by case one spelling."""
+    groups = {}
+    for code in codes:
+        match = PERIOD_RE.search(code)
+        if match:
+            stem = code[:match.start()]
+            groups.setdefault(stem.lower(), []).append((int(match.group(1)), stem, code))
+    renames = {}
+    for members in groups.values():
+        stems = [stem for _, stem, _ in members]
+        if len(set(stems)) == 1:
+            continue
+        # Most common spelling wins; ties go to the shortest period
+        canonical = max(sorted(members), key=lambda m: stems.count(m[1]))[1]
+        for _, stem, code in members:
+            renames[code] = canonical + code[len(stem):]
+    return renames
+
+
+def _kind(code):
+    if code.endswith("_Followers"):
+        return "followers"
+    if code.endswith("_Engagements"):
+        return "engagements"
+    if code.startswith("%"):
+        return "percentage"
+    if code.startswith("Avg"):
+        return "average"
+    if code.startswith("Total"):
+        return "total"
+    return "other"
+
+
+def build_taxonomy(codes):
+    """One row per raw metric code: normalised code, kind, platform, period and name."""
+    raw = pd.Index(pd.unique(pd.Series(list(codes), dtype=object).dropna()))
+    normalized = [normalize_code(code) for code in raw]
+    renames = _align_period_siblings(set(normalized))
+    normalized = [renames.get(code, code) for code in normalized]
+
+    taxonomy = pd.DataFrame({"Metric_Code": normalized}, index=raw)
+    taxonomy["Metric_Kind"] = [_kind(code) for code in normalized]
+    platform = (
+        pd.Series(normalized, index=raw)
+        .str.replace(r"^Total_", "", regex=True)
+        .str.replace(r"_(Followers|Engagements)$", "", regex=True)
+    )
+    taxonomy["Platform"] = platform.where(taxonomy["Metric_Kind"].isin(["followers", "engagements"]))
+    taxonomy["Period"] = pd.Series(normalized, index=raw).str.extract(PERIOD_RE, expand=False) + "mth"
+    taxonomy["Metric_Name"] = [clean_metric_name(code) for code in normalized]
+    return taxonomy
+
+
+def taxonomy_dtypes(taxonomy):
+    """Categorical dtypes of the tag columns, fixed by the taxonomy rather than the rows."""
+    dtypes = {"Metric_Kind": pd.CategoricalDtype(METRIC_KINDS)}
+    for col in ("Platform", "Period", "Metric_Name"):
+        dtypes[col] = pd.CategoricalDtype(sorted(taxonomy[col].dropna().unique()))
+    return dtypes
+
+
+def apply_taxonomy(df, taxonomy=None):
+    """Normalise `Agg_Metric` in place and attach the categorical taxonomy columns.
+
+    Pass a previously built `taxonomy` to tag new rows consistently with
+    rows tagged earlier.
+    """
+    if taxonomy is None:
+        taxonomy = build_taxonomy(df["Agg_Metric"])
+    codes = df["Agg_Metric"]
+    df["Agg_Metric"] = codes.map(taxonomy["Metric_Code"]).fillna(codes)
+    for col, dtype in taxonomy_dtypes(taxonomy).items():
+        df[col] = codes.map(taxonomy[col]).astype(dtype)
+    return df
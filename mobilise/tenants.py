@@ -0,0 +1,159 @@
+"""Tenants: the regions or organisations one server process hosts.
+
+Each tenant has its own sheet (or local CSV), postcode and pulse-survey
+tables, and its own memory budgets for
+filter results and for the structures derived from its data, so a busy
+tenant never evicts another's entries. Tenants are read from a JSON file keyed by tenant id, each entry
+overriding the built-in defaults:
+
+    {
+      "mobilise-au": {"name": "Mobilise AU", "sheets_url": "https://docs.google.com/spreadsheets/d/.../edit"},
+      "mobilise-nz": {"name": "Mobilise NZ", "local_csv": "data/nz.csv", "use_google_sheets": false,
+                      "postcode_centroids_csv": "data/nz_centroids.csv",
+                      "postcode_engagements_csv": "data/nz_engagements.csv",
+                      "pulse_responses_csv": "data/nz_pulse.csv", "filter_cache_mb": 32, "cache_mb": 128}
+    }
+
+A session picks its tenant with ``?tenant=<id>`` in the URL, falling back to
+``MOBILISE_TENANT`` and then the first tenant in the file.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from mobilise.filter_cache import object_bytes
+
+TENANTS_FILE = os.environ.get("MOBILISE_TENANTS", "tenants.json")
+DEFAULT_TENANT = os.environ.get("MOBILISE_TENANT")
+
+
+class Tenant:
+    """Where one tenant's data comes from and how much cache it may use."""
+
+    def __init__(self, key, name, sheets_url, use_google_sheets, local_csv, postcode_centroids_csv,
+                 postcode_engagements_csv, pulse_responses_csv, filter_cache_mb, cache_mb):
+        self.key = key
+        self.name = name
+        self.sheets_url = sheets_url
+        self.use_google_sheets = use_google_sheets
+        self.local_csv = local_csv
+        self.postcode_centroids_csv = postcode_centroids_csv  # Page 4 outreach map (see mobilise.geo)
+        self.postcode_engagements_csv = postcode_engagements_csv
+        self.pulse_responses_csv = pulse_responses_csv  # Page 6 themes (see mobilise.text_index)
+        self.filter_cache_bytes = int(filter_cache_mb * 1024 * 1024)
+        self.cache_bytes = int(cache_mb * 1024 * 1024)  # Derived structures and local tables (see TenantCache)
+
+    def sheets_configured(self):
+        return bool(self.use_google_sheets and self.sheets_url and "YOUR_SHEET_ID" not in self.sheets_url)
+
+    def __repr__(self):
+        return f"Tenant({self.key!r})"
+
+
+def read_tenants(path, defaults):
+    """Tenants by id from the JSON file at `path`; one tenant built from `defaults` without it.
+
+    `defaults` holds the settings every tenant starts from (see `Tenant`).
+    """
+    if not os.path.exists(path):
+        return {defaults["key"]: Tenant(**defaults)}
+    with open(path) as f:
+        config = json.load(f)
+    if not isinstance(config, dict) or not config:
+        raise ValueError(f"{path} must map tenant ids to their settings")
+    return {key: Tenant(**{**defaults, "key": key, "name": key, **settings}) for key, settings in config.items()}
+
+
+def pick_tenant(tenants, requested=None):
+    """The tenant a session asked for, or the configured default; None for an unknown id."""
+    if requested:
+        return tenants.get(requested)
+    return tenants.get(DEFAULT_TENANT) or next(iter(tenants.values()))
+
+
+class TenantCache:
+    """One tenant's derived structures and loaded tables, bounded by `budget_bytes`.
+
+    Entries are built on first use and shared by every session of the tenant,
+    so callers must treat them as read-only. Each entry is charged its deep
+    memory size, and the least recently used are evicted once the tenant's
+    total passes its budget; entries larger than the whole budget are
+    returned but not kept. Load counters record how the tenant's data has
+    been arriving.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # (fingerprint, name) -> (value, bytes)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.build_seconds = 0.0
+        self.loads = 0
+        self.load_errors = 0
+        self.last_load = None
+
+    def peek(self, fingerprint, name):
+        """The entry if it is built, else None; unlike `get_or_build` this is not counted as a lookup."""
+        with self._lock:
+            entry = self._entries.get((fingerprint, name))
+            if entry is None:
+                return None
+            self._entries.move_to_end((fingerprint, name))
+            return entry[0]
+
+    def get_or_build(self, fingerprint, name, build):
+        key = (fingerprint, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Build outside the lock; two sessions racing on one entry just both build it
+        began = time.perf_counter()
+        value = build()
+        size = object_bytes(value)
+        with self._lock:
+            self.build_seconds += time.perf_counter() - began
+            if size > self.budget_bytes:
+                return value
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.budget_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+        return value
+
+    def record_load(self, seconds, rows, origin, error=None):
+        """Note one load of the tenant's data: how long it took, its size and where it came from."""
+        with self._lock:
+            self.loads += 1
+            self.load_errors += error is not None
+            self.last_load = {"seconds": seconds, "rows": rows, "origin": origin, "error": error, "at": time.time()}
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "budget_bytes": self.budget_bytes,
+                "evictions": self.evictions,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "build_seconds": self.build_seconds,
+                "loads": self.loads,
+                "load_errors": self.load_errors,
+                "last_load": self.last_load,
+            }
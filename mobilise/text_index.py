@@ -0,0 +1,125 @@
+"""Per-month term frequencies of free-text pulse-survey responses.
+
+Responses are read in chunks and tokenized one at a time, and only responses
+not seen in an earlier read are tokenized, so a file that grows by a month
+of answers costs one month of work. Counts are kept per month; the word
+cloud and top-themes list for any date range merge those monthly counts
+instead of going back to the text.
+"""
+import hashlib
+import re
+import threading
+from collections import Counter
+
+import pandas as pd
+
+TOKEN_RE = re.compile(r"[a-z][a-z'-]*[a-z]")
+MIN_TOKEN_LENGTH = 3
+CHUNK_ROWS = 5000  # Responses read per chunk while streaming the file
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are aren't as at be because been before being below
+between both but by can can't cannot could couldn't did didn't do does doesn't doing don't down during each
+even ever every few for from further get gets got had hadn't has hasn't have haven't having he her here hers
+herself him himself his how i if in into is isn't it it's its itself just know like lot lots made make many me
+more most much must my myself no nor not now of off on once one only or other our ours ourselves out over own
+people really same say see she should shouldn't so some still such than that that's the their theirs them
+themselves then there there's these they they're thing things think this those through to too under until up
+us very was wasn't way we were weren't what when where which while who whom why will with won't would
+wouldn't yes yet you your yours yourself yourselves
+""".split())
+
+
+def tokenize(text):
+    """Yield the lower-cased terms of one response, skipping stopwords and short words."""
+    for match in TOKEN_RE.finditer(str(text).lower()):
+        term = match.group().strip("'-")
+        if len(term) >= MIN_TOKEN_LENGTH and term not in STOPWORDS:
+            yield term
+
+
+def read_responses(path, chunk_rows=CHUNK_ROWS):
+    """Yield (month, response) pairs from a Date, Response CSV, one chunk in memory at a time."""
+    for chunk in pd.read_csv(path, usecols=["Date", "Response"], dtype={"Response": str}, chunksize=chunk_rows):
+        months = pd.to_datetime(chunk["Date"], dayfirst=True, errors="coerce").dt.to_period("M").dt.to_timestamp()
+        for month, response in zip(months, chunk["Response"]):
+            if pd.notna(month) and isinstance(response, str) and response.strip():
+                yield month, response
+
+
+def _response_key(month, response):
+    return hashlib.blake2b(f"{month:%Y-%m}|{response}".encode(), digest_size=8).digest()
+
+
+class TermIndex:
+    """Term and document frequencies per month, updated from each new read of the responses."""
+
+    def __init__(self):
+        self.terms = {}  # month -> Counter of term occurrences
+        self.mentions = {}  # month -> Counter of responses mentioning each term
+        self.responses = Counter()  # month -> responses indexed
+        self.version = None
+        self.last_update = None
+        self._seen = Counter()
+        self._lock = threading.Lock()
+
+    def update(self, read, version=None):
+        """Index the responses not seen before; `read()` yields (month, text) pairs.
+
+        Identical responses are counted as often as they occur. If responses
+        seen before are missing from this read (edited or deleted), the index
+        is rebuilt with a second `read()`. Counts are only applied once a read
+        has finished, so a read that fails part-way leaves the index as it was.
+        """
+        with self._lock:
+            if version is not None and version == self.version:
+                return
+            added, current, counts = self._index(read(), self._seen)
+            rebuilt = any(count > current[key] for key, count in self._seen.items())
+            if rebuilt:
+                added, current, counts = self._index(read(), Counter())
+                self.terms, self.mentions, self.responses = {}, {}, Counter()
+            terms, mentions, responses = counts
+            for month in responses:
+                self.terms.setdefault(month, Counter()).update(terms[month])
+                self.mentions.setdefault(month, Counter()).update(mentions[month])
+            self.responses.update(responses)
+            self._seen = current
+            self.version = version
+            self.last_update = {"responses_added": added, "rebuilt": rebuilt}
+
+    @staticmethod
+    def _index(responses, seen):
+        """Counts of the responses beyond those in `seen`: (added, all keys read, (terms, mentions, responses))."""
+        added, current = 0, Counter()
+        terms, mentions, per_month = {}, {}, Counter()
+        for month, text in responses:
+            key = _response_key(month, text)
+            current[key] += 1
+            if current[key] <= seen[key]:
+                continue
+            counts = Counter(tokenize(text))
+            terms.setdefault(month, Counter()).update(counts)
+            mentions.setdefault(month, Counter()).update(counts.keys())
+            per_month[month] += 1
+            added += 1
+        return added, current, (terms, mentions, per_month)
+
+    def top_terms(self, start, end, limit=50):
+        """The most frequent terms from `start` to `end`, merged from the monthly counts.
+
+        Returns a frame of Term, Count, Responses (mentioning the term) and
+        Share (of the range's responses), most frequent first.
+        """
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        with self._lock:
+            months = [month for month in self.terms if start <= month <= end]
+            terms, mentions = Counter(), Counter()
+            for month in months:
+                terms.update(self.terms[month])
+                mentions.update(self.mentions[month])
+            total = sum(self.responses[month] for month in months)
+        top = pd.DataFrame(terms.most_common(limit), columns=["Term", "Count"])
+        top["Responses"] = top["Term"].map(mentions).astype("int64")
+        top["Share"] = top["Responses"] / total if total else 0.0
+        return top
@@ -0,0 +1,84 @@
+"""Unit-aware normalisation of metric values, applied once at load time.
+
+The sheet's ``Unit`` column says what each value measures, but values
+arrive inconsistently: numbers typed as text ("1,250", "$300", "45%") and
+percentages stored either as 0-100 or as 0-1 fractions. Each loaded batch
+is normalised in one vectorised pass: units are canonicalised, values
+coerced to numbers, every percentage put on the 0-100 scale, and each row
+given the display format its metric's cards and tables use.
+
+A percentage is only treated as a fraction when the sheet says so, through
+a fraction unit ("fraction", "ratio", "proportion") or by listing the metric
+in FRACTION_METRICS. Values are not rescaled because of their range (a 0.4%
+conversion rate stays 0.4%), except for the few metrics in
+MIXED_SCALE_METRICS that are known to arrive on either scale.
+"""
+import numpy as np
+import pandas as pd
+
+# Spellings seen in the Unit column, by canonical unit
+UNIT_ALIASES = {
+    "%": ["%", "percent", "percentage", "pct"],
+    "$": ["$", "a$", "aud", "dollar", "dollars"],
+    "hours": ["hours", "hour", "hrs", "hr", "h"],
+    "score": ["score", "rating"],
+    "count": ["count", "number", "#", ""],
+    "fraction": ["fraction", "ratio", "proportion", "0-1"],  # Percentages stored as 0-1; loaded as "%"
+}
+UNIT_OF = {alias: unit for unit, aliases in UNIT_ALIASES.items() for alias in aliases}
+
+# Metrics (normalised Agg_Metric codes) whose "%" values the sheet stores as 0-1 fractions
+FRACTION_METRICS = frozenset()
+
+# Metrics whose "%" values arrive as 0-100 in some rows and 0-1 in others; values of at most 1 are
+# fractions, as the Page 2 Housing Retention card has always read them
+MIXED_SCALE_METRICS = frozenset({"%_Still_In_Same_Property_3mth", "%_Still_In_Same_Property_6mth"})
+
+# Display format by canonical unit; averages of counts keep one decimal
+UNIT_FORMATS = {"%": "{:.1f}%", "$": "${:,.0f}", "hours": "{:,.1f}", "score": "{:.1f}", "count": "{:,.0f}"}
+AVERAGE_FORMAT = "{:,.1f}"
+DEFAULT_FORMAT = "{:,.0f}"
+
+
+def canonical_units(units):
+    """Canonical unit of each row; unknown units are kept trimmed and lower-cased."""
+    cleaned = units.astype(object).fillna("").astype(str).str.strip().str.lower()
+    return cleaned.map(UNIT_OF).fillna(cleaned)
+
+
+def coerce_values(values):
+    """Numeric values, with text such as "1,250", "$300" or "45%" parsed; anything else becomes NaN."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype("float64")
+    text = values.astype(object).astype(str).str.replace(r"[\s,$%]|A\$", "", regex=True)
+    return pd.to_numeric(text, errors="coerce").astype("float64")
+
+
+def display_formats(units, kinds):
+    """Display format of each row from its canonical unit and metric kind."""
+    formats = units.map(UNIT_FORMATS).fillna(DEFAULT_FORMAT)
+    averages = (units == "count") & (kinds.astype(object) == "average")
+    return formats.where(~averages.to_numpy(), AVERAGE_FORMAT).astype("str")
+
+
+def normalize_units(df, fractions=FRACTION_METRICS, mixed=MIXED_SCALE_METRICS):
+    """Normalise `Unit` and `Agg_Value` in place and add the `Display_Format` column.
+
+    `df` must already carry the taxonomy columns. Values in a fraction unit,
+    "%" values of the metrics in `fractions`, and "%" values of at most 1 of
+    the metrics in `mixed`, are scaled to 0-100 and their unit becomes "%".
+    """
+    units = canonical_units(df["Unit"])
+    df["Agg_Value"] = coerce_values(df["Agg_Value"])
+    percent = units == "%"
+    scaled = ((units == "fraction") | (percent & df["Agg_Metric"].isin(fractions))
+              | (percent & df["Agg_Metric"].isin(mixed) & (df["Agg_Value"].abs() <= 1)))
+    df["Unit"] = units.mask(units == "fraction", "%").astype("str")
+    df["Agg_Value"] = np.where(scaled, df["Agg_Value"] * 100, df["Agg_Value"])
+    df["Display_Format"] = display_formats(df["Unit"], df["Metric_Kind"])
+    return df
+
+
+def format_value(value, fmt):
+    """Card text for a value in its precomputed format; an em dash when missing."""
+    return "—" if pd.isna(value) else (fmt if isinstance(fmt, str) else DEFAULT_FORMAT).format(value)
@@ -0,0 +1,124 @@
+"""Warm-up: build each tenant's data and everything its pages derive from it before anyone asks.
+
+Without it the first viewer after a restart or a data change pays for the
+sheet fetch, parsing, every derived structure and Plotly's first figures.
+The warmer loads every tenant when the server process starts, and warms
+again whenever a session loads a data version that has not been warmed yet.
+Warm-ups run one at a time on their own thread, so they never hold up a
+viewer's own load, and fill the same shared caches the pages read.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from mobilise.api import load_dataset
+from mobilise.data import get_metrics, get_tenants
+from mobilise.pillars import warm_pages
+
+
+def warm_figures():
+    """Build and serialise one small figure of each kind the pages draw.
+
+    Plotly loads each trace type's validators the first time it is used,
+    which otherwise lands on the first viewer's rerun.
+    """
+    sample = pd.DataFrame({"x": [0.0, 1.0], "y": [1.0, 2.0], "name": ["a", "b"]})
+    figures = [
+        px.line(sample, x="x", y="y"),
+        px.bar(sample, x="name", y="y"),
+        px.pie(sample, names="name", values="y"),
+        px.line_polar(sample, r="y", theta="name", line_close=True),
+        px.scatter(sample, x="x", y="y"),
+        px.scatter_map(sample, lat="y", lon="x", size="y"),
+        go.Figure([go.Heatmap(z=[[0.0, 1.0]]), go.Funnel(x=[2, 1], y=["a", "b"]), go.Bar(x=["a"], y=[1]),
+                   go.Scatter(x=[0, 1], y=[1, 2], fill="toself")]),
+    ]
+    for fig in figures:
+        fig.to_json()
+
+
+def warm_dataset(data):
+    """Build everything the pages derive from `data`; returns seconds spent per step."""
+    steps = {}
+    began = time.perf_counter()
+    data.period_over_period()
+    steps["period over period"] = time.perf_counter() - began
+    steps.update(warm_pages(data))
+    began = time.perf_counter()
+    warm_figures()
+    steps["figures"] = time.perf_counter() - began
+    return steps
+
+
+class Warmer:
+    """Warm-ups of every tenant's data, queued on one background thread.
+
+    `last` holds each tenant's most recent warm-up: the version warmed, its
+    total seconds (including the load, at startup), seconds per step, when
+    it finished and any error.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mobilise-warmup")
+        self._lock = threading.Lock()
+        self._queued = set()  # (tenant key, version) pairs waiting or running; version None until loaded
+        self.last = {}
+
+    def warm_tenant(self, tenant):
+        """Queue loading `tenant`'s data and warming it."""
+        self._submit(tenant.key, None, lambda: load_dataset(tenant))
+
+    def warm(self, data):
+        """Queue warming `data`, unless its version is already warm or queued."""
+        key = data.tenant.key
+        with self._lock:
+            if self.last.get(key, {}).get("version") == data.version:
+                return
+        self._submit(key, data.version, lambda: data)
+
+    def _submit(self, key, version, get_data):
+        with self._lock:
+            if (key, version) in self._queued:
+                return
+            self._queued.add((key, version))
+        self._executor.submit(self._run, key, version, get_data)
+
+    def _run(self, key, version, get_data):
+        began = time.perf_counter()
+        try:
+            data = get_data()
+            if data is None:
+                raise ValueError("no data to load")
+            with self._lock:
+                if self.last.get(key, {}).get("version") == data.version:
+                    return
+            steps = {"load": time.perf_counter() - began, **warm_dataset(data)}
+            result = {"version": data.version, "steps": steps, "error": None}
+            get_metrics().set("mobilise_warmup_seconds", time.perf_counter() - began, tenant=key)
+        except Exception as e:
+            result = {"version": version, "steps": {}, "error": str(e)}
+        finally:
+            with self._lock:
+                self._queued.discard((key, version))
+        result.update(seconds=time.perf_counter() - began, finished_at=time.time())
+        with self._lock:
+            self.last[key] = result
+
+    def status(self, key):
+        """The tenant's last warm-up (see `last`) and whether another is queued or running."""
+        with self._lock:
+            return self.last.get(key), any(queued_key == key for queued_key, _ in self._queued)
+
+
+# Created on the process's first script run, which is when the server starts taking viewers
+@st.cache_resource(show_spinner=False)
+def get_warmer():
+    warmer = Warmer()
+    for tenant in get_tenants().values():
+        warmer.warm_tenant(tenant)
+    return warmer
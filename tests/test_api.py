@@ -0,0 +1,68 @@
+"""The JSON API served from a published dataset (mobilise.api)."""
+import json
+import socket
+import urllib.error
+import urllib.request
+
+import pandas as pd
+import pytest
+
+from mobilise.api import ApiError, DatasetHolder, _timestamp, get_api, serve
+from mobilise.data import Dataset
+from mobilise.ingest import prepare_data
+
+
+@pytest.fixture(scope="module")
+def api():
+    raw = pd.DataFrame({
+        "Date": ["01/01/2024", "01/02/2024", "01/03/2024"], "Pillar": 1, "Pillar_Name": "Pillar 1",
+        "Metric_Category": "Reach", "Agg_Metric": "Total_Followers", "Agg_Value": [10.0, 20.0, 30.0], "Unit": "",
+    })
+    holder = DatasetHolder()
+    holder.publish(Dataset(prepare_data(raw)))
+    server = serve(holder, port=0)
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def get(api, path):
+    try:
+        with urllib.request.urlopen(api + path) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_series_between_dates(api):
+    status, body = get(api, "/api/pillars/1/series?metric=Total_Followers&start=2024-02-01")
+    assert status == 200
+    assert [point["month"] for point in body["points"]] == ["2024-02-01", "2024-03-01"]
+
+
+@pytest.mark.parametrize("query", ["start=", "start=NaT", "end=", "start=soon"])
+def test_missing_or_unparseable_dates_are_rejected(api, query):
+    status, body = get(api, f"/api/pillars/1/series?{query}")
+    assert status == 400
+    assert "must be a date" in body["error"]
+
+
+def test_empty_start_is_rejected_on_every_endpoint(api):
+    for endpoint in ("kpis?as_of=", "rows?start="):
+        assert get(api, f"/api/pillars/1/{endpoint}")[0] == 400
+
+
+def test_timestamp_rejects_values_that_parse_to_nat():
+    for value in ("", "NaT", None):
+        with pytest.raises(ApiError) as raised:
+            _timestamp(value, "start")
+        assert raised.value.status == 400
+
+
+def test_app_runs_without_the_api_when_its_port_is_taken():
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        port = taken.getsockname()[1]
+        holder = get_api("127.0.0.1", port)
+        assert holder.server is None and "Could not start the API" in holder.error
+        assert get_api("127.0.0.1", port) is holder
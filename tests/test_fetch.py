@@ -0,0 +1,114 @@
+"""Bounded fetching against the fault-injecting sheet stub (tools/sheets_stub.py)."""
+import http.client
+import time
+import urllib.parse
+
+import pandas as pd
+import pytest
+
+from mobilise import fetch
+from mobilise.fetch import CircuitBreaker, CircuitOpenError, FetchError, fetch_bytes, fetch_csv, load_snapshot
+from sheets_stub import serve
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    csv = tmp_path / "sheet.csv"
+    pd.DataFrame({"Date": ["01/01/2024"] * 2000, "Agg_Value": range(2000)}).to_csv(csv, index=False)
+    monkeypatch.setattr(fetch, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    monkeypatch.setattr(fetch, "_breakers", {})
+    server = serve(str(csv), port=0)
+    server.url = f"http://127.0.0.1:{server.server_port}/spreadsheets/d/test/export"
+    yield server
+    server.shutdown()
+
+
+def install_breaker(url, **settings):
+    breaker = CircuitBreaker(**settings)
+    fetch._breakers[urllib.parse.urlsplit(url).netloc] = breaker
+    return breaker
+
+
+def test_fetch_csv_reads_export_and_saves_snapshot(stub):
+    raw = fetch_csv(stub.url)
+    assert len(raw) == 2000
+    snapshot, saved_at = load_snapshot(stub.url)
+    assert snapshot.equals(raw) and saved_at is not None
+    assert fetch.breaker_for(stub.url).state == "closed"
+
+
+@pytest.mark.parametrize("faults", [{"delay": 2.0}, {"hang": True}, {"drip": 0.05}])
+def test_slow_export_gives_up_at_the_deadline(stub, faults):
+    stub.state.faults.update(faults)
+    began = time.monotonic()
+    with pytest.raises(FetchError):
+        fetch_bytes(stub.url, timeout=0.5, retries=0)
+    assert time.monotonic() - began < 1.5
+    assert fetch.breaker_for(stub.url).failures == 1
+
+
+def test_server_errors_are_retried_with_backoff_until_the_breaker_opens(stub):
+    stub.state.faults["error_rate"] = 1.0
+    with pytest.raises(FetchError):
+        fetch_bytes(stub.url, timeout=5, retries=2, backoff=0.01)
+    assert stub.state.requests == 3
+    assert fetch.breaker_for(stub.url).state == "open"
+
+    # An open circuit fails straight away, without reaching the server
+    with pytest.raises(CircuitOpenError):
+        fetch_bytes(stub.url)
+    assert stub.state.requests == 3
+
+
+def test_client_errors_are_not_retried(stub):
+    stub.state.faults.update(error_rate=1.0, error_status=404)
+    with pytest.raises(FetchError):
+        fetch_bytes(stub.url, timeout=5, retries=2, backoff=0.01)
+    assert stub.state.requests == 1
+
+
+def test_half_open_trial_closes_the_circuit_on_success(stub):
+    breaker = install_breaker(stub.url, threshold=1, cooldown=0.2)
+    stub.state.faults["error_rate"] = 1.0
+    with pytest.raises(FetchError):
+        fetch_bytes(stub.url, retries=0)
+    assert breaker.state == "open"
+
+    stub.state.faults["error_rate"] = 0.0
+    time.sleep(0.25)
+    assert breaker.state == "half-open"
+    assert len(fetch_bytes(stub.url, retries=0)) > 0
+    assert breaker.state == "closed"
+
+
+def test_breaker_recovers_after_a_trial_failing_with_an_unexpected_error(stub, monkeypatch):
+    breaker = install_breaker(stub.url, threshold=1, cooldown=0.2)
+    stub.state.faults["error_rate"] = 1.0
+    with pytest.raises(FetchError):
+        fetch_bytes(stub.url, retries=0)
+    time.sleep(0.25)
+
+    # The half-open trial dies on a truncated body rather than a URL or socket error
+    def truncated(url, deadline):
+        raise http.client.IncompleteRead(b"Date,Agg", 100)
+
+    download = fetch._download
+    monkeypatch.setattr(fetch, "_download", truncated)
+    with pytest.raises(FetchError):
+        fetch_bytes(stub.url, retries=0)
+    assert breaker.state == "open"
+
+    monkeypatch.setattr(fetch, "_download", download)
+    stub.state.faults["error_rate"] = 0.0
+    time.sleep(0.25)
+    assert len(fetch_bytes(stub.url, retries=0)) > 0
+    assert breaker.state == "closed"
+
+
+def test_last_good_snapshot_survives_a_failing_export(stub):
+    good = fetch_csv(stub.url)
+    stub.state.faults["error_rate"] = 1.0
+    with pytest.raises(FetchError):
+        fetch_csv(stub.url)
+    snapshot, _ = load_snapshot(stub.url)
+    assert snapshot.equals(good)
@@ -0,0 +1,105 @@
+"""Incremental sheet loading (mobilise.ingest.IncrementalLoader) against full rebuilds."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from mobilise.analytics import period_over_period
+from mobilise.ingest import IncrementalLoader, dataset_fingerprint, prepare_data
+
+
+def sheet():
+    months = pd.date_range("2023-01-01", periods=18, freq="MS")
+    rows = []
+    for i, month in enumerate(months):
+        date = f"{month:%d/%m/%Y}"
+        rows += [
+            (date, 1, "Pillar 1", "Reach", "Total_Followers", 100.0 + 10 * i, ""),
+            (date, 3, "Pillar 3", "Volunteers", "Repeat_Volunteers", 20.0 + i, ""),
+            (date, 3, "Pillar 3", "Volunteers", "Repeat Volunteers", 50.0 - i, ""),
+            (date, 2, "Pillar 2", "Housing", "%_Can_Pay_Rent_Unaided_3mth", 40.0 + i % 5, "%"),
+        ]
+    return pd.DataFrame(rows, columns=["Date", "Pillar", "Pillar_Name", "Metric_Category", "Agg_Metric",
+                                       "Agg_Value", "Unit"])
+
+
+def append(raw):
+    extra = raw.tail(4).copy()
+    extra["Date"] = "01/07/2024"
+    return pd.concat([raw, extra], ignore_index=True)
+
+
+def edit(raw):
+    raw = raw.copy()
+    raw.loc[10, "Agg_Value"] = 999.0
+    return raw
+
+
+def remove(raw):
+    return raw.drop(index=[5, 22])
+
+
+def reorder(raw):
+    # Both spellings of Repeat Volunteers normalise to one metric, so which comes first in a month matters
+    order = np.arange(len(raw))
+    order[[1, 2]] = order[[2, 1]]
+    order[[41, 42]] = order[[42, 41]]
+    return raw.iloc[order]
+
+
+def shuffle(raw):
+    return raw.sample(frac=1.0, random_state=0)
+
+
+def new_code(raw):
+    extra = raw.tail(1).copy()
+    extra["Agg_Metric"] = "Volunteer_Hours"
+    return pd.concat([raw, extra], ignore_index=True)
+
+
+def taxonomy_change(raw):
+    # A second period of the rent metric, spelled differently, changes how the existing code normalises
+    extra = raw[raw["Pillar"] == 2].head(3).copy()
+    extra["Agg_Metric"] = "%_can_pay_rent_unaided_6mth"
+    return pd.concat([raw, extra], ignore_index=True)
+
+
+def drop_code(raw):
+    return raw[raw["Agg_Metric"] != "Repeat Volunteers"]
+
+
+CHANGES = [append, edit, remove, reorder, shuffle, new_code, taxonomy_change, drop_code]
+
+
+def assert_matches_full_rebuild(loader, raw):
+    expected = prepare_data(raw.reset_index(drop=True))
+    df = loader.load(raw)
+    pd.testing.assert_frame_equal(df, expected)
+    assert loader.fingerprint == dataset_fingerprint(expected)
+    pd.testing.assert_frame_equal(loader.period_over_period(), period_over_period(expected))
+
+
+@pytest.mark.parametrize("change", CHANGES, ids=lambda change: change.__name__)
+def test_load_matches_a_full_rebuild(change):
+    loader = IncrementalLoader()
+    raw = sheet()
+    assert_matches_full_rebuild(loader, raw)
+    assert_matches_full_rebuild(loader, change(raw))
+
+
+def test_successive_changes_match_a_full_rebuild():
+    loader = IncrementalLoader()
+    raw = sheet()
+    assert_matches_full_rebuild(loader, raw)
+    for change in CHANGES:
+        raw = change(raw).reset_index(drop=True)
+        assert_matches_full_rebuild(loader, raw)
+
+
+def test_reorder_is_reported_as_recomputed_months():
+    loader = IncrementalLoader()
+    raw = sheet()
+    loader.load(raw)
+    loader.period_over_period()
+    loader.load(reorder(raw))
+    assert loader.last_update["rows_added"] == loader.last_update["rows_removed"] == 0
+    assert len(loader.last_update["months"]) == 2
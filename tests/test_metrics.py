@@ -0,0 +1,36 @@
+"""Runtime metrics rendering and export (mobilise.metrics)."""
+import threading
+
+from mobilise.metrics import Metrics, write_metrics_file
+
+
+def test_render_counters_and_histograms():
+    metrics = Metrics()
+    metrics.inc("mobilise_data_loads_total", tenant="au", origin="sheet")
+    metrics.observe("mobilise_rerun_seconds", 0.03, tenant="au", page="Overview")
+    text = metrics.render()
+    assert 'mobilise_data_loads_total{origin="sheet",tenant="au"} 1' in text
+    assert 'mobilise_rerun_seconds_bucket{page="Overview",tenant="au",le="0.025"} 0' in text
+    assert 'mobilise_rerun_seconds_bucket{page="Overview",tenant="au",le="0.05"} 1' in text
+    assert 'mobilise_rerun_seconds_count{page="Overview",tenant="au"} 1' in text
+
+
+def test_concurrent_writes_never_fail(tmp_path):
+    path = tmp_path / "metrics.prom"
+    errors = []
+
+    def write(n):
+        for i in range(200):
+            try:
+                write_metrics_file(str(path), f"mobilise_test {n} {i}\n")
+            except OSError as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert path.read_text().startswith("mobilise_test ")
+    assert [p.name for p in tmp_path.iterdir()] == ["metrics.prom"]
@@ -0,0 +1,74 @@
+"""The optional SQL backend (mobilise.sql_backend) against the pandas filters it replaces."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from mobilise.data import Dataset
+from mobilise.ingest import prepare_data
+from mobilise.sql_backend import SQLBackend, available_engines
+
+ENGINES = [pytest.param(engine, marks=pytest.mark.skipif(engine not in available_engines(),
+                                                         reason=f"{engine} is not installed"))
+           for engine in ("duckdb", "sqlite")]
+
+RANGES = [
+    (pd.Timestamp("2023-01-01"), pd.Timestamp("2024-12-01")),
+    (pd.Timestamp("2023-04-01"), pd.Timestamp("2023-09-01")),
+    (pd.Timestamp("2025-01-01"), pd.Timestamp("2025-06-01")),
+]
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    metrics = [
+        (1, "Reach", "Total_Followers", ""),
+        (1, "Engagement", "Avg_Engagement_Rate", "%"),
+        (2, "Housing", "%_Still_In_Same_Property_3mth", "%"),
+        (2, "Housing", "%_Still_In_Same_Property_6mth", "%"),
+        (2, "Financial", "%_Can_Pay_Rent_Unaided_6mth", "%"),
+    ]
+    rows = []
+    for month in pd.date_range("2023-01-01", periods=18, freq="MS"):
+        for pillar, category, metric, unit in metrics:
+            for _ in range(rng.integers(1, 3)):
+                value = np.nan if rng.random() < 0.1 else round(rng.uniform(1, 100), 2)
+                rows.append((f"{month + pd.Timedelta(days=int(rng.integers(0, 27))):%d/%m/%Y}", pillar,
+                             f"Pillar {pillar}", category, metric, value, unit))
+    raw = pd.DataFrame(rows, columns=["Date", "Pillar", "Pillar_Name", "Metric_Category", "Agg_Metric",
+                                      "Agg_Value", "Unit"])
+    data = Dataset(prepare_data(raw))
+    assert data.df["Agg_Value"].isna().any() and (data.df["Period"] == "6mth").any()
+    return data
+
+
+@pytest.fixture(scope="module", params=ENGINES)
+def backend(request, data):
+    backend = SQLBackend(data.df, request.param)
+    yield backend
+    backend.close()
+
+
+@pytest.mark.parametrize("pillar", [1, 2])
+def test_pillar_domain_matches_pandas(data, backend, pillar):
+    assert backend.pillar_domain(pillar) == data.pillar_domain(pillar)
+
+
+@pytest.mark.parametrize("start, end", RANGES)
+@pytest.mark.parametrize("categories", [None, ["Housing"], ["Housing", "Reach"], []])
+@pytest.mark.parametrize("period", [None, "6mth"])
+def test_filter_frame_matches_pandas(data, backend, start, end, categories, period):
+    for pillar in (1, 2):
+        expected = data._filter(pillar, start, end, categories, period)
+        pd.testing.assert_frame_equal(backend.filter_frame(pillar, start, end, categories, period), expected)
+
+
+@pytest.mark.parametrize("start, end", RANGES)
+@pytest.mark.parametrize("categories", [None, ["Housing"], []])
+@pytest.mark.parametrize("how", ["mean", "sum"])
+def test_aggregate_matches_pandas(data, backend, start, end, categories, how):
+    for pillar in (1, 2):
+        rows = data._filter(pillar, start, end, categories, None)
+        expected = data.aggregate_metrics(rows, pillar, [start, end], categories, how=how)
+        result = backend.aggregate(pillar, start, end, categories, how=how)
+        pd.testing.assert_frame_equal(result, expected, check_exact=False)
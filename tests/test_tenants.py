@@ -0,0 +1,39 @@
+"""The per-tenant cache of derived structures (mobilise.tenants.TenantCache)."""
+import pandas as pd
+
+from mobilise.filter_cache import frame_bytes
+from mobilise.tenants import TenantCache
+
+
+def frame(rows):
+    return pd.DataFrame({"Agg_Value": range(rows)}, dtype=float)
+
+
+def test_peek_does_not_count_as_a_lookup():
+    cache = TenantCache(budget_bytes=2**20)
+    assert cache.peek("v1", "store") is None
+    assert cache.get_or_build("v1", "store", lambda: "built") == "built"
+    assert cache.peek("v1", "store") == "built"
+    assert cache.get_or_build("v1", "store", lambda: "rebuilt") == "built"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_least_recently_used_entries_are_evicted_past_the_budget():
+    size = frame_bytes(frame(1000))
+    cache = TenantCache(budget_bytes=2 * size)
+    cache.get_or_build("v1", "store", lambda: frame(1000))
+    cache.get_or_build("v2", "store", lambda: frame(1000))
+    cache.peek("v1", "store")
+    cache.get_or_build("v3", "store", lambda: (frame(500), {"rows": 500}))
+    assert cache.peek("v2", "store") is None
+    assert cache.peek("v1", "store") is not None and cache.peek("v3", "store") is not None
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["bytes"] <= stats["budget_bytes"]
+
+
+def test_entries_larger_than_the_budget_are_returned_but_not_kept():
+    cache = TenantCache(budget_bytes=1024)
+    assert len(cache.get_or_build("v1", "store", lambda: frame(1000))) == 1000
+    assert cache.peek("v1", "store") is None
+    assert cache.stats()["bytes"] == 0
@@ -0,0 +1,38 @@
+"""Incremental term index of pulse-survey responses (mobilise.text_index)."""
+import pandas as pd
+import pytest
+
+from mobilise.text_index import TermIndex
+
+JAN, FEB = pd.Timestamp("2024-01-01"), pd.Timestamp("2024-02-01")
+RESPONSES = [(JAN, "Housing costs are rising"), (JAN, "Housing support helped"), (FEB, "Rising rent")]
+
+
+def counts(index):
+    top = index.top_terms(JAN, FEB)
+    return dict(zip(top["Term"], top["Count"]))
+
+
+def test_only_new_responses_are_added():
+    index = TermIndex()
+    index.update(lambda: iter(RESPONSES[:2]), version=1)
+    index.update(lambda: iter(RESPONSES), version=2)
+    assert index.last_update == {"responses_added": 1, "rebuilt": False}
+    assert counts(index)["housing"] == 2 and counts(index)["rising"] == 2
+
+
+def test_failed_read_leaves_the_index_unchanged():
+    index = TermIndex()
+    index.update(lambda: iter(RESPONSES[:1]), version=1)
+
+    def failing():
+        yield from RESPONSES
+        raise OSError("file truncated")
+
+    with pytest.raises(OSError):
+        index.update(failing, version=2)
+    assert counts(index) == {"housing": 1, "costs": 1, "rising": 1}
+
+    index.update(lambda: iter(RESPONSES), version=2)
+    assert counts(index)["housing"] == 2 and counts(index)["rising"] == 2
+    assert index.top_terms(JAN, FEB)["Responses"].max() == 2
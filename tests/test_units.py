@@ -0,0 +1,83 @@
+"""Unit normalisation at load time (mobilise.units)."""
+import pandas as pd
+
+from mobilise.units import format_value, normalize_units
+
+
+def batch(rows):
+    return pd.DataFrame(rows, columns=["Agg_Metric", "Unit", "Agg_Value", "Metric_Kind"])
+
+
+def test_small_percentages_are_not_mistaken_for_fractions():
+    df = normalize_units(batch([
+        ("%_Conversion_Rate", "%", 0.4, "percentage"),
+        ("%_Conversion_Rate", "%", 0.25, "percentage"),
+    ]))
+    assert df["Agg_Value"].tolist() == [0.4, 0.25]
+    assert format_value(df["Agg_Value"].iloc[0], df["Display_Format"].iloc[0]) == "0.4%"
+
+
+def test_fractions_are_scaled_only_when_the_sheet_says_so():
+    df = normalize_units(batch([
+        ("%_Retention", "Fraction", 0.4, "percentage"),
+        ("%_Listed", "%", 0.5, "percentage"),
+        ("%_Other", "%", 0.5, "percentage"),
+    ]), fractions={"%_Listed"})
+    assert df["Agg_Value"].tolist() == [40.0, 50.0, 0.5]
+    assert df["Unit"].tolist() == ["%", "%", "%"]
+
+
+def test_units_and_text_values_are_normalised():
+    df = normalize_units(batch([
+        ("Total_Donations", "AUD", "$1,250", "total"),
+        ("Total_Volunteers", "Number", "1,234", "total"),
+        ("%_Stable_Housing", "Percent", "45%", "percentage"),
+        ("Total_Volunteers", "count", "n/a", "total"),
+    ]))
+    assert df["Unit"].tolist() == ["$", "count", "%", "count"]
+    assert df["Agg_Value"].iloc[:3].tolist() == [1250.0, 1234.0, 45.0]
+    assert df["Agg_Value"].isna().iloc[3]
+    assert format_value(df["Agg_Value"].iloc[1], df["Display_Format"].iloc[1]) == "1,234"
+
+
+def test_mixed_scale_metrics_read_values_of_at_most_one_as_fractions():
+    df = normalize_units(batch([
+        ("%_Still_In_Same_Property_6mth", "%", 0.82, "percentage"),
+        ("%_Still_In_Same_Property_6mth", "%", 82.0, "percentage"),
+        ("%_Conversion_Rate", "%", 0.82, "percentage"),
+    ]))
+    assert df["Agg_Value"].tolist() == [82.0, 82.0, 0.82]
+
+
+def housing_retention_card(values_3m, values_6m):
+    from streamlit.testing.v1 import AppTest
+
+    def script(values_3m, values_6m):
+        import pandas as pd
+
+        from mobilise.data import Dataset
+        from mobilise.ingest import prepare_data
+        from mobilise.pillars import pillar2
+
+        rows = [(f"01/{month:02d}/2024", 2, "Pillar 2", "Housing", f"%_Still_In_Same_Property_{period}", value, "%")
+                for period, values in (("3mth", values_3m), ("6mth", values_6m))
+                for month, value in enumerate(values, start=1)]
+        raw = pd.DataFrame(rows, columns=["Date", "Pillar", "Pillar_Name", "Metric_Category", "Agg_Metric",
+                                          "Agg_Value", "Unit"])
+        pillar2.render(Dataset(prepare_data(raw)))
+
+    at = AppTest.from_function(script, args=(values_3m, values_6m), default_timeout=60).run()
+    assert not at.exception, at.exception
+    return next(metric for metric in at.metric if metric.label == "Housing Retention (6m)")
+
+
+def test_housing_retention_card_shows_fractions_as_percentages():
+    card = housing_retention_card([0.7, 0.75], [0.8, 0.82])
+    assert card.value == "82%"
+    assert card.delta == "+7pp from 3m"
+
+
+def test_housing_retention_card_shows_percentages_unchanged():
+    card = housing_retention_card([70.0, 75.0], [80.0, 82.0])
+    assert card.value == "82%"
+    assert card.delta == "+7pp from 3m"
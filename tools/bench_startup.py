@@ -0,0 +1,81 @@
+"""Measure dashboard cold-start time and per-rerun script overhead.
+
+Runs the app headlessly with Streamlit's AppTest. Cold start is timed in a
+fresh interpreter per sample (first script run, including the app's own
+imports). Rerun overhead is timed per sidebar page in one warm process.
+
+    python tools/bench_startup.py --data-dir /path/with/data --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "streamlit_app.py")
+
+COLD_SNIPPET = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=300)
+start = time.perf_counter()
+at.run()
+print(json.dumps({{"seconds": time.perf_counter() - start, "modules": len(sys.modules),
+                  "errors": len(at.exception)}}))
+"""
+
+
+def cold_start(app, data_dir, repeat):
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", COLD_SNIPPET.format(root=ROOT, app=app)],
+            cwd=data_dir, capture_output=True, text=True, check=True,
+        )
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def rerun_overhead(app, data_dir, repeat):
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(data_dir)
+    sys.path.insert(0, ROOT)
+    at = AppTest.from_file(app, default_timeout=300)
+    at.run()
+    results = {}
+    for page in at.sidebar.radio[0].options:
+        at.sidebar.radio[0].set_value(page)
+        at.run()  # first visit imports and builds the page
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            at.run()
+            timings.append(time.perf_counter() - start)
+        results[page] = statistics.median(timings)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default=APP)
+    parser.add_argument("--data-dir", default=ROOT, help="working directory containing data/")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cold = cold_start(args.app, args.data_dir, args.repeat)
+    secs = [c["seconds"] for c in cold]
+    print(f"Cold start (first run, fresh process): median {statistics.median(secs):.3f}s "
+          f"min {min(secs):.3f}s max {max(secs):.3f}s, {cold[0]['modules']} modules loaded")
+
+    print("Warm rerun (median per page):")
+    for page, secs in rerun_overhead(args.app, args.data_dir, args.repeat).items():
+        print(f"  {secs * 1000:8.1f} ms  {page}")
+
+
+if __name__ == "__main__":
+    main()
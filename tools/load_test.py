@@ -0,0 +1,222 @@
+"""Load-test the dashboard with concurrent headless sessions.
+
+Serves the CSV export from a local stand-in for Google Sheets
+(tools/sheets_stub.py) and points the app at it, then runs N AppTest
+sessions at once in one process, the way one Streamlit server runs each
+viewer's script in its own thread with shared caches. Every session loads
+the app and then switches pages and changes sidebar filters at random. For
+each N it reports rerun latency percentiles, how many exports the "sheet"
+served and how much the process's resident memory grew. The report goes to
+stdout; Streamlit's own log lines go to stderr.
+
+    python tools/load_test.py --data-dir /path/with/data --sessions 1 4 16 --actions 20 2>/dev/null
+    python tools/load_test.py --data-dir /path/with/data --sessions 8 --delay 1 --error-rate 0.2 2>/dev/null
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from datetime import timedelta
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "streamlit_app.py")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_bytes():
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def share_apptest_runtime():
+    """Let AppTest sessions run side by side in threads.
+
+    AppTest installs a mock Runtime for the length of each run and removes it
+    afterwards, pulling it from under any other session still running; keep
+    the last one installed visible instead. Script compilation is serialised
+    too, as concurrent ``ast.parse`` calls can fail on Python 3.11.
+    """
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.scriptrunner import magic
+
+    installed = {}
+
+    def instance(cls):
+        if cls._instance is not None:
+            installed["runtime"] = cls._instance
+        elif "runtime" not in installed:
+            raise RuntimeError("Runtime hasn't been created!")
+        return installed["runtime"]
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or "runtime" in installed)
+
+    add_magic, lock = magic.add_magic, threading.Lock()
+
+    def locked_add_magic(code, script_path):
+        with lock:
+            return add_magic(code, script_path)
+
+    magic.add_magic = locked_add_magic
+
+
+def random_subset(rng, options):
+    return rng.sample(options, rng.randint(1, len(options)))
+
+
+def random_range(rng, domain):
+    """A random sub-range of the (start, end) dates a page's date input started with."""
+    start, end = domain
+    first = rng.randint(0, (end - start).days)
+    last = rng.randint(first, (end - start).days)
+    return start + timedelta(days=first), start + timedelta(days=last)
+
+
+def act(at, rng, domains):
+    """Apply one random page switch or filter change to a session; returns what it did."""
+    page = at.sidebar.radio[0].value
+    choices = ["page"]
+    if at.sidebar.date_input:
+        choices.append("dates")
+    if at.sidebar.multiselect:
+        choices.append("categories")
+    action = rng.choice(choices)
+    if action == "page":
+        at.sidebar.radio[0].set_value(rng.choice(at.sidebar.radio[0].options))
+    elif action == "dates":
+        widget = at.sidebar.date_input[0]
+        domain = domains.setdefault(page, tuple(widget.value))
+        widget.set_value(random_range(rng, domain))
+    else:
+        widget = rng.choice(list(at.sidebar.multiselect))
+        widget.set_value(random_subset(rng, list(widget.options)))
+    return action
+
+
+def run_session(app, actions, seed, start, results, lock):
+    """One viewer: load the app, then make `actions` random changes, timing every run."""
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    at = AppTest.from_file(app, default_timeout=300)
+    domains = {}
+    start.wait()
+    try:
+        began = time.perf_counter()
+        at.run()
+        with lock:
+            results["first"].append(time.perf_counter() - began)
+            results["errors"] += len(at.exception)
+        for _ in range(actions):
+            action = act(at, rng, domains)
+            began = time.perf_counter()
+            at.run()
+            with lock:
+                results["reruns"].append(time.perf_counter() - began)
+                results["actions"][action] = results["actions"].get(action, 0) + 1
+                results["errors"] += len(at.exception)
+    except Exception as exc:  # A timed-out or broken session still counts towards the report
+        with lock:
+            results["failed"].append(f"{type(exc).__name__}: {exc}")
+
+
+def run_level(app, sessions, actions, seed, stub, keep_caches):
+    """Run `sessions` concurrent sessions and summarise their latencies, fetches and memory."""
+    import streamlit as st
+    from mobilise import fetch
+    from mobilise.data import resolve_tenant, tenant_stats
+
+    if not keep_caches:
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        fetch._breakers.clear()
+
+    results = {"first": [], "reruns": [], "errors": 0, "failed": [], "actions": {}}
+    start, lock = threading.Barrier(sessions), threading.Lock()
+    threads = [threading.Thread(target=run_session, args=(app, actions, seed + i, start, results, lock))
+               for i in range(sessions)]
+    requests_before, rss_before = stub.state.requests, rss_bytes()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reruns = np.array(results["reruns"]) * 1000
+    p50, p95, p99 = np.percentile(reruns, [50, 95, 99]) if len(reruns) else (np.nan,) * 3
+    return {
+        "sessions": sessions,
+        "reruns": len(reruns),
+        "errors": results["errors"],
+        "failed_sessions": results["failed"],
+        "first_run_p50_ms": float(np.median(results["first"]) * 1000) if results["first"] else np.nan,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "wall_s": time.perf_counter() - began,
+        "fetches": stub.state.requests - requests_before,
+        "rss_mb": rss_bytes() / 2**20,
+        "rss_growth_mb": (rss_bytes() - rss_before) / 2**20,
+        "filter_cache": tenant_stats(resolve_tenant())["filter_cache"],
+        "actions": results["actions"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app", default=APP)
+    parser.add_argument("--data-dir", default=ROOT, help="working directory containing data/")
+    parser.add_argument("--csv", help="CSV served as the sheet export (default: data/demo_data.csv)")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="concurrent session counts to run, one level each")
+    parser.add_argument("--actions", type=int, default=10, help="page switches/filter changes per session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="stub response delay (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of stub responses that fail")
+    parser.add_argument("--keep-caches", action="store_true",
+                        help="carry caches over between levels instead of starting each one cold")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per level")
+    args = parser.parse_args()
+
+    os.chdir(args.data_dir)
+    os.environ["MOBILISE_EXPORT_BASE"] = f"http://127.0.0.1:{args.port}"  # Read when mobilise.fetch is imported
+    from sheets_stub import serve
+
+    share_apptest_runtime()
+    stub = serve(args.csv or os.path.join("data", "demo_data.csv"), port=args.port,
+                 delay=args.delay, error_rate=args.error_rate)
+    try:
+        if not args.json:
+            print(f"{'sessions':>8} {'reruns':>6} {'errors':>6} {'first ms':>10} {'p50 ms':>8} {'p95 ms':>8} "
+                  f"{'p99 ms':>8} {'fetches':>7} {'rss MB':>7} {'+rss MB':>7} {'cache hit':>9}")
+        for sessions in args.sessions:
+            level = run_level(args.app, sessions, args.actions, args.seed, stub, args.keep_caches)
+            if args.json:
+                print(json.dumps(level))
+                continue
+            hit_rate = level["filter_cache"]["hit_rate"]
+            print(f"{level['sessions']:>8} {level['reruns']:>6} {level['errors']:>6} "
+                  f"{level['first_run_p50_ms']:>10.0f} {level['p50_ms']:>8.0f} {level['p95_ms']:>8.0f} "
+                  f"{level['p99_ms']:>8.0f} {level['fetches']:>7} {level['rss_mb']:>7.0f} "
+                  f"{level['rss_growth_mb']:>+7.1f} {'-' if hit_rate is None else f'{hit_rate:.0%}':>9}")
+            for failure in level["failed_sessions"]:
+                print(f"{'':>8} session failed: {failure}")
+    finally:
+        stub.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Local stand-in for the Google Sheets CSV export, with injectable faults.
+
+Serves a CSV file at any ``/spreadsheets/d/<id>/export`` path. Delays, error
+rates, hangs and slow (drip-fed) bodies can be set on the command line or
+changed while running through ``/_control``, and ``/_stats`` reports how
+many export requests arrived.
+
+    python tools/sheets_stub.py --csv data/demo_data.csv --port 8765 --delay 2 --error-rate 0.3
+    MOBILISE_EXPORT_BASE=http://127.0.0.1:8765 streamlit run streamlit_app.py
+    curl 'http://127.0.0.1:8765/_control?error_rate=1'   # take the "sheet" down
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FAULTS = {
+    "delay": 0.0,  # Seconds before the response starts
+    "error_rate": 0.0,  # Share of requests answered with `error_status`
+    "error_status": 500,
+    "hang": False,  # Accept the connection and never answer
+    "drip": 0.0,  # Seconds between 1 KB chunks of the body
+}
+
+
+class StubState:
+    def __init__(self, csv_path, faults):
+        self.csv_path = csv_path
+        self.faults = dict(faults)
+        self.requests = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def body(self):
+        with open(self.csv_path, "rb") as f:
+            return f.read()
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass  # Keep load tests quiet
+
+        def _send(self, status, body, content_type="text/plain"):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urllib.parse.urlsplit(self.path)
+            query = dict(urllib.parse.parse_qsl(url.query))
+            if url.path == "/_control":
+                with state.lock:
+                    for key, value in query.items():
+                        if key == "hang":
+                            state.faults[key] = value.lower() in ("1", "true")
+                        elif key in FAULTS:
+                            state.faults[key] = type(FAULTS[key])(value)
+                    faults = dict(state.faults)
+                return self._send(200, json.dumps(faults).encode(), "application/json")
+            if url.path == "/_stats":
+                stats = {"requests": state.requests, "errors": state.errors, "faults": state.faults}
+                return self._send(200, json.dumps(stats).encode(), "application/json")
+            if not (url.path.startswith("/spreadsheets/d/") and url.path.endswith("/export")):
+                return self._send(404, b"not found")
+
+            with state.lock:
+                state.requests += 1
+                faults = dict(state.faults)
+                failing = random.random() < faults["error_rate"]
+                state.errors += failing
+            if faults["hang"]:
+                time.sleep(3600)
+                return
+            time.sleep(faults["delay"])
+            if failing:
+                return self._send(faults["error_status"], b"injected failure")
+
+            body = state.body()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/csv")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            try:
+                for start in range(0, len(body), 1024):
+                    self.wfile.write(body[start:start + 1024])
+                    if faults["drip"]:
+                        time.sleep(faults["drip"])
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # The client gave up (its deadline passed)
+
+    return Handler
+
+
+def serve(csv_path, host="127.0.0.1", port=8765, **faults):
+    """Start the stub in a background thread; returns the server (call `.shutdown()`)."""
+    state = StubState(csv_path, {**FAULTS, **faults})
+    server = ThreadingHTTPServer((host, port), make_handler(state))
+    server.daemon_threads = True
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default="data/demo_data.csv", help="CSV served as the sheet export")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--hang", action="store_true")
+    parser.add_argument("--drip", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = serve(args.csv, args.host, args.port, delay=args.delay, error_rate=args.error_rate,
+                   error_status=args.error_status, hang=args.hang, drip=args.drip)
+    print(f"Serving {args.csv} at http://{args.host}:{args.port}/spreadsheets/d/<id>/export")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()